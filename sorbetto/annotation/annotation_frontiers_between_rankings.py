@@ -1,7 +1,9 @@
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
+import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 
 from sorbetto.annotation.abstract_annotation import AbstractAnnotation
@@ -16,18 +18,52 @@ if TYPE_CHECKING:
 
 
 class AnnotationFrontiersBetweenRankings(AbstractAnnotation):
+    """
+    This type of annotation draws, on a Tile with the default parameterization, the
+    frontiers where performances are swapped in the rankings, that is, the curves on
+    which two performances are equivalent.
+
+    By default, the frontiers between all the rankings are drawn. When `ranks` is
+    given, only the parts of the frontiers where the performance at one of these
+    ranks changes are drawn, that is, the boundaries of the corresponding entity
+    Tiles. For example, `ranks=[1]` draws the boundaries between the regions of the
+    Tile where the best performance differs.
+    """
+
     def __init__(
-        self, performnances: FiniteSetOfTwoClassClassificationPerformances, name=None
+        self,
+        performnances: FiniteSetOfTwoClassClassificationPerformances,
+        name=None,
+        ranks=None,
     ):
+        """
+        Args:
+            performnances (FiniteSetOfTwoClassClassificationPerformances): The
+                performances.
+            name (_type_, optional): Name of the annotation. Defaults to None.
+            ranks (list[int] | None, optional): The ranks (1 for the best
+                performance) whose frontiers are drawn. Defaults to None, for the
+                frontiers between all the rankings.
+        """
         assert isinstance(performnances, FiniteSetOfTwoClassClassificationPerformances)
         self._performances = performnances
-        if len(performnances) >= 15:
-            message = "{} froentiers are going to be computed. That's a lot!".format(
-                len(performnances)
-            )
+        if ranks is not None:
+            ranks = tuple(sorted(set(ranks)))
+            assert len(ranks) > 0
+            assert all(isinstance(rank, int) and rank >= 1 for rank in ranks)
+        self._ranks = ranks
+        if ranks is None and len(performnances) >= 15:
+            message = (
+                "The frontiers between {} performances are going to be computed. "
+                "That's a lot! Consider drawing only the frontiers of some ranks."
+            ).format(len(performnances))
             logging.warning(message)
         super().__init__(name)
 
+    @property
+    def ranks(self) -> tuple[int, ...] | None:
+        return self._ranks
+
     def draw(self, tile: "Tile", fig: Figure, ax: Axes) -> None:
         from sorbetto.tile.tile import Tile
 
@@ -39,15 +75,89 @@ class AnnotationFrontiersBetweenRankings(AbstractAnnotation):
         if isinstance(tile.parameterization, ParameterizationDefault):
             # TDOO: RankingScore.equivalent is only for the default parameterization
             extent = tile.parameterization.getExtent()
-            performances = self._performances
-            for i, p1 in enumerate(performances):
-                for j, p2 in enumerate(performances):
-                    if i < j:
-                        curve = RankingScore.equivalent(p1, p2)
-                        curve.draw(fig, ax, extent, **plt_kwargs)
+            if self._ranks is None:
+                curves, _ = self._getCurves(np.arange(len(self._performances)))
+                curves.draw(fig, ax, extent, **plt_kwargs)
+            else:
+                segments = self._getSegmentsForRanks(extent)
+                ax.add_collection(LineCollection(list(segments), **plt_kwargs))
+                ax.autoscale_view()
         else:
             message = (
                 "AnnotationFrontiersBetweenRankings only works for ParameterizationDefault in this version.\n"
                 "See RankingScore.equivalent for more information about this limitation."
             )
             logging.warning(message)
+
+    def _getCurves(self, candidates: np.ndarray):
+        """
+        Computes the curves on which two of the candidate performances are equivalent.
+
+        Args:
+            candidates (np.ndarray): The indices of the candidate performances.
+
+        Returns:
+            tuple[BilinearCurveCollection, np.ndarray]: The curves, and the indices of
+            the pairs of performances, of shape (M, 2).
+        """
+        performances = self._performances
+        # When a performance dominates another one, they are never swapped, so
+        # there is no frontier between them inside the Tile.
+        dominance = performances.getDominanceMatrix(indices=candidates)
+        i, j = np.triu_indices(len(candidates), k=1)
+        swapped = ~(dominance[i, j] | dominance[j, i])
+        i, j = candidates[i], candidates[j]
+        pairs = np.stack([i[swapped], j[swapped]], axis=-1)
+        return RankingScore.equivalentPairwise(performances, pairs), pairs
+
+    def _getSegmentsForRanks(self, extent) -> np.ndarray:
+        """
+        Samples the parts of the frontiers where the performance at one of the ranks
+        of interest changes.
+
+        Args:
+            extent (_type_): the axis-aligned box :math:`(x_{min}, x_{max}, y_{min}, y_{max})`
+
+        Returns:
+            np.ndarray: The polylines, of shape (L, P, 2), where the points that are
+            not drawn are NaN.
+        """
+        assert self._ranks is not None
+        performances = self._performances
+
+        # A performance that is dominated by at least `max_rank` others is always
+        # ranked after `max_rank`, so it never takes part in the frontiers of interest,
+        # nor in the count of the performances that are better than those involved.
+        max_rank = max(self._ranks)
+        candidates = performances.getCandidatesForTopK(max_rank + 1)
+        curves, pairs = self._getCurves(candidates)
+        segments, indices = cast(
+            tuple[np.ndarray, np.ndarray],
+            curves.getSegments(extent, return_indices=True),
+        )
+        i, j = pairs[indices, 0, np.newaxis], pairs[indices, 1, np.newaxis]
+
+        # With the default parameterization, the satisfying and unsatisfying parts of
+        # the ranking scores are ptn + a (ptp-ptn) and pfp + b (pfn-pfp).
+        a, b = segments[:, :, 0], segments[:, :, 1]
+        ptn, pfp, pfn, ptp = performances.to_array().T
+
+        def score(k):
+            satisfying = ptn[k] + a * (ptp[k] - ptn[k])
+            unsatisfying = pfp[k] + b * (pfn[k] - pfp[k])
+            return satisfying / (satisfying + unsatisfying)
+
+        # On the frontier between i and j, both are at ranks m+1 and m+2, where m is
+        # the number of performances that are strictly better.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = score(i)
+            num_better = np.zeros(segments.shape[:2], dtype=np.intp)
+            for k in candidates:
+                num_better += (score(k) > value) & (i != k) & (j != k)
+
+        kept = np.zeros(segments.shape[:2], dtype=bool)
+        for rank in self._ranks:
+            kept |= (num_better == rank - 1) | (num_better == rank - 2)
+        kept &= ~np.isnan(a)
+        segments[~kept] = np.nan
+        return segments[np.any(kept, axis=1)]
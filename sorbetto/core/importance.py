@@ -80,7 +80,7 @@ class Importance:
 
 # TODO get even better typing there (output as tuple of single type, based on inputs)
 def _parse_importance(
-    importance: Importance | list[Importance] | np.ndarray | None = None,
+    importance: Importance | list[Importance] | np.ndarray | tuple | None = None,
     itn: float | int | np.ndarray | None = None,
     ifp: float | int | np.ndarray | None = None,
     ifn: float | int | np.ndarray | None = None,
@@ -102,6 +102,8 @@ def _parse_importance(
         ifp_ = importance[..., 1]
         ifn_ = importance[..., 2]
         itp_ = importance[..., 3]
+    elif isinstance(importance, tuple):  # already split, e.g. by _prepareImportance
+        itn_, ifp_, ifn_, itp_ = importance
     elif isinstance(importance, list):
         itn_ = np.array([imp.itn for imp in importance])
         ifp_ = np.array([imp.ifp for imp in importance])
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from sorbetto.core.importance import Importance
 
@@ -12,10 +13,16 @@ class AbstractFlavor(ABC):
     importance values.
     """
 
-    def __init__(self, name: str = "Unnamed Flavor", colormap: Any = None):
+    def __init__(
+        self,
+        name: str = "Unnamed Flavor",
+        colormap: Any = None,
+        dtype: DTypeLike | None = None,
+    ):
         assert isinstance(name, str)
         self._name = name
         self._colormap = colormap
+        self._dtype = dtype
         ABC.__init__(self)
 
     @property
@@ -28,6 +35,48 @@ class AbstractFlavor(ABC):
     def colormap(self, colormap: Any) -> None:
         self._colormap = colormap
 
+    @property
+    def dtype(self) -> DTypeLike | None:
+        """
+        The floating point type in which the values of the ranking scores are
+        computed, e.g. np.float32 to halve the memory traffic when the flavor is only
+        displayed. None means float64.
+        """
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype: DTypeLike | None) -> None:
+        self._dtype = dtype
+
+    @property
+    def version(self) -> int:
+        """
+        A counter that changes when the values of the flavor may have changed, e.g.
+        when performances are added to the set on which it depends. Tiles compare it
+        to the one of their cached values. It is 0 for flavors that can not change.
+        """
+        return 0
+
+    def getCacheKey(self) -> Any:
+        """
+        Gives everything, besides its type and floating point type, the values of the
+        flavor depend on, so that Tiles can cache them (see `TileCache`). Flavors
+        whose values can be cached override this method.
+
+        Returns:
+            Any: A tuple of None, booleans, integers, floats, strings, and NumPy
+            arrays, or None if the values can not be cached.
+        """
+        return None
+
+    def prepare(self) -> None:
+        """
+        Computes the state that the flavor would otherwise fill lazily when it is
+        called, e.g. values that only depend on the performances. Tiles call it
+        before evaluating the flavor concurrently, so that the threads only read
+        this state. Flavors with such a state override this method.
+        """
+
     @abstractmethod
     def __call__(self, importance: Importance | np.ndarray) -> Any:
         """Computes the value of the flavor for the given importance value(s).
@@ -36,7 +85,9 @@ class AbstractFlavor(ABC):
         Args:
             importance (Importance | np.ndarray): The importance value(s). Either a
                 single Importance object or a numpy array of shape (..., 4), in which
-                case the last dimension corresponds to (itn, ifp, ifn, itp).
+                case the last dimension corresponds to (itn, ifp, ifn, itp). Tiles
+                may also give the tuple (itn, ifp, ifn, itp) of arrays that broadcast
+                together (see `RankingScore._prepareImportance`).
 
 
         Returns:
@@ -43,14 +43,48 @@ class BestFlavor(AbstractNumericFlavor):
     def performances(self) -> FiniteSetOfTwoClassClassificationPerformances:
         return self._performances
 
+    @property
+    def version(self) -> int:
+        return self._performances.version
+
+    def getCacheKey(self) -> Any:
+        return (self._performances.to_array(),)
+
+    def prepare(self) -> None:
+        self._performances.getCandidatesForTopK(1)
+
     def __call__(
         self,
         importance: Importance | np.ndarray,
     ) -> float | np.ndarray:
-        values = RankingScore._compute(
-            importance=importance, performance=self._performances
+        # The performances that are dominated by another one for all importances do
+        # not change the best value, so they are not evaluated.
+        return self.getValueAmong(
+            importance, self._performances.getCandidatesForTopK(1)
         )
 
+    def getValueAmong(
+        self, importance: Importance | np.ndarray, indices: np.ndarray
+    ) -> np.ndarray:
+        """Computes the best value among some of the performances only.
+
+        As the best value of a union is the best of the best values of its parts,
+        this allows to update the values computed before some performances were
+        appended, without evaluating the other ones again.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+            indices (np.ndarray): The indices of the performances to consider.
+
+        Returns:
+            np.ndarray: The best values.
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        values = RankingScore._compute(
+            importance=importance,
+            performance=self._performances.to_array()[indices],
+            dtype=self.dtype,
+        )
         return np.max(values, axis=0)
 
     def getDefaultColormap(self):
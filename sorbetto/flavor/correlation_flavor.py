@@ -2,8 +2,6 @@ import logging
 from typing import Any, Callable, Literal
 
 import numpy as np
-from scipy import stats
-from tqdm import tqdm
 
 from sorbetto.core.importance import Importance
 from sorbetto.flavor.abstract_numeric_flavor import AbstractNumericFlavor
@@ -45,11 +43,21 @@ class CorrelationFlavor(AbstractNumericFlavor):
         self._performances = performances
         self._score = score
         self._correlation_coefficient = correlation_coefficient
+        # The score X does not depend on the importance, so it is computed at the
+        # first call and reused afterwards, as is its form prepared for the
+        # correlation coefficient.
+        self._x_scores: np.ndarray | None = None
+        self._x_scores_version = 0
+        self._prepared_x_scores: np.ndarray | None = None
 
     @property
     def performances(self) -> FiniteSetOfTwoClassClassificationPerformances:
         return self._performances
 
+    @property
+    def version(self) -> int:
+        return self._performances.version
+
     @property
     def score(
         self,
@@ -66,47 +74,125 @@ class CorrelationFlavor(AbstractNumericFlavor):
     def correlation_coefficient(self) -> str:
         return self._correlation_coefficient
 
-    def __call__(
-        self,
-        importance: Importance | np.ndarray,
-    ):
+    @property
+    def x_scores(self) -> np.ndarray:
+        """
+        The values of the score :math:`X` for all performances, of shape (N,). They
+        are computed once, at the first access, and only for the new performances
+        when some are appended to the set.
+        """
+        performances = self._performances
+        if self._x_scores is not None:
+            if self._x_scores_version == performances.version:
+                return self._x_scores
+            appended = performances.getIndicesAppendedSince(self._x_scores_version)
+        else:
+            appended = None
+
+        if appended is None:
+            self._x_scores = self._computeXScores(performances)
+        else:
+            new_performances = FiniteSetOfTwoClassClassificationPerformances(
+                [performances[int(index)] for index in appended]
+            )
+            self._x_scores = np.concatenate(
+                [self._x_scores, self._computeXScores(new_performances)]
+            )
+        self._x_scores_version = performances.version
+        self._prepared_x_scores = None
+        return self._x_scores
+
+    def _computeXScores(
+        self, performances: FiniteSetOfTwoClassClassificationPerformances
+    ) -> np.ndarray:
+        """
+        Computes the values of the score :math:`X` for some performances, at once if
+        the score is vectorized, or one performance at a time otherwise.
+
+        Args:
+            performances (FiniteSetOfTwoClassClassificationPerformances): The
+                performances.
+
+        Returns:
+            np.ndarray: The values, of shape (N,).
+        """
         try:  # try if X is vectorized
-            x_scores: list | np.ndarray = self._score(self._performances)
+            x_scores: list | np.ndarray = self._score(performances)
         except Exception as e:  # else fallback to loop
             logging.warning(
                 "The score given to the Correlation Flavor is not vectorized. "
                 "Continuing with sequential loop.\n"
                 f"Got : {e!r}.\n"
             )
-            x_scores = [self._score(p) for p in self._performances]
+            x_scores = [self._score(p) for p in performances]
+        return np.asarray(x_scores, dtype=float).reshape(-1)
+
+    def _getPreparedXScores(self) -> np.ndarray:
+        """
+        Returns the part of the correlation coefficient that only depends on the
+        score :math:`X`, computed once per version of the performances: the
+        standardized values of :math:`X` for Pearson's r, the standardized ranks of
+        :math:`X` for Spearman's rho, and the dense ranks of :math:`X` for Kendall's
+        tau.
 
+        Raises:
+            ValueError: If the correlation coefficient is unknown.
+
+        Returns:
+            np.ndarray: The prepared values, of shape (N,).
+        """
+        x_scores = self.x_scores  # resets the prepared values if they are outdated
+        if self._prepared_x_scores is None:
+            if self._correlation_coefficient == "pearson_r":
+                prepared = _standardize(x_scores)
+            elif self._correlation_coefficient == "spearman_rho":
+                from scipy import stats
+
+                prepared = _standardize(stats.rankdata(x_scores))
+            elif self._correlation_coefficient == "kendall_tau":
+                prepared = np.unique(x_scores, return_inverse=True)[1].astype(float)
+                prepared[np.isnan(x_scores)] = np.nan
+            else:
+                raise ValueError(
+                    f"Unknown correlation coefficient: {self._correlation_coefficient}. "
+                    "Available options are 'pearson_r' and 'spearman_rho' and 'kendall_tau'."
+                )
+            self._prepared_x_scores = prepared
+        return self._prepared_x_scores
+
+    def getCacheKey(self) -> Any:
+        # The score X may be any function, but the values only depend on the values
+        # it takes for the performances.
+        return (
+            self._performances.to_array(),
+            self.x_scores,
+            self._correlation_coefficient,
+        )
+
+    def prepare(self) -> None:
+        self._getPreparedXScores()
+
+    def __call__(
+        self,
+        importance: Importance | np.ndarray,
+    ):
+        prepared_x_scores = self._getPreparedXScores()
+        importance = RankingScore._prepareImportance(importance, self.dtype)
         value_scores = RankingScore._compute(
-            importance=importance, performance=self._performances
+            importance=importance, performance=self._performances, dtype=self.dtype
         )
 
-        correlation = np.empty((value_scores.shape[1], value_scores.shape[2]))
+        # The correlation coefficients are computed at once for all importances,
+        # along the first axis (the one of the performances).
+        value_scores = np.asarray(value_scores)
         if self._correlation_coefficient == "pearson_r":
-
-            def corr_func(x, y):
-                return stats.pearsonr(x, y).correlation  # type:ignore
+            return _pearson_r(prepared_x_scores, value_scores)
         elif self._correlation_coefficient == "spearman_rho":
+            from scipy import stats
 
-            def corr_func(x, y):
-                return stats.spearmanr(x, y).correlation  # type:ignore
-        elif self._correlation_coefficient == "kendall_tau":
-
-            def corr_func(x, y):
-                return stats.kendalltau(x, y).correlation  # type:ignore
+            return _pearson_r(prepared_x_scores, stats.rankdata(value_scores, axis=0))
         else:
-            raise ValueError(
-                f"Unknown correlation coefficient: {self._correlation_coefficient}. "
-                "Available options are 'pearson_r' and 'spearman_rho' and 'kendall_tau'."
-            )
-
-        for x in tqdm(range(value_scores.shape[1])):
-            for y in range(value_scores.shape[2]):
-                correlation[x, y] = corr_func(x_scores, value_scores[:, x, y])
-        return correlation
+            return _kendall_tau(prepared_x_scores, value_scores)
 
     def getDefaultColormap(self):
         return "gist_rainbow"
@@ -116,3 +202,136 @@ class CorrelationFlavor(AbstractNumericFlavor):
 
     def getUpperBound(self):
         return 1.0
+
+
+def _standardize(x: np.ndarray) -> np.ndarray:
+    """
+    Centers `x` and scales it to a unit norm.
+
+    Args:
+        x (np.ndarray): The values, of shape (N,).
+
+    Returns:
+        np.ndarray: The standardized values, of shape (N,). They are NaN if `x` is
+        constant.
+    """
+    x_centered = x - np.mean(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return x_centered / np.sqrt(np.dot(x_centered, x_centered))
+
+
+def _pearson_r(x_standardized: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Computes Pearson's r between a standardized variable and each column of `y`,
+    using centered dot products. As `x_standardized` is centered, `y` does not need
+    to be centered in the numerator.
+
+    Args:
+        x_standardized (np.ndarray): The standardized values of the first variable,
+            of shape (N,), as returned by :func:`_standardize`.
+        y (np.ndarray): The values of the second variable, of shape (N, ...).
+
+    Returns:
+        np.ndarray: The correlation coefficients, of shape (...). They are NaN where
+        one of the variables is constant.
+    """
+    num = np.tensordot(x_standardized, y, axes=1)
+    y_centered = y - np.mean(y, axis=0)
+    den = np.sqrt(np.sum(y_centered * y_centered, axis=0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.clip(num / den, -1.0, 1.0)
+
+
+def _kendall_tau(ranks_x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Computes Kendall's tau-b between a variable and each column of `y`, in
+    :math:`O(N \\log^2 N)` operations per column with Knight's algorithm: once the
+    performances are sorted by x and then by y, the discordant pairs are the
+    inversions of y, counted by a merge sort done for all columns at once.
+
+    Args:
+        ranks_x (np.ndarray): The dense ranks of the first variable, of shape (N,),
+            NaN where it is NaN.
+        y (np.ndarray): The values of the second variable, of shape (N, ...).
+
+    Returns:
+        np.ndarray: The correlation coefficients, of shape (...). They are NaN where
+        one of the variables is constant or NaN.
+    """
+    n = y.shape[0]
+    shape = y.shape[1:]
+    y = y.reshape(n, -1)
+    undefined = np.any(np.isnan(y), axis=0) | np.any(np.isnan(ranks_x))
+    ranks_x = np.where(np.isnan(ranks_x), 0.0, ranks_x)
+    y = np.where(np.isnan(y), 0.0, y)
+
+    # The performances sorted by x, and then by y.
+    ranks_x = np.broadcast_to(ranks_x[:, np.newaxis], y.shape)
+    order = np.lexsort((y, ranks_x), axis=0)
+    sorted_y = np.take_along_axis(y, order, axis=0)
+    sorted_x = np.take_along_axis(ranks_x, order, axis=0)
+    same_x = sorted_x[1:] == sorted_x[:-1]
+    num_ties_x = _count_tied_pairs(same_x)
+    num_ties_xy = _count_tied_pairs(same_x & (sorted_y[1:] == sorted_y[:-1]))
+    num_discordant = _count_inversions(sorted_y)
+    sorted_y.sort(axis=0)
+    num_ties_y = _count_tied_pairs(sorted_y[1:] == sorted_y[:-1])
+
+    num_pairs = n * (n - 1) // 2
+    concordance = num_pairs - num_ties_x - num_ties_y + num_ties_xy - 2 * num_discordant
+    with np.errstate(divide="ignore", invalid="ignore"):
+        den = np.sqrt((num_pairs - num_ties_x) * (num_pairs - num_ties_y))
+        tau = np.clip(concordance / den, -1.0, 1.0)
+    tau[undefined] = np.nan
+    return tau.reshape(shape)
+
+
+def _count_tied_pairs(same: np.ndarray) -> np.ndarray:
+    """
+    Counts the pairs of tied values in sorted columns.
+
+    Args:
+        same (np.ndarray): Whether each value is equal to the previous one in its
+            column, of shape (N - 1, M).
+
+    Returns:
+        np.ndarray: The numbers of tied pairs, of shape (M,).
+    """
+    # Each value is tied with all the previous ones of its run of equal values.
+    index = np.arange(1, same.shape[0] + 1)[:, np.newaxis]
+    start = np.maximum.accumulate(np.where(same, 0, index), axis=0)
+    return np.sum(index - start, axis=0)
+
+
+def _count_inversions(y: np.ndarray) -> np.ndarray:
+    """
+    Counts the pairs of values of each column that are in decreasing order, with a
+    bottom-up merge sort done for all columns at once.
+
+    Args:
+        y (np.ndarray): The values, of shape (N, M), without NaN.
+
+    Returns:
+        np.ndarray: The numbers of inversions, of shape (M,).
+    """
+    n, m = y.shape
+    size = 1 << max(n - 1, 0).bit_length()
+    # The padding values come last, after equal or smaller values.
+    runs = np.full((size, m), np.inf, dtype=y.dtype)
+    runs[:n] = y
+    num_inversions = np.zeros(m, dtype=np.int64)
+    width = 1
+    while width < size:
+        # Each block is made of two sorted runs, merged by a stable sort.
+        blocks = runs.reshape(size // (2 * width), 2 * width, m)
+        order = np.argsort(blocks, axis=1, kind="stable")
+        # Each value of the second run is smaller than the values of the first one
+        # that are not merged before it.
+        from_first = order < width
+        num_first_before = np.cumsum(from_first, axis=1)
+        num_inversions += np.sum(
+            np.where(from_first, 0, width - num_first_before), axis=(0, 1)
+        )
+        runs = np.take_along_axis(blocks, order, axis=1).reshape(size, m)
+        width *= 2
+    return num_inversions
@@ -1,6 +1,5 @@
 from typing import Any
 
-import matplotlib.colors
 import numpy as np
 
 from sorbetto.core.entity import Entity
@@ -18,6 +17,12 @@ class EntityFlavor(AbstractSymbolicFlavor[Entity]):
     gives, to any Importance :math:`I`  (that is, some application-specific preferences), the
     entity ranked :math:`r`-th according to the ordering of performances induced by the
     Ranking Score :math:`R_I` corresponding to the importance :math:`I`.
+
+    The entities are ranked by decreasing value of the Ranking Score, the ones for
+    which it is undefined (NaN) coming last. Equivalent entities are ranked in the
+    order of the performances, so that the lowest index wins. All the methods follow
+    this rule, e.g. the entity ranked :math:`r`-th is always the :math:`r`-th one
+    given by `getAllEntities`.
     """
 
     def __init__(
@@ -33,6 +38,11 @@ class EntityFlavor(AbstractSymbolicFlavor[Entity]):
         self._entity_set = set(entity_list)
         self._nb_entities = len(entity_list)
         self._performances: FiniteSetOfTwoClassClassificationPerformances | None = None
+        # The entities in the order of the performances, and the mapped entities
+        # (see `mapper`) corresponding to the performances, when they differ from
+        # their indices + 1 because entities were added.
+        self._entities: list[Entity] = list()
+        self._mapped_indices: np.ndarray | None = None
 
     @property
     def rank(self) -> int:
@@ -49,26 +59,265 @@ class EntityFlavor(AbstractSymbolicFlavor[Entity]):
     @property
     def performances(self) -> FiniteSetOfTwoClassClassificationPerformances:
         if self._performances is None:
+            self._entities = list(self._getSortedCodomain())
             self._performances = FiniteSetOfTwoClassClassificationPerformances(
-                [e.performance for e in self._getSortedCodomain()]
+                [e.performance for e in self._entities]
             )
 
         return self._performances
 
+    @property
+    def version(self) -> int:
+        if self._performances is None:
+            return 0
+        return self._performances.version
+
+    def addEntity(self, entity: Entity) -> None:
+        """Adds an entity to the ranked ones.
+
+        Its performance is appended to the performances, so that the Tiles based on
+        this flavor only compare the new entity to the ones that were ranked before,
+        instead of ranking all entities again. The mapping of the entities (see
+        `mapper`) and the default colormap are updated accordingly.
+
+        Args:
+            entity (Entity): The new entity.
+
+        Raises:
+            ValueError: If the entity is already ranked.
+        """
+        if entity in self._entity_set:
+            raise ValueError(f"The entity {entity.name} is already ranked.")
+        performances = self.performances
+        self._entity_set.add(entity)
+        self._nb_entities += 1
+        self._entities.append(entity)
+        self._sorted_codomain = None
+        performances.append(entity.performance)
+
+        positions = {e: i for i, e in enumerate(self._getSortedCodomain())}
+        self._mapped_indices = np.array([positions[e] + 1 for e in self._entities])
+
+    def getCacheKey(self) -> Any:
+        # The values are the mapped entities, so the mapping is part of the key.
+        performances = self.performances
+        mapped = self._map(np.arange(len(performances)))
+        return (self._rank, performances.to_array(), mapped)
+
+    def prepare(self) -> None:
+        performances = self.performances
+        self._getSortedCodomain()
+        # The candidates for the rank of this flavor.
+        if self._rank == len(performances):
+            performances.getCandidatesForBottomK(1)
+        else:
+            performances.getCandidatesForTopK(self._rank)
+
+    def _map(self, indices: np.ndarray) -> np.ndarray:
+        """Maps the indices of some performances to the corresponding entities.
+
+        Args:
+            indices (np.ndarray): Indices in the performances.
+
+        Returns:
+            np.ndarray: The mapped entities (see `mapper`).
+        """
+        if self._mapped_indices is None:
+            # performances[i] corresponds to entity self.reverse_mapper(i+1)
+            return indices + 1
+        return self._mapped_indices[indices]
+
     def __call__(
         self,
         importance: Importance | np.ndarray,
     ) -> float | np.ndarray:
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        # The entities that are dominated, for all importances, by too many other
+        # ones to be ranked r-th are not evaluated.
+        performances = self.performances
+        if self._rank == len(performances):
+            candidates = performances.getCandidatesForBottomK(1)
+            return self._map(self._streamBest(importance, candidates, last=True))
+        candidates = performances.getCandidatesForTopK(self._rank)
+        if self._rank == 1:
+            return self._map(self._streamBest(importance, candidates, last=False))
+
+        values = RankingScore._compute(
+            importance=importance,
+            performance=performances.to_array()[candidates],
+            dtype=self.dtype,
+        )
+        # A selection is enough to find the entity ranked r-th, no need to sort.
+        _to_sort_key(values)
+        selected, _ = _select(values, self._rank)
+        return self._map(candidates[selected])
+
+    def getAllEntities(self, importance: Importance | np.ndarray) -> np.ndarray:
+        """Computes the entities at all ranks at once, with a single sort.
+
+        This is useful when the entities at several ranks are needed, e.g. to build
+        one Entity Tile per rank, as the result of this flavor is only one slice of
+        the entities at all ranks.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+
+        Returns:
+            np.ndarray: The mapped entities (see `mapper`), of shape (N, ...), where
+            the first dimension corresponds to the ranks, from 1 to N.
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
         values = RankingScore._compute(
             importance=importance,
             performance=self.performances,
+            dtype=self.dtype,
         )
-        # performances[i] corresponds to entity self.reverse_mapper(i+1)
-        # so it is valid to argsort and +1, because it IS a value from the
-        # mapped codomain
-        return np.argsort(-values, axis=0)[self._rank - 1] + 1
+        np.negative(values, out=values)
+        return self._map(np.argsort(values, axis=0, kind="stable"))
+
+    def getTopEntities(
+        self, importance: Importance | np.ndarray, num: int
+    ) -> np.ndarray:
+        """Finds the entities at the first ranks, as indices in the performances.
+
+        Together with `insertEntities`, this is the state that allows the Tiles to
+        update the entity at a given rank when entities are added.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+            num (int): The number of ranks.
+
+        Returns:
+            np.ndarray: The indices, in the performances, of the entities ranked 1
+            to `num`, of shape (num, ...).
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        # Only the entities that may be ranked in the first `num` ones are evaluated,
+        # and only the selected ones are sorted.
+        performances = self.performances
+        candidates = performances.getCandidatesForTopK(num)
+        values = RankingScore._compute(
+            importance=importance,
+            performance=performances.to_array()[candidates],
+            dtype=self.dtype,
+        )
+        _to_sort_key(values)
+        if num >= len(candidates):
+            return candidates[np.argsort(values, axis=0, kind="stable")[:num]]
+        _, first = _select(values, num)
+        # The indices of the selected entities, in increasing order.
+        selected = np.argsort(~first, axis=0, kind="stable")[:num]
+        values = np.take_along_axis(values, selected, axis=0)
+        order = np.argsort(values, axis=0, kind="stable")
+        return candidates[np.take_along_axis(selected, order, axis=0)]
+
+    def insertEntities(
+        self,
+        importance: Importance | np.ndarray,
+        top_entities: np.ndarray,
+        indices: np.ndarray,
+    ) -> np.ndarray:
+        """Updates the entities at the first ranks when some entities are added.
+
+        Each new entity is compared to the entities at the first ranks only, so that
+        the cost does not depend on the number of entities that were already ranked.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+            top_entities (np.ndarray): The indices, in the performances, of the
+                entities ranked first before the new ones were added, of shape
+                (num, ...), as given by `getTopEntities`.
+            indices (np.ndarray): The indices, in the performances, of the new
+                entities, in increasing order. They must follow all the ones in
+                `top_entities`.
+
+        Returns:
+            np.ndarray: The indices, in the performances, of the entities ranked 1
+            to num, of shape (num, ...).
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        array = self.performances.to_array()
+        ranks = np.arange(len(top_entities))
+        ranks = ranks.reshape(ranks.shape + (1,) * (top_entities.ndim - 1))
+        for index in indices:
+            top_performances = array[top_entities]
+            top_values = RankingScore._compute(
+                importance=importance,
+                ptn=top_performances[..., 0],
+                pfp=top_performances[..., 1],
+                pfn=top_performances[..., 2],
+                ptp=top_performances[..., 3],
+                dtype=self.dtype,
+            )
+            values = RankingScore._compute(
+                importance=importance,
+                performance=self.performances[int(index)],
+                dtype=self.dtype,
+            )
+            # The new entity goes after the equivalent ones, as it comes last.
+            _to_sort_key(top_values)
+            values = _to_sort_key(np.asarray(values))
+            positions = np.sum(top_values <= values, axis=0)
+            top_entities = np.where(
+                ranks < positions,
+                top_entities,
+                np.where(ranks == positions, index, np.roll(top_entities, 1, axis=0)),
+            )
+        return top_entities
+
+    def _streamBest(
+        self,
+        importance: Importance | np.ndarray,
+        candidates: np.ndarray,
+        last: bool,
+    ) -> np.ndarray:
+        """Finds, for each importance, the index of the entity ranked first or last,
+        without computing the values of all entities at once.
+
+        The entities are processed one at a time, while keeping the best value found
+        so far.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+            candidates (np.ndarray): The indices of the entities to consider, in
+                increasing order.
+            last (bool): Whether to find the entity ranked last instead of first.
+
+        Returns:
+            np.ndarray: The indices of the entities, in the performances.
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        performances = self.performances
+        best_values = _to_sort_key(
+            np.asarray(
+                RankingScore._compute(
+                    importance=importance,
+                    performance=performances[int(candidates[0])],
+                    dtype=self.dtype,
+                )
+            )
+        )
+        best_indices = np.full(best_values.shape, candidates[0], dtype=np.intp)
+        values = np.empty_like(best_values)  # reused for all entities
+        work = np.empty((2,) + values.shape, values.dtype)
+        for index in candidates[1:]:
+            RankingScore._compute(
+                importance=importance,
+                performance=performances[int(index)],
+                out=values,
+                work=work,
+            )
+            _to_sort_key(values)
+            # With equal values, the first entity is ranked first and the last one
+            # is ranked last.
+            mask = (values >= best_values) if last else (values < best_values)
+            np.copyto(best_values, values, where=mask)
+            best_indices[mask] = index
+        return best_indices
 
     def getDefaultColormap(self):
+        import matplotlib.colors
+
         colors = [e.color for e in self._getSortedCodomain()]
         return matplotlib.colors.ListedColormap(colors)
 
@@ -81,7 +330,9 @@ class EntityFlavor(AbstractSymbolicFlavor[Entity]):
     def _getSortedCodomain(self) -> list[Entity]:
         """Returns the codomain of the flavor, sorted in a stable way.
 
-        Uses the Entity name for sorting
+        Uses the Entity name for sorting, then its performance for the entities with
+        the same name, so that the order does not depend on the objects, e.g. to
+        find the values of the Tiles in a cache shared between processes.
 
         Returns:
             The codomain of the flavor, sorted in a stable way.
@@ -89,6 +340,52 @@ class EntityFlavor(AbstractSymbolicFlavor[Entity]):
         if self._sorted_codomain is None:
             self._sorted_codomain = sorted(
                 self.getCodomain(),
-                key=lambda e: e.name,
+                key=lambda e: (
+                    e.name,
+                    e.performance.ptn,
+                    e.performance.pfp,
+                    e.performance.pfn,
+                    e.performance.ptp,
+                ),
             )
         return self._sorted_codomain
+
+
+def _to_sort_key(values: np.ndarray) -> np.ndarray:
+    """Turns, in place, values of a Ranking Score into keys that sort the entities
+    from the first rank to the last one, the undefined values (NaN) coming last.
+
+    Args:
+        values (np.ndarray): The values.
+
+    Returns:
+        np.ndarray: The keys, that is `values`.
+    """
+    np.negative(values, out=values)
+    values[np.isnan(values)] = np.inf
+    return values
+
+
+def _select(keys: np.ndarray, rank: int) -> tuple[np.ndarray, np.ndarray]:
+    """Finds the entity at some rank with a selection instead of a sort, equal keys
+    being ranked in increasing order of index as with a stable sort.
+
+    Args:
+        keys (np.ndarray): The keys of the entities (see `_to_sort_key`), of shape
+            (N, ...).
+        rank (int): The rank, from 1 to N.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The index of the entity at the given rank, of
+        shape (...), and whether each entity is ranked at most `rank`, of shape
+        (N, ...).
+    """
+    kth = np.argpartition(keys, rank - 1, axis=0)[rank - 1]
+    key = np.take_along_axis(keys, np.asarray(kth)[np.newaxis], axis=0)
+    # The selection gives the right key, but not the right one of the equal keys.
+    before = keys < key
+    equal = keys == key
+    position = rank - np.sum(before, axis=0)  # among the equal keys, from 1
+    count = np.cumsum(equal, axis=0)
+    selected = np.argmax(count == position, axis=0)
+    return selected, before | (equal & (count <= position))
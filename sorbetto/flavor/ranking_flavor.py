@@ -1,6 +1,5 @@
-from typing import Any
+from typing import Any, Literal
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from sorbetto.core.entity import Entity
@@ -26,10 +25,31 @@ class RankingFlavor(AbstractNumericFlavor):
         entity_list: list[Entity],
         name: str = "Unnamed Ranking Flavor",
         colormap: Any = None,
+        tie_policy: Literal["min", "max", "average"] = "min",
     ):
+        """
+        Args:
+            entity (Entity): The entity whose rank is given.
+            entity_list (list[Entity]): All the ranked entities, including `entity`.
+            name (str, optional): Name of the flavor. Defaults to "Unnamed Ranking Flavor".
+            colormap (Any, optional): The colormap. Defaults to None.
+            tie_policy (Literal["min", "max", "average"], optional): The rank given
+                when other entities are equivalent to `entity`: the best one ("min"),
+                the worst one ("max"), or their mean ("average"). Defaults to "min".
+
+        Raises:
+            ValueError: If the entity is not in the entity list, or the tie policy is
+                unknown.
+        """
         super().__init__(name=name, colormap=colormap)
+        if tie_policy not in ("min", "max", "average"):
+            raise ValueError(
+                f"Unknown tie policy: {tie_policy}. "
+                "Available options are 'min', 'max', and 'average'."
+            )
+        self._tie_policy = tie_policy
         self._entity = entity
-        self._entity_list = entity_list
+        self._entity_list = list(entity_list)
         self._nb_entities = len(entity_list)
         self._performances = FiniteSetOfTwoClassClassificationPerformances(
             [e.performance for e in entity_list]
@@ -61,21 +81,151 @@ class RankingFlavor(AbstractNumericFlavor):
     def id_entity(self) -> int:
         return self._id_entity
 
+    @property
+    def version(self) -> int:
+        return self._performances.version
+
+    @property
+    def tie_policy(self) -> str:
+        return self._tie_policy
+
+    def getCacheKey(self) -> Any:
+        return (self._performances.to_array(), self._id_entity, self._tie_policy)
+
     def __call__(
         self,
         importance: Importance | np.ndarray,
     ) -> float | np.ndarray:
-        values = RankingScore._compute(
-            importance=importance, performance=self._performances
+        # The rank of the entity is one plus the number of entities that are better
+        # (or not worse, depending on the tie policy).
+        others = np.flatnonzero(np.arange(self._nb_entities) != self._id_entity)
+        return 1 + self.getRankIncrease(importance, others)
+
+    def getRankIncrease(
+        self, importance: Importance | np.ndarray, indices: np.ndarray
+    ) -> np.ndarray:
+        """Computes how much some entities increase the rank of the entity.
+
+        An entity increases the rank by one when it is better than the entity, and by
+        0, 1, or 0.5 when it is equivalent, depending on the tie policy. The entities
+        whose Ranking Score is undefined (NaN) are worse than all the other ones, and
+        equivalent to each other, as in `getAllRanks`. The entities
+        are compared one at a time to the given one, so that neither the values of all
+        entities nor a sort are needed. This also allows to update the ranks computed
+        before some entities were added, without comparing the other ones again.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+            indices (np.ndarray): The indices of the entities to compare, in
+                `entity_list`. They must not include the one of the entity.
+
+        Returns:
+            np.ndarray: The increase of the rank, of integer type unless the tie
+            policy is "average".
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        performances = self._performances
+        values_entity = np.asarray(
+            RankingScore._compute(
+                importance=importance,
+                performance=performances[self._id_entity],
+                dtype=self.dtype,
+            )
+        )
+        values_entity[np.isnan(values_entity)] = -np.inf
+        values = np.empty_like(values_entity)  # reused for all entities
+        work = np.empty((2,) + values.shape, values.dtype)
+        num_better = np.zeros(values_entity.shape, dtype=np.intp)
+        num_equivalent = np.zeros(values_entity.shape, dtype=np.intp)
+        for index in indices:
+            assert index != self._id_entity
+            RankingScore._compute(
+                importance=importance,
+                performance=performances[int(index)],
+                out=values,
+                work=work,
+            )
+            values[np.isnan(values)] = -np.inf
+            num_better += values > values_entity
+            if self._tie_policy != "min":
+                num_equivalent += values == values_entity
+
+        if self._tie_policy == "min":
+            return num_better
+        if self._tie_policy == "max":
+            return num_better + num_equivalent
+        return num_better + 0.5 * num_equivalent
+
+    def addEntity(self, entity: Entity) -> None:
+        """Adds an entity to the ranked ones.
+
+        The Tiles based on this flavor then only compare the new entity to the given
+        one, instead of computing the ranks again. The default colormap and the upper
+        bound are updated accordingly.
+
+        Args:
+            entity (Entity): The new entity.
+
+        Raises:
+            ValueError: If the entity is already ranked.
+        """
+        if entity in self._entity_list:
+            raise ValueError(f"The entity {entity.name} is already ranked.")
+        self._entity_list.append(entity)
+        self._nb_entities += 1
+        self._performances.append(entity.performance)
+
+    def getAllRanks(self, importance: Importance | np.ndarray) -> np.ndarray:
+        """Computes the ranks of all entities at once, with a single sort.
+
+        This is useful when the ranks of several entities are needed, e.g. to build
+        one Ranking Tile per entity, as the result of this flavor is only one slice
+        of the ranks of all entities. The tie policy of this flavor is used.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+
+        Returns:
+            np.ndarray: The ranks, of shape (N, ...), where the first dimension
+            corresponds to the entities of `entity_list`, in the same order.
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        values = np.asarray(
+            RankingScore._compute(
+                importance=importance, performance=self._performances, dtype=self.dtype
+            )
         )
+        shape = values.shape
+        num = shape[0]
+        values = -values.reshape(num, -1)
+        values[np.isnan(values)] = np.inf  # the undefined values are equivalent
+        order = np.argsort(values, axis=0, kind="stable")
+        sorted_values = np.take_along_axis(values, order, axis=0)
 
-        # TODO check behaviour of argsort(argsort()) with multiple identical values
-        # and allow user to choose between 'min', 'max', 'mean', ...
-        ranks = np.argsort(-values, axis=0)
-        rank_entities = np.argsort(ranks, axis=0) + 1
-        return rank_entities[self._id_entity]
+        # Positions, in the sorted values, of the first and last equivalent entities.
+        positions = np.arange(num)[:, np.newaxis]
+        is_first = np.ones(sorted_values.shape, dtype=bool)
+        is_first[1:] = sorted_values[1:] != sorted_values[:-1]
+        is_last = np.ones(sorted_values.shape, dtype=bool)
+        is_last[:-1] = is_first[1:]
+        first = np.maximum.accumulate(np.where(is_first, positions, 0), axis=0)
+        last = np.minimum.accumulate(np.where(is_last, positions, num)[::-1], axis=0)
+        last = last[::-1]
+
+        if self._tie_policy == "min":
+            sorted_ranks = 1 + first
+        elif self._tie_policy == "max":
+            sorted_ranks = 1 + last
+        else:
+            sorted_ranks = 1 + 0.5 * (first + last)
+
+        ranks = np.empty_like(sorted_ranks)
+        np.put_along_axis(ranks, order, sorted_ranks, axis=0)
+        return ranks.reshape(shape)
 
     def getDefaultColormap(self):
+        import matplotlib.pyplot as plt
+
         return plt.get_cmap("rainbow", self.nb_entities)
 
     def getLowerBound(self):
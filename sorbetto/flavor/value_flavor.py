@@ -30,6 +30,10 @@ class ValueFlavor(AbstractNumericFlavor):
     def performance(self) -> TwoClassClassificationPerformance:
         return self._performance
 
+    def getCacheKey(self) -> Any:
+        performance = self._performance
+        return (performance.ptn, performance.pfp, performance.pfn, performance.ptp)
+
     def __call__(
         self,
         importance: Importance | np.ndarray,
@@ -37,6 +41,7 @@ class ValueFlavor(AbstractNumericFlavor):
         return RankingScore._compute(
             importance=importance,
             performance=self._performance,
+            dtype=self.dtype,
         )
 
     def getDefaultColormap(self):
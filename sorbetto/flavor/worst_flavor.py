@@ -43,14 +43,48 @@ class WorstFlavor(AbstractNumericFlavor):
     def performances(self) -> FiniteSetOfTwoClassClassificationPerformances:
         return self._performances
 
+    @property
+    def version(self) -> int:
+        return self._performances.version
+
+    def getCacheKey(self) -> Any:
+        return (self._performances.to_array(),)
+
+    def prepare(self) -> None:
+        self._performances.getCandidatesForBottomK(1)
+
     def __call__(
         self,
         importance: Importance | np.ndarray,
     ) -> float | np.ndarray:
-        values = RankingScore._compute(
-            importance=importance, performance=self._performances
+        # The performances that are dominated by another one for all importances do
+        # not change the worst value, so they are not evaluated.
+        return self.getValueAmong(
+            importance, self._performances.getCandidatesForBottomK(1)
         )
 
+    def getValueAmong(
+        self, importance: Importance | np.ndarray, indices: np.ndarray
+    ) -> np.ndarray:
+        """Computes the worst value among some of the performances only.
+
+        As the worst value of a union is the worst of the worst values of its parts,
+        this allows to update the values computed before some performances were
+        appended, without evaluating the other ones again.
+
+        Args:
+            importance (Importance | np.ndarray): The importance value(s).
+            indices (np.ndarray): The indices of the performances to consider.
+
+        Returns:
+            np.ndarray: The worst values.
+        """
+        importance = RankingScore._prepareImportance(importance, self.dtype)
+        values = RankingScore._compute(
+            importance=importance,
+            performance=self._performances.to_array()[indices],
+            dtype=self.dtype,
+        )
         return np.min(values, axis=0)
 
     def getDefaultColormap(self):
@@ -1,5 +1,6 @@
 from .abstract_geometric_object_2d import AbstractGeometricObject2D
 from .bilinear_curve import BilinearCurve
+from .bilinear_curve_collection import BilinearCurveCollection
 from .conic import Conic
 from .line import Line
 from .line_segment import LineSegment
@@ -10,6 +11,7 @@ from .point import Point
 __all__ = [
     "AbstractGeometricObject2D",
     "BilinearCurve",
+    "BilinearCurveCollection",
     "Conic",
     "Line",
     "LineSegment",
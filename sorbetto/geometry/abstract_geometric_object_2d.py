@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 
 class AbstractGeometricObject2D(ABC):
@@ -14,7 +16,7 @@ class AbstractGeometricObject2D(ABC):
         ABC.__init__(self)
 
     @abstractmethod
-    def draw(self, fig: Figure, ax: Axes, extent, **plt_kwargs) -> None: ...
+    def draw(self, fig: "Figure", ax: "Axes", extent, **plt_kwargs) -> None: ...
 
     @property
     def name(self) -> str:
@@ -0,0 +1,197 @@
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+
+from sorbetto.geometry.abstract_geometric_object_2d import AbstractGeometricObject2D
+from sorbetto.geometry.bilinear_curve import BilinearCurve
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+class BilinearCurveCollection(AbstractGeometricObject2D):
+    """
+    This class is used to represent many bilinear curves
+    :math:`K_{xy} x y + K_x x + K_y y + K = 0` at once. The coefficients of the curves
+    are stored in one array per coefficient, so that the curves are evaluated and
+    drawn together, without one Python call per curve.
+    """
+
+    def __init__(self, Kxy, Kx, Ky, K, name: str | None = None):
+        """
+        Args:
+            Kxy (array_like): The coefficients :math:`K_{xy}`, of shape (M,).
+            Kx (array_like): The coefficients :math:`K_x`, of shape (M,).
+            Ky (array_like): The coefficients :math:`K_y`, of shape (M,).
+            K (array_like): The coefficients :math:`K`, of shape (M,).
+            name (str | None, optional): Name of the collection. Defaults to None.
+        """
+        Kxy, Kx, Ky, K = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in (Kxy, Kx, Ky, K))
+        )
+        assert Kxy.ndim == 1
+        self._Kxy = Kxy
+        self._Kx = Kx
+        self._Ky = Ky
+        self._K = K
+        AbstractGeometricObject2D.__init__(self, name)
+
+    @property
+    def Kxy(self) -> np.ndarray:
+        return self._Kxy
+
+    @property
+    def Kx(self) -> np.ndarray:
+        return self._Kx
+
+    @property
+    def Ky(self) -> np.ndarray:
+        return self._Ky
+
+    @property
+    def K(self) -> np.ndarray:
+        return self._K
+
+    def getY(self, x) -> np.ndarray:
+        """
+        Computes the value of :math:`y` on all curves, for any given :math:`x`.
+
+        Args:
+            x (array_like): :math:`x`, of shape (P,).
+
+        Returns:
+            np.ndarray: the values of :math:`y`, of shape (M, P).
+        """
+        x = np.asarray(x, dtype=float)[np.newaxis]
+        Kxy, Kx, Ky, K = (
+            value[:, np.newaxis] for value in (self._Kxy, self._Kx, self._Ky, self._K)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -(Kx * x + K) / (Kxy * x + Ky)
+
+    def getX(self, y) -> np.ndarray:
+        """
+        Computes the value of :math:`x` on all curves, for any given :math:`y`.
+
+        Args:
+            y (array_like): :math:`y`, of shape (P,).
+
+        Returns:
+            np.ndarray: the values of :math:`x`, of shape (M, P).
+        """
+        y = np.asarray(y, dtype=float)[np.newaxis]
+        Kxy, Kx, Ky, K = (
+            value[:, np.newaxis] for value in (self._Kxy, self._Kx, self._Ky, self._K)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -(Ky * y + K) / (Kxy * y + Kx)
+
+    def getSegments(
+        self, extent, num_points: int = 1000, return_indices: bool = False
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        """
+        Samples the parts of the curves that are within some axis-aligned box, in the
+        same way as :meth:`BilinearCurve.draw`: each curve is sampled as a function
+        of :math:`y` where :math:`|dx/dy| \\leq 1`, and as a function of :math:`x`
+        where :math:`|dy/dx| \\leq 1`.
+
+        Args:
+            extent (_type_): the axis-aligned box :math:`(x_{min}, x_{max}, y_{min}, y_{max})`
+            num_points (int, optional): The number of samples per curve and
+                direction. Defaults to 1000.
+            return_indices (bool, optional): Whether to also return, for each
+                polyline, the index of its curve. Defaults to False.
+
+        Returns:
+            np.ndarray: The polylines, of shape (L, num_points, 2), where the points
+            that are not drawn are NaN. Polylines without any point are omitted.
+            If `return_indices` is True, the indices of the curves, of shape (L,),
+            are returned too.
+        """
+        x_min, x_max, y_min, y_max = extent
+        assert x_max > x_min
+        assert y_max > y_min
+
+        Kxy, Kx, Ky, K = (
+            value[:, np.newaxis] for value in (self._Kxy, self._Kx, self._Ky, self._K)
+        )
+        polylines = list()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # x = - ( Ky y + K ) / ( Kxy y + Kx ), where -1 <= dx/dy <= 1
+            y = np.linspace(y_min, y_max, num_points)[np.newaxis]
+            num = Ky * y + K
+            den = Kxy * y + Kx
+            x = -num / den
+            d_x_d_y = -(Ky * den - Kxy * num) / (den * den)
+            bad = (np.abs(d_x_d_y) >= 1.0 + 1e-8) | (x < x_min) | (x > x_max)
+            bad |= ((Kx == 0.0) & (Kxy == 0.0)) | np.isnan(x)
+            polylines.append(_stack_points(x, np.broadcast_to(y, x.shape), bad))
+
+            # y = - ( Kx x + K ) / ( Kxy x + Ky ), where -1 <= dy/dx <= 1
+            x = np.linspace(x_min, x_max, num_points)[np.newaxis]
+            num = Kx * x + K
+            den = Kxy * x + Ky
+            y = -num / den
+            d_y_d_x = -(Kx * den - Kxy * num) / (den * den)
+            bad = (np.abs(d_y_d_x) >= 1.0 + 1e-8) | (y < y_min) | (y > y_max)
+            bad |= ((Ky == 0.0) & (Kxy == 0.0)) | np.isnan(y)
+            polylines.append(_stack_points(np.broadcast_to(x, y.shape), y, bad))
+
+        polylines = np.concatenate(polylines)
+        indices = np.tile(np.arange(len(self)), 2)
+        kept = np.any(np.isfinite(polylines[:, :, 0]), axis=1)
+        if return_indices:
+            return polylines[kept], indices[kept]
+        return polylines[kept]
+
+    def draw(self, fig: "Figure", ax: "Axes", extent, **plt_kwargs):
+        """
+        Draws the parts of the bilinear curves that are within some axis-aligned box in
+        some given Pyplot axes, as a single LineCollection.
+
+        Args:
+            fig (_type_): a Pyplot Figure object
+            ax (_type_): a Pyplot Axes object
+            extent (_type_): the axis-aligned box :math:`(x_{min}, x_{max}, y_{min}, y_{max})`
+            plt_kwargs: options for Matplotlib's LineCollection.
+        """
+        from matplotlib.collections import LineCollection
+
+        segments = cast(np.ndarray, self.getSegments(extent))
+        collection = LineCollection(list(segments), **plt_kwargs)
+        ax.add_collection(collection)
+        ax.autoscale_view()
+
+    def __len__(self) -> int:
+        return self._Kxy.shape[0]
+
+    def __getitem__(self, index: int) -> BilinearCurve:
+        return BilinearCurve(
+            float(self._Kxy[index]),
+            float(self._Kx[index]),
+            float(self._Ky[index]),
+            float(self._K[index]),
+            self.name,
+        )
+
+    def __str__(self) -> str:
+        return "{}: {} bilinear curves".format(self.name, len(self))
+
+
+def _stack_points(x: np.ndarray, y: np.ndarray, bad: np.ndarray) -> np.ndarray:
+    """
+    Stacks the coordinates of some polylines, and hides the points that must not be
+    drawn.
+
+    Args:
+        x (np.ndarray): The abscissas, of shape (M, P).
+        y (np.ndarray): The ordinates, of shape (M, P).
+        bad (np.ndarray): The points that must not be drawn, of shape (M, P).
+
+    Returns:
+        np.ndarray: The points, of shape (M, P, 2).
+    """
+    points = np.stack([x, y], axis=-1)
+    points[bad] = np.nan
+    return points
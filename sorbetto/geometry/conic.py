@@ -1,13 +1,15 @@
 import logging
 import math
+from typing import TYPE_CHECKING
 
-import jax
 import numpy as np
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 
 from sorbetto.geometry.abstract_geometric_object_2d import AbstractGeometricObject2D
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class Conic(AbstractGeometricObject2D):
     """
@@ -389,7 +391,7 @@ class Conic(AbstractGeometricObject2D):
 
         return self._solve_quadratic_equation_max(A, B, C)
 
-    def draw(self, fig: Figure, ax: Axes, extent, **plt_kwargs):
+    def draw(self, fig: "Figure", ax: "Axes", extent, **plt_kwargs):
         """
         Draws the part of the conic section that is within some axis-aligned box in some given Pyplot axes.
 
@@ -404,43 +406,41 @@ class Conic(AbstractGeometricObject2D):
         assert x_max > x_min
         assert y_max > y_min
 
+        a = self._a
+        b = self._b
+        c = self._c
+        d = self._d
+        e = self._e
+
+        # The slopes are given by the implicit function theorem, for all points at
+        # once: with F ( x, y ) = a x^2 + b x y + c y^2 + d x + e y + f,
+        # dy/dx = - F_x / F_y and dx/dy = - F_y / F_x, where
+        # F_x = 2 a x + b y + d and F_y = b x + 2 c y + e.
         x = np.linspace(x_min, x_max, 1000)
 
-        def draw_y_fct_of_x(f):
-            y = f(x)
-            y[y < y_min] = np.nan
-            y[y > y_max] = np.nan
-            grad = jax.grad(f)
-            g = np.empty(x.shape)
-            for i in range(x.size):
-                if np.isfinite(y[i]):
-                    g[i] = grad(x[i])
-                else:
-                    g[i] = np.nan
-            ok = np.logical_and(np.isfinite(y), -1.0 <= g, g <= 1.0)
-            ko = np.logical_not(ok)
-            y[ko] = np.nan
+        def draw_y_fct_of_x(fct):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                y = fct(x)
+                y[y < y_min] = np.nan
+                y[y > y_max] = np.nan
+                g = -(2.0 * a * x + b * y + d) / (b * x + 2.0 * c * y + e)
+                ok = np.logical_and(np.isfinite(y), np.abs(g) <= 1.0)
+            y[~ok] = np.nan
             ax.plot(x, y, "-", **plt_kwargs)
 
         draw_y_fct_of_x(self.getSmallestY)
         draw_y_fct_of_x(self.getLargestY)
 
-        y = x  # = np.linspace(y_min, y_max, 1000)
-
-        def draw_x_fct_of_y(f):
-            x = f(y)
-            x[x < x_min] = np.nan
-            x[x > x_max] = np.nan
-            grad = jax.grad(f)
-            g = np.empty(y.shape)
-            for i in range(y.size):
-                if np.isfinite(x[i]):
-                    g[i] = grad(y[i])
-                else:
-                    g[i] = np.nan
-            ok = np.logical_and(np.isfinite(x), -1.0 <= g, g <= 1.0)
-            ko = np.logical_not(ok)
-            x[ko] = np.nan
+        y = np.linspace(y_min, y_max, 1000)
+
+        def draw_x_fct_of_y(fct):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x = fct(y)
+                x[x < x_min] = np.nan
+                x[x > x_max] = np.nan
+                g = -(b * x + 2.0 * c * y + e) / (2.0 * a * x + b * y + d)
+                ok = np.logical_and(np.isfinite(x), np.abs(g) <= 1.0)
+            x[~ok] = np.nan
             ax.plot(x, y, "-", **plt_kwargs)
 
         draw_x_fct_of_y(self.getSmallestX)
@@ -1,9 +1,12 @@
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
+from typing import TYPE_CHECKING
 
 from sorbetto.geometry.abstract_geometric_object_2d import AbstractGeometricObject2D
 from sorbetto.geometry.point import Point
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class LineSegment(AbstractGeometricObject2D):
     """
@@ -46,7 +49,7 @@ class LineSegment(AbstractGeometricObject2D):
         """
         return self._p2
 
-    def draw(self, fig: Figure, ax: Axes, extent, **plt_kwargs):
+    def draw(self, fig: "Figure", ax: "Axes", extent, **plt_kwargs):
         """
         Plots the line segment in some given Pyplot axes.
         TODO: extent is currently ignored.
@@ -1,8 +1,11 @@
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
+from typing import TYPE_CHECKING
 
 from sorbetto.geometry.abstract_geometric_object_2d import AbstractGeometricObject2D
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class Point(AbstractGeometricObject2D):
     """
@@ -45,7 +48,7 @@ class Point(AbstractGeometricObject2D):
         """
         return self._y
 
-    def draw(self, fig: Figure, ax: Axes, extent, **plt_kwargs):
+    def draw(self, fig: "Figure", ax: "Axes", extent, **plt_kwargs):
         """
         If the point is withing some axis-aligned box, then plots it in some given Pyplot axes.
 
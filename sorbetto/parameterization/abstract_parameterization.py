@@ -75,6 +75,30 @@ class AbstractParameterization(ABC):
         """
         ...
 
+    def getCanonicalImportanceSeparable(
+        self, vec1: np.ndarray, vec2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """Computes the canonical importances on the grid given by the values of the
+        two parameters, without computing them at each point of the grid, when the
+        importances of the satisfying cases (itn, itp) only depend on one parameter
+        and those of the unsatisfying cases (ifp, ifn) on the other one.
+
+        The default implementation returns None, so that the importances are computed
+        by getCanonicalImportanceVectorized.
+
+        Args:
+            vec1 (np.ndarray): The values of the first parameter, along the columns
+                of the grid, of shape (C,).
+            vec2 (np.ndarray): The values of the second parameter, along the rows of
+                the grid, of shape (R,).
+
+        Returns:
+            The importances (itn, ifp, ifn, itp), as single rows or columns whose
+            shapes broadcast to (R, C) (see RankingScore._prepareImportance), or None
+            if the parameterization is not separable.
+        """
+        return None
+
     def getCanonicalRankingScore(self, param1: float, param2: float) -> RankingScore:
         importance = self.getCanonicalImportance(param1, param2)
         return RankingScore(importance)
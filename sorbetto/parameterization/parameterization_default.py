@@ -68,6 +68,27 @@ class ParameterizationDefault(AbstractParameterization):
 
         return np.stack([itn, ifp, ifn, itp], axis=-1)
 
+    def getCanonicalImportanceSeparable(
+        self, vec1: np.ndarray, vec2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        assert isinstance(vec1, np.ndarray)
+        assert isinstance(vec2, np.ndarray)
+        assert np.all(vec1 >= 0.0)
+        assert np.all(vec1 <= 1.0)
+        assert np.all(vec2 >= 0.0)
+        assert np.all(vec2 <= 1.0)
+
+        # The satisfying importances only depend on a, and the unsatisfying ones on b.
+        a = vec1[np.newaxis, :]
+        b = vec2[:, np.newaxis]
+
+        itn = 1 - a
+        ifp = 1 - b
+        ifn = b
+        itp = a
+
+        return itn, ifp, ifn, itp
+
     def getValueParameter1(self, rankingScore) -> float:
         assert isinstance(rankingScore, RankingScore)
         importance = rankingScore.importance
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Literal
+
+import numpy as np
 
 from sorbetto.performance.finite_set_of_two_class_classification_performances import (
     FiniteSetOfTwoClassClassificationPerformances,
@@ -27,8 +30,160 @@ class AbstractDistributionOfTwoClassClassificationPerformances(ABC):
 
     @abstractmethod
     def drawAtRandom(
-        self, numPerformances: int
-    ) -> FiniteSetOfTwoClassClassificationPerformances: ...
+        self, numPerformances: int, rng: np.random.Generator | int | None = None
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        """
+        Draws performances at random, all at once.
+
+        Args:
+            numPerformances (int): The amount of performances to draw.
+            rng (np.random.Generator | int | None, optional): The random generator, or
+                a seed for it. Defaults to None, for the global random state used
+                before this argument existed (e.g. seeded with `np.random.seed`).
+                This is the legacy path, that may be much slower (e.g. the `random`
+                module draws the values one by one), so a generator is preferable
+                for large amounts of performances.
+
+        Returns:
+            FiniteSetOfTwoClassClassificationPerformances: The performances.
+        """
+
+    def genBatches(
+        self,
+        total: int,
+        batch_size: int,
+        rng: np.random.Generator | int | None = None,
+    ) -> Iterator[FiniteSetOfTwoClassClassificationPerformances]:
+        """
+        Draws performances at random, by batches, so that large amounts of
+        performances can be processed with a bounded memory. All batches are drawn
+        with the same random generator.
+
+        Args:
+            total (int): The amount of performances to draw.
+            batch_size (int): The maximum amount of performances per batch.
+            rng (np.random.Generator | int | None, optional): The random generator, or
+                a seed for it. Defaults to None, for a fresh generator: unlike
+                `drawAtRandom`, the legacy and slower global random state is not used.
+
+        Yields:
+            FiniteSetOfTwoClassClassificationPerformances: The performances, by
+            batches. All batches have `batch_size` performances, except the last one.
+        """
+        assert isinstance(total, int)
+        assert total >= 0
+        assert isinstance(batch_size, int)
+        assert batch_size > 0
+
+        rng = np.random.default_rng(rng)
+        for start in range(0, total, batch_size):
+            yield self.drawAtRandom(min(batch_size, total - start), rng=rng)
+
+    def drawQuasiRandom(
+        self,
+        numPerformances: int,
+        method: Literal["sobol", "halton"] = "sobol",
+        rng: np.random.Generator | int | None = None,
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        """
+        Draws performances with a low-discrepancy sequence: they cover the
+        distribution more evenly than independent draws, so that the Monte-Carlo
+        estimates computed with them (e.g. of the mean value of a score) converge
+        faster. The sequence is scrambled, which keeps these estimates unbiased.
+
+        Args:
+            numPerformances (int): The amount of performances to draw. Powers of two
+                are best for the Sobol sequence.
+            method (Literal["sobol", "halton"], optional): The low-discrepancy
+                sequence. Defaults to "sobol".
+            rng (np.random.Generator | int | None, optional): The random generator
+                used for scrambling, or a seed for it. Defaults to None, for a fresh
+                generator.
+
+        Raises:
+            ValueError: If the method is unknown.
+            NotImplementedError: If the distribution can not be obtained from the
+                unit hypercube.
+
+        Returns:
+            FiniteSetOfTwoClassClassificationPerformances: The performances.
+        """
+        assert isinstance(numPerformances, int)
+        assert numPerformances >= 0
+
+        from scipy.stats import qmc
+
+        num_dimensions = self._getNumDimensions()
+        if method == "sobol":
+            sampler: qmc.QMCEngine = qmc.Sobol(num_dimensions, rng=rng)
+        elif method == "halton":
+            sampler = qmc.Halton(num_dimensions, rng=rng)
+        else:
+            raise ValueError(
+                f"Unknown method: {method}. Available options are 'sobol' and 'halton'."
+            )
+        return self._getPerformancesFromUnitHypercube(sampler.random(numPerformances))
+
+    def drawStratified(
+        self, numPerformances: int, rng: np.random.Generator | int | None = None
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        """
+        Draws performances with a Latin hypercube sampling: each coordinate of the
+        unit hypercube, from which the distribution is obtained, is split into
+        `numPerformances` strata of equal probability, that contain one
+        performance each.
+
+        Args:
+            numPerformances (int): The amount of performances to draw.
+            rng (np.random.Generator | int | None, optional): The random generator, or
+                a seed for it. Defaults to None, for a fresh generator.
+
+        Raises:
+            NotImplementedError: If the distribution can not be obtained from the
+                unit hypercube.
+
+        Returns:
+            FiniteSetOfTwoClassClassificationPerformances: The performances.
+        """
+        assert isinstance(numPerformances, int)
+        assert numPerformances >= 0
+
+        from scipy.stats import qmc
+
+        sampler = qmc.LatinHypercube(self._getNumDimensions(), rng=rng)
+        return self._getPerformancesFromUnitHypercube(sampler.random(numPerformances))
+
+    def _getNumDimensions(self) -> int:
+        """
+        Gives the dimension of the unit hypercube from which the distribution is
+        obtained by `_getPerformancesFromUnitHypercube`.
+
+        Raises:
+            NotImplementedError: If the distribution can not be obtained this way.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} can not be sampled from the unit hypercube"
+        )
+
+    def _getPerformancesFromUnitHypercube(
+        self, points: np.ndarray
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        """
+        Maps points uniformly distributed in the unit hypercube to performances
+        following the distribution.
+
+        Args:
+            points (np.ndarray): The points, of shape (N, `_getNumDimensions()`).
+
+        Raises:
+            NotImplementedError: If the distribution can not be obtained this way.
+
+        Returns:
+            FiniteSetOfTwoClassClassificationPerformances: The performances.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} can not be sampled from the unit hypercube"
+        )
 
     @abstractmethod
     def getMean(self) -> TwoClassClassificationPerformance: ...
@@ -1,5 +1,5 @@
-import itertools
 import logging
+from typing import Iterator
 
 import numpy as np
 
@@ -52,10 +52,14 @@ class UniformDistributionOfTwoClassClassificationPerformances(
         return p
 
     def drawAtRandom(
-        self, numPerformances
+        self, numPerformances, rng: np.random.Generator | int | None = None
     ) -> FiniteSetOfTwoClassClassificationPerformances:
         concentration_parameters = [1, 1, 1, 1]  # for uniform
-        mat = np.random.dirichlet(concentration_parameters, size=numPerformances)
+        if rng is None:  # the global state, as before `rng` existed
+            mat = np.random.dirichlet(concentration_parameters, size=numPerformances)
+        else:
+            rng = np.random.default_rng(rng)
+            mat = rng.dirichlet(concentration_parameters, size=numPerformances)
         # ptn = mat [ :, 0 ]
         # pfp = mat [ :, 1 ]
         # pfn = mat [ :, 2 ]
@@ -64,6 +68,20 @@ class UniformDistributionOfTwoClassClassificationPerformances(
             mat, name="random performances"
         )
 
+    def _getNumDimensions(self) -> int:
+        return 4
+
+    def _getPerformancesFromUnitHypercube(
+        self, points: np.ndarray
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        # Dirichlet construction: normalized independent exponential variables,
+        # obtained by inverse transform sampling.
+        exponentials = -np.log1p(-points)
+        return FiniteSetOfTwoClassClassificationPerformances(
+            exponentials / np.sum(exponentials, axis=1, keepdims=True),
+            "quasi-random performances",
+        )
+
     def getMean(self) -> TwoClassClassificationPerformance:
         """
         Computes the mean of the distribution.
@@ -78,40 +96,110 @@ class UniformDistributionOfTwoClassClassificationPerformances(
     def sampleOnRegularGrid(
         self, grid_size: int
     ) -> FiniteSetOfTwoClassClassificationPerformances:
-        """_summary_
+        """
+        Samples the performances whose probabilities are all multiples of
+        1 / `grid_size`. There are (grid_size + 1) (grid_size + 2) (grid_size + 3) / 6
+        of them. They are given in the lexicographic order of the decreasing
+        numbers of true negatives, false positives, and false negatives.
 
         Args:
-            grid_size (int): _description_
+            grid_size (int): The number of steps between 0 and 1.
 
         Returns:
-            FiniteSetOfTwoClassClassificationPerformances: _description_
-
-        Yields:
-            Iterator[FiniteSetOfTwoClassClassificationPerformances]: _description_
+            FiniteSetOfTwoClassClassificationPerformances: The performances.
         """
-
         assert isinstance(grid_size, int)
         assert grid_size > 0
-        if grid_size >= 300:
-            raise RuntimeError(
-                "You are asking for too many performances. Use a grid size smaller than 300."
-            )
-        elif grid_size >= 180:
+        if grid_size >= 180:
             logging.warning(
                 "You are asking for a huge amount of performances. With a grid size larger than 180, "
                 "you are going to obtain more than one million performances."
             )
 
-        def gen():
-            ss = [0, 1, 2, 3]
-            for seq in itertools.combinations_with_replacement(ss, grid_size):
-                ptn = seq.count(0) / grid_size
-                pfp = seq.count(1) / grid_size
-                pfn = seq.count(2) / grid_size
-                ptp = seq.count(3) / grid_size
-                yield TwoClassClassificationPerformance(ptn, pfp, pfn, ptp)
-
-        performance_list = list(gen())
+        compositions = _get_compositions(grid_size, 4)
         return FiniteSetOfTwoClassClassificationPerformances(
-            performance_list, "uniform grid of performances"
+            compositions / grid_size, "uniform grid of performances"
         )
+
+    def genOnRegularGrid(
+        self, grid_size: int, chunk_size: int
+    ) -> Iterator[FiniteSetOfTwoClassClassificationPerformances]:
+        """
+        Samples the same performances as `sampleOnRegularGrid`, in the same order,
+        but gives them by chunks, so that grids too large to be held in memory at
+        once can be processed.
+
+        Args:
+            grid_size (int): The number of steps between 0 and 1.
+            chunk_size (int): The maximum number of performances per chunk. A chunk
+                may be larger when all the performances with a given number of true
+                negatives do not fit in it.
+
+        Yields:
+            FiniteSetOfTwoClassClassificationPerformances: The performances, by
+            chunks.
+        """
+        assert isinstance(grid_size, int)
+        assert grid_size > 0
+        assert isinstance(chunk_size, int)
+        assert chunk_size > 0
+
+        # The performances with k_tn true negatives are the compositions of
+        # grid_size - k_tn in the three other cases.
+        k_tn = grid_size
+        while k_tn >= 0:
+            k_tn_values = [k_tn]
+            size = (grid_size - k_tn + 1) * (grid_size - k_tn + 2) // 2
+            k_tn -= 1
+            while k_tn >= 0:
+                next_size = (grid_size - k_tn + 1) * (grid_size - k_tn + 2) // 2
+                if size + next_size > chunk_size:
+                    break
+                k_tn_values.append(k_tn)
+                size += next_size
+                k_tn -= 1
+            compositions = np.concatenate(
+                [
+                    _get_compositions(grid_size - value, 3, first=value)
+                    for value in k_tn_values
+                ]
+            )
+            yield FiniteSetOfTwoClassClassificationPerformances(
+                compositions / grid_size, "uniform grid of performances"
+            )
+
+
+def _get_compositions(
+    total: int, num_parts: int, first: int | None = None
+) -> np.ndarray:
+    """
+    Enumerates the ways of writing `total` as an ordered sum of `num_parts`
+    non-negative integers, in the lexicographic order of decreasing parts (which is
+    the order of `itertools.combinations_with_replacement`).
+
+    Each level is obtained from the previous one at once: a row whose remaining sum
+    is r has r + 1 children, whose next part goes from r down to 0.
+
+    Args:
+        total (int): The sum of the parts.
+        num_parts (int): The number of parts.
+        first (int | None, optional): If given, a first part with this value is
+            prepended to all compositions. Defaults to None.
+
+    Returns:
+        np.ndarray: The compositions, of shape (M, num_parts), or (M, num_parts + 1)
+        with `first`.
+    """
+    assert num_parts > 0
+    parts: list[np.ndarray] = []
+    remaining = np.array([total], dtype=np.intp)
+    for _ in range(num_parts - 1):
+        counts = remaining + 1
+        parents = np.repeat(np.arange(len(remaining)), counts)
+        offsets = np.arange(len(parents)) - (np.cumsum(counts) - counts)[parents]
+        parts = [part[parents] for part in parts] + [remaining[parents] - offsets]
+        remaining = offsets
+    parts.append(remaining)
+    if first is not None:
+        parts.insert(0, np.full(len(remaining), first, dtype=np.intp))
+    return np.stack(parts, axis=1)
@@ -86,7 +86,9 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors
         return p
 
     def drawAtRandom(
-        self, numPerformances: int
+        self,
+        numPerformances: int,
+        rng: np.random.Generator | int | None = None,
     ) -> FiniteSetOfTwoClassClassificationPerformances:
         """
         Draw `numPerformances` two-class classification performances at random,
@@ -94,6 +96,11 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors
 
         Args:
             numPerformances (int): the amount of performances to draw.
+            rng (np.random.Generator | int | None, optional): The random generator, or
+                a seed for it. Defaults to None, for the global state of the `random`
+                module, which gives the same performances as before this argument
+                existed. This legacy path draws the values one by one, and is thus
+                much slower than a generator for large amounts of performances.
 
         Returns:
             FiniteSetOfTwoClassClassificationPerformances: the (multi)set.
@@ -101,27 +108,15 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors
         assert isinstance(numPerformances, int)
         assert numPerformances >= 0
 
-        priorNeg = self.priorNeg
-        priorPos = self.priorPos
-
-        name = "randomly chosen performance"
-
-        performances = list()
-        for _ in range(numPerformances):
-            tnr = random.random()  # true negative rate
-            tpr = random.random()  # true positive rate
-            fpr = 1.0 - tnr  # false positive rate
-            fnr = 1.0 - tpr  # false negative rate
-
-            ptn = tnr * priorNeg  # probability of a true negative
-            pfp = fpr * priorNeg  # probability of a false positive
-            pfn = fnr * priorPos  # probability of a false negative
-            ptp = tpr * priorPos  # probability of a true positive
-
-            p = TwoClassClassificationPerformance(ptn, pfp, pfn, ptp, name=name)
-            performances.append(p)
-
-        return FiniteSetOfTwoClassClassificationPerformances(performances)
+        if rng is None:
+            # Both values are drawn in turn for each performance, as before.
+            values = [random.random() for _ in range(2 * numPerformances)]
+            tnr, tpr = np.array(values, dtype=float).reshape(-1, 2).T
+        else:
+            rng = np.random.default_rng(rng)
+            tnr = rng.random(numPerformances)  # true negative rate
+            tpr = rng.random(numPerformances)  # true positive rate
+        return self._getPerformances(tnr, tpr, name="random performances")
 
     def getMean(self) -> TwoClassClassificationPerformance:
         """
@@ -163,9 +158,6 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors
             performances = list()
             return FiniteSetOfTwoClassClassificationPerformances(performances)
 
-        priorNeg = self.priorNeg
-        priorPos = self.priorPos
-
         if open:
             min_tnr, max_tnr = 0.5 / n, 1.0 - 0.5 / n
             min_tpr, max_tpr = 0.5 / n, 1.0 - 0.5 / n
@@ -173,21 +165,46 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors
             min_tnr, max_tnr = 0.0, 1.0
             min_tpr, max_tpr = 0.0, 1.0
 
-        performances = list()
-        for tnr in np.linspace(min_tnr, max_tnr, n):
-            fpr = 1.0 - tnr
-            for tpr in np.linspace(min_tpr, max_tpr, n):
-                fnr = 1.0 - tpr
+        tnr, tpr = np.meshgrid(
+            np.linspace(min_tnr, max_tnr, n),
+            np.linspace(min_tpr, max_tpr, n),
+            indexing="ij",
+        )
+        return self._getPerformances(tnr.reshape(-1), tpr.reshape(-1))
+
+    def _getNumDimensions(self) -> int:
+        return 2
 
-                ptn = tnr * priorNeg
-                pfp = fpr * priorNeg
-                pfn = fnr * priorPos
-                ptp = tpr * priorPos
+    def _getPerformancesFromUnitHypercube(
+        self, points: np.ndarray
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        return self._getPerformances(
+            points[:, 0], points[:, 1], name="quasi-random performances"
+        )
 
-                p = TwoClassClassificationPerformance(ptn, pfp, pfn, ptp)
-                performances.append(p)
+    def _getPerformances(
+        self, tnr: np.ndarray, tpr: np.ndarray, name: str = "finite set"
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        """
+        Builds, all at once, the performances with the given true negative and true
+        positive rates.
 
-        return FiniteSetOfTwoClassClassificationPerformances(performances)
+        Args:
+            tnr (np.ndarray): The true negative rates.
+            tpr (np.ndarray): The true positive rates, of the same shape.
+            name (str, optional): The name of the set. Defaults to "finite set".
+
+        Returns:
+            FiniteSetOfTwoClassClassificationPerformances: The performances.
+        """
+        priorNeg = self.priorNeg
+        priorPos = self.priorPos
+        array = np.empty(tnr.shape + (4,))
+        array[..., 0] = tnr * priorNeg  # probability of a true negative
+        array[..., 1] = (1.0 - tnr) * priorNeg  # probability of a false positive
+        array[..., 2] = (1.0 - tpr) * priorPos  # probability of a false negative
+        array[..., 3] = tpr * priorPos  # probability of a true positive
+        return FiniteSetOfTwoClassClassificationPerformances(array, name=name)
 
     def getConstraint(self) -> ConstraintFixedClassPriors:
         """
@@ -86,7 +86,9 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedPredictionR
         return p
 
     def drawAtRandom(
-        self, numPerformances: int
+        self,
+        numPerformances: int,
+        rng: np.random.Generator | int | None = None,
     ) -> FiniteSetOfTwoClassClassificationPerformances:
         """
         Draw `numPerformances` two-class classification performances at random,
@@ -94,6 +96,11 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedPredictionR
 
         Args:
             numPerformances (int): the amount of performances to draw.
+            rng (np.random.Generator | int | None, optional): The random generator, or
+                a seed for it. Defaults to None, for the global state of the `random`
+                module, which gives the same performances as before this argument
+                existed. This legacy path draws the values one by one, and is thus
+                much slower than a generator for large amounts of performances.
 
         Returns:
             FiniteSetOfTwoClassClassificationPerformances: the (multi)set.
@@ -101,27 +108,15 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedPredictionR
         assert isinstance(numPerformances, int)
         assert numPerformances >= 0
 
-        rateNeg = self.rateNeg
-        ratePos = self.ratePos
-
-        name = "randomly chosen performance"
-
-        performances = list()
-        for _ in range(numPerformances):
-            val_npv = random.random()  # negative predictive value
-            val_ppv = random.random()  # positive predictive value
-            val_for = 1.0 - val_npv  # false omission rate
-            val_fdr = 1.0 - val_ppv  # false discovery rate
-
-            ptn = val_npv * rateNeg  # probability of a true negative
-            pfp = val_fdr * ratePos  # probability of a false positive
-            pfn = val_for * rateNeg  # probability of a false negative
-            ptp = val_ppv * ratePos  # probability of a true positive
-
-            p = TwoClassClassificationPerformance(ptn, pfp, pfn, ptp, name=name)
-            performances.append(p)
-
-        return FiniteSetOfTwoClassClassificationPerformances(performances)
+        if rng is None:
+            # Both values are drawn in turn for each performance, as before.
+            values = [random.random() for _ in range(2 * numPerformances)]
+            val_npv, val_ppv = np.array(values, dtype=float).reshape(-1, 2).T
+        else:
+            rng = np.random.default_rng(rng)
+            val_npv = rng.random(numPerformances)  # negative predictive value
+            val_ppv = rng.random(numPerformances)  # positive predictive value
+        return self._getPerformances(val_npv, val_ppv, name="random performances")
 
     def getMean(self) -> TwoClassClassificationPerformance:
         """
@@ -163,9 +158,6 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedPredictionR
             performances = list()
             return FiniteSetOfTwoClassClassificationPerformances(performances)
 
-        rateNeg = self.rateNeg
-        ratePos = self.ratePos
-
         if open:
             min_npv, max_npv = 0.5 / n, 1.0 - 0.5 / n
             min_ppv, max_ppv = 0.5 / n, 1.0 - 0.5 / n
@@ -173,21 +165,46 @@ class UniformDistributionOfTwoClassClassificationPerformancesForFixedPredictionR
             min_npv, max_npv = 0.0, 1.0
             min_ppv, max_ppv = 0.0, 1.0
 
-        performances = list()
-        for val_npv in np.linspace(min_npv, max_npv, n):
-            val_for = 1.0 - val_npv
-            for val_ppv in np.linspace(min_ppv, max_ppv, n):
-                val_fdr = 1.0 - val_ppv
+        val_npv, val_ppv = np.meshgrid(
+            np.linspace(min_npv, max_npv, n),
+            np.linspace(min_ppv, max_ppv, n),
+            indexing="ij",
+        )
+        return self._getPerformances(val_npv.reshape(-1), val_ppv.reshape(-1))
+
+    def _getNumDimensions(self) -> int:
+        return 2
 
-                ptn = val_npv * rateNeg  # probability of a true negative
-                pfp = val_fdr * ratePos  # probability of a false positive
-                pfn = val_for * rateNeg  # probability of a false negative
-                ptp = val_ppv * ratePos  # probability of a true positive
+    def _getPerformancesFromUnitHypercube(
+        self, points: np.ndarray
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        return self._getPerformances(
+            points[:, 0], points[:, 1], name="quasi-random performances"
+        )
 
-                p = TwoClassClassificationPerformance(ptn, pfp, pfn, ptp)
-                performances.append(p)
+    def _getPerformances(
+        self, val_npv: np.ndarray, val_ppv: np.ndarray, name: str = "finite set"
+    ) -> FiniteSetOfTwoClassClassificationPerformances:
+        """
+        Builds, all at once, the performances with the given negative and positive
+        predictive values.
 
-        return FiniteSetOfTwoClassClassificationPerformances(performances)
+        Args:
+            val_npv (np.ndarray): The negative predictive values.
+            val_ppv (np.ndarray): The positive predictive values, of the same shape.
+            name (str, optional): The name of the set. Defaults to "finite set".
+
+        Returns:
+            FiniteSetOfTwoClassClassificationPerformances: The performances.
+        """
+        rateNeg = self.rateNeg
+        ratePos = self.ratePos
+        array = np.empty(val_npv.shape + (4,))
+        array[..., 0] = val_npv * rateNeg  # probability of a true negative
+        array[..., 1] = (1.0 - val_ppv) * ratePos  # probability of a false positive
+        array[..., 2] = (1.0 - val_npv) * rateNeg  # probability of a false negative
+        array[..., 3] = val_ppv * ratePos  # probability of a true positive
+        return FiniteSetOfTwoClassClassificationPerformances(array, name=name)
 
     def getConstraint(self) -> ConstraintFixedPredictionRates:
         """
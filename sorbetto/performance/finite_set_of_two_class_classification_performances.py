@@ -1,13 +1,16 @@
 import logging
+from typing import TYPE_CHECKING, Iterator, cast
 
 import numpy as np
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 
 from sorbetto.performance.two_class_classification_performance import (
     TwoClassClassificationPerformance,
 )
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 def _getTpr(tp, fn):  # TODO: remove this
     return tp / (tp + fn)
@@ -26,16 +29,17 @@ class FiniteSetOfTwoClassClassificationPerformances:
         performance_list: list[TwoClassClassificationPerformance] | np.ndarray,
         name: str = "finite set",
     ):
+        # The probabilities are stored in a single (N, 4) array. The performance
+        # objects are only created when they are accessed.
+        self._performance_list: list[TwoClassClassificationPerformance | None]
         if isinstance(performance_list, np.ndarray):
-            self._performance_list = (
-                FiniteSetOfTwoClassClassificationPerformances.from_array(
-                    performance_list
-                ).performance_list
-            )
+            self._array = _check_array(performance_list)
+            self._performance_list = [None] * self._array.shape[0]
         elif isinstance(performance_list, list):
             if len(performance_list) > 0:
                 if isinstance(performance_list[0], TwoClassClassificationPerformance):
-                    self._performance_list = performance_list
+                    self._performance_list = list(performance_list)
+                    self._array = _get_array(performance_list)
                 else:
                     raise ValueError(
                         "The performance list must contain TwoClassClassificationPerformance instances"
@@ -48,48 +52,276 @@ class FiniteSetOfTwoClassClassificationPerformances:
                 "The performance_list must be a list of TwoClassClassificationPerformance instances or a numpy array"
             )
 
+        # The array is a view on a buffer whose capacity is doubled when it is full,
+        # so that appending performances takes an amortized constant time.
+        self._buffer = self._array
+        self._version = 0
+        self._reset_version = 0  # last version that was not an append
+
         self._name = name
-        self._ptn = np.array([perf.ptn for perf in self._performance_list])
-        self._pfp = np.array([perf.pfp for perf in self._performance_list])
-        self._pfn = np.array([perf.pfn for perf in self._performance_list])
-        self._ptp = np.array([perf.ptp for perf in self._performance_list])
+        # The candidates for the k best or worst performances, by (reverse, k).
+        self._candidates: dict[tuple[bool, int], np.ndarray] = {}
 
     @staticmethod
     def from_array(array_tn_fp_fn_tp):
-        performance_list = []
-        for tn, fp, fn, tp in array_tn_fp_fn_tp:
-            performance = TwoClassClassificationPerformance(
-                ptn=tn, pfp=fp, pfn=fn, ptp=tp
-            )
-            performance_list.append(performance)
-        return FiniteSetOfTwoClassClassificationPerformances(performance_list)
+        return FiniteSetOfTwoClassClassificationPerformances(
+            np.asarray(array_tn_fp_fn_tp)
+        )
 
     @property
     def ptn(self) -> np.ndarray:
-        return self._ptn
+        return self._array[:, 0]
 
     @property
     def pfp(self) -> np.ndarray:
-        return self._pfp
+        return self._array[:, 1]
 
     @property
     def pfn(self) -> np.ndarray:
-        return self._pfn
+        return self._array[:, 2]
 
     @property
     def ptp(self) -> np.ndarray:
-        return self._ptp
+        return self._array[:, 3]
+
+    @property
+    def version(self) -> int:
+        """
+        A counter that is increased by each modification of the set: by the number
+        of performances when some are appended, and by one otherwise. Flavors and
+        Tiles compare it to the one of their cached values to know whether these
+        are outdated.
+        """
+        return self._version
+
+    def append(self, performance: TwoClassClassificationPerformance) -> None:
+        """
+        Adds a performance at the end of the set.
+
+        Args:
+            performance (TwoClassClassificationPerformance): The performance.
+        """
+        self.extend([performance])
+
+    def extend(
+        self,
+        performances: "list[TwoClassClassificationPerformance] | np.ndarray | FiniteSetOfTwoClassClassificationPerformances",
+    ) -> None:
+        """
+        Adds some performances at the end of the set.
 
-    # NOTE: if we add or remove a performance, we must call this method
+        Args:
+            performances (list[TwoClassClassificationPerformance] | np.ndarray | FiniteSetOfTwoClassClassificationPerformances):
+                The performances, given as for the constructor, or as another set.
+
+        Raises:
+            ValueError: If the performances are not valid.
+        """
+        if isinstance(performances, FiniteSetOfTwoClassClassificationPerformances):
+            rows = performances.to_array()
+            objects = list(performances._performance_list)
+        elif isinstance(performances, np.ndarray):
+            if performances.size == 0:
+                return
+            rows = _check_array(performances)
+            objects = [None] * rows.shape[0]
+        elif isinstance(performances, list):
+            if not all(
+                isinstance(perf, TwoClassClassificationPerformance)
+                for perf in performances
+            ):
+                raise ValueError(
+                    "The performance list must contain TwoClassClassificationPerformance instances"
+                )
+            rows = _get_array(performances)
+            objects = list(performances)
+        else:
+            raise ValueError(
+                "The performances must be a list of TwoClassClassificationPerformance instances, a numpy array or a finite set"
+            )
+
+        size = len(self)
+        num = rows.shape[0]
+        if size + num > self._buffer.shape[0]:
+            buffer = np.empty((max(size + num, 2 * self._buffer.shape[0]), 4))
+            buffer[:size] = self._array
+            self._buffer = buffer
+        self._buffer[size : size + num] = rows
+        self._array = self._buffer[: size + num]
+        self._performance_list.extend(objects)
+        self._version += num
+        self._candidates = {}
+
+    def pop(self, index: int = -1) -> TwoClassClassificationPerformance:
+        """
+        Removes a performance from the set.
+
+        Args:
+            index (int, optional): The index of the performance. Defaults to -1, the
+                last one.
+
+        Raises:
+            IndexError: If the index is out of range.
+            ValueError: If the set would become empty.
+
+        Returns:
+            TwoClassClassificationPerformance: The removed performance.
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("Index out of range")
+        if size == 1:
+            raise ValueError("The performance list cannot be empty")
+        performance = self[index]
+        # A new array, as the ones returned before must not change.
+        self._array = np.delete(self._array, index, axis=0)
+        self._buffer = self._array
+        del self._performance_list[index]
+        self._onReset()
+        return performance
+
+    def remove(self, performance: TwoClassClassificationPerformance) -> None:
+        """
+        Removes the first performance of the set that is equal to a given one.
+
+        Args:
+            performance (TwoClassClassificationPerformance): The performance.
+
+        Raises:
+            ValueError: If the performance is not in the set, or if the set would
+                become empty.
+        """
+        row = [performance.ptn, performance.pfp, performance.pfn, performance.ptp]
+        matches = np.flatnonzero(
+            np.all(np.isclose(self._array, row, atol=performance.tol), axis=1)
+        )
+        if matches.size == 0:
+            raise ValueError(f"{performance} is not in the set")
+        self.pop(int(matches[0]))
+
+    def getIndicesAppendedSince(self, version: int) -> np.ndarray | None:
+        """
+        Gives the performances that have been appended since a given version, so
+        that the values cached for that version can be completed instead of being
+        recomputed.
+
+        Args:
+            version (int): A previous version of the set.
+
+        Returns:
+            np.ndarray | None: The indices of the appended performances, or None if
+            the set has been modified otherwise since that version.
+        """
+        assert version <= self._version
+        if version < self._reset_version:
+            return None
+        size = len(self)
+        return np.arange(size - (self._version - version), size)
+
+    # NOTE: if the performances of performance_list are modified, this method must
+    # be called. Prefer append, extend, pop and remove.
     def update_probabilities(self):
-        self._ptn = np.array([perf.ptn for perf in self._performance_list])
-        self._pfp = np.array([perf.pfp for perf in self._performance_list])
-        self._pfn = np.array([perf.pfn for perf in self._performance_list])
-        self._ptp = np.array([perf.ptp for perf in self._performance_list])
+        self._array = _get_array(self.performance_list)
+        self._buffer = self._array
+        self._onReset()
+
+    def _onReset(self) -> None:
+        self._version += 1
+        self._reset_version = self._version
+        self._candidates = {}
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns the probabilities of all performances. This is the array in which
+        they are stored, so it must not be modified. It is not modified by the set
+        either: appending performances writes after it, and removing some creates a
+        new array.
+
+        Returns:
+            np.ndarray: An array of shape (N, 4), the last dimension corresponding to
+            (ptn, pfp, pfn, ptp).
+        """
+        return self._array
+
+    def getDominanceMatrix(
+        self, reverse: bool = False, indices: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Tells which performances dominate which other ones, that is, are ranked
+        before them for all ranking scores, equivalent performances being ranked in
+        their order (see `EntityFlavor`). A performance dominates another one when
+        it is better at the four corners of the Tile, and thus everywhere, or when it
+        is at least as good everywhere, comes first in case of equality, and has
+        defined ranking scores everywhere. A performance that is better except on
+        some pixels where both are equivalent, e.g. on the border, does not dominate
+        the ones with a lower index.
+
+        The matrix takes a memory quadratic in the number of performances, and is
+        not cached. The candidates for the best or worst performances (see
+        `getCandidatesForTopK`) are found without it.
+
+        Args:
+            reverse (bool, optional): Whether to consider being worse instead of
+                better. Defaults to False.
+            indices (np.ndarray | None, optional): The indices of the performances to
+                compare, or None for all of them. Defaults to None.
+
+        Returns:
+            np.ndarray: The boolean matrix of shape (M, M) whose element (j, i) tells
+            whether the performance `indices[j]` dominates the performance
+            `indices[i]`.
+        """
+        if indices is None:
+            indices = np.arange(len(self))
+        return _get_dominance_matrix(*self._array.T, indices=indices, reverse=reverse)
+
+    def getCandidatesForTopK(self, k: int) -> np.ndarray:
+        """
+        Gives the performances that can be among the k best ones for some ranking
+        score, that is, those that are dominated by fewer than k performances. The
+        other ones are always ranked after the k-th one, ties being broken by the
+        order of the performances. The result is cached until the set is modified.
+
+        Args:
+            k (int): The number of best performances, at least 1.
+
+        Returns:
+            np.ndarray: The indices of the candidate performances, in increasing
+            order. There are at least min(k, N) of them.
+        """
+        assert k >= 1
+        return self._getCandidates(k, reverse=False)
+
+    def getCandidatesForBottomK(self, k: int) -> np.ndarray:
+        """
+        Gives the performances that can be among the k worst ones for some ranking
+        score, that is, those that are dominated, in the sense of being worse, by
+        fewer than k performances. Among the worst equivalent performances, the last
+        ones are kept. The result is cached until the set is modified.
+
+        Args:
+            k (int): The number of worst performances, at least 1.
+
+        Returns:
+            np.ndarray: The indices of the candidate performances, in increasing
+            order. There are at least min(k, N) of them.
+        """
+        assert k >= 1
+        return self._getCandidates(k, reverse=True)
+
+    def _getCandidates(self, k: int, reverse: bool) -> np.ndarray:
+        if (reverse, k) not in self._candidates:
+            num_dominating = _count_dominating(*self._array.T, limit=k, reverse=reverse)
+            self._candidates[reverse, k] = np.flatnonzero(num_dominating < k)
+        return self._candidates[reverse, k]
 
     @property
     def performance_list(self) -> list[TwoClassClassificationPerformance]:
-        return self._performance_list
+        for index in range(len(self)):
+            self[index]  # creates the missing performances
+        return cast(list[TwoClassClassificationPerformance], self._performance_list)
 
     @property
     def name(self) -> str:
@@ -104,45 +336,86 @@ class FiniteSetOfTwoClassClassificationPerformances:
 
     def getRange(self, score) -> tuple[float, float]:
         try:
-            score_vals = score(
-                [perf.getMassFunction() for perf in self._performance_list]
-            )
+            score_vals = score([perf.getMassFunction() for perf in self])
         except Exception as e:
             logging.warning(
                 f"Warning: issue encountered with vectorized score function: {e}"
             )
 
-            score_vals = [
-                score(perf.getMassFunction()) for perf in self._performance_list
-            ]
+            score_vals = [score(perf.getMassFunction()) for perf in self]
 
         min_val = min(score_vals)
         max_val = max(score_vals)
 
         return (min_val, max_val)
 
-    def drawInROC(self, fig: Figure, ax: Axes):  # and options ?
-        for perf in self._performance_list:
+    def drawInROC(self, fig: "Figure", ax: "Axes"):  # and options ?
+        for perf in self:
             perf.drawInROC(fig, ax)
 
     def __str__(self):
         txt = (
             f"FiniteSetOfTwoClassClassificationPerformances(name={self._name} and "
-            f"performances=\n{'\n'.join(str(self._performance_list[i]) for i in range(len(self._performance_list)))})"
+            f"performances=\n{'\n'.join(str(perf) for perf in self)})"
         )
 
         return txt
 
-    def __iter__(self):
-        return iter(self._performance_list)
+    def __iter__(self) -> Iterator[TwoClassClassificationPerformance]:
+        return (self[index] for index in range(len(self)))
 
     def __getitem__(self, index: int) -> TwoClassClassificationPerformance:
         if index < 0 or index >= len(self._performance_list):
             raise IndexError("Index out of range")
-        return self._performance_list[index]
+        performance = self._performance_list[index]
+        if performance is None:
+            ptn, pfp, pfn, ptp = self._array[index].tolist()
+            performance = TwoClassClassificationPerformance(
+                ptn=ptn, pfp=pfp, pfn=pfn, ptp=ptp
+            )
+            self._performance_list[index] = performance
+        return performance
 
     def __len__(self):
-        return len(self._performance_list)
+        return self._array.shape[0]
+
+
+def _get_array(performance_list: list[TwoClassClassificationPerformance]) -> np.ndarray:
+    """
+    Gathers the probabilities of some performances in an array of shape (N, 4).
+    """
+    return np.array(
+        [[perf.ptn, perf.pfp, perf.pfn, perf.ptp] for perf in performance_list],
+        dtype=float,
+    ).reshape(-1, 4)
+
+
+def _check_array(array: np.ndarray) -> np.ndarray:
+    """
+    Checks, all at once, that the rows of an array are valid performances, with
+    the same conditions as in :class:`TwoClassClassificationPerformance`.
+
+    Args:
+        array (np.ndarray): The array, of shape (N, 4), the last dimension
+            corresponding to (ptn, pfp, pfn, ptp).
+
+    Raises:
+        ValueError: If the array is empty, does not have the right shape, or if one
+            of its rows is not a probability distribution.
+
+    Returns:
+        np.ndarray: A C-contiguous copy of the array, in double precision.
+    """
+    if array.ndim != 2 or array.shape[1] != 4:
+        raise ValueError(f"The array must be of shape (N, 4), got {array.shape}")
+    if array.shape[0] == 0:
+        raise ValueError("The performance list cannot be empty")
+    array = np.array(array, dtype=float, order="C")
+    if not np.all(array >= 0.0):
+        raise ValueError("The probabilities must be non-negative")
+    if not np.all(np.abs(np.sum(array, axis=1) - 1.0) <= 1e-8):
+        raise ValueError("The probabilities of each performance must sum to 1")
+    return array
 
 
 def _parse_performance(
@@ -185,6 +458,136 @@ def _parse_performance(
     return ptn_, pfp_, pfn_, ptp_
 
 
+def _get_dominance(
+    ptn: np.ndarray,
+    pfp: np.ndarray,
+    pfn: np.ndarray,
+    ptp: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    reverse: bool = False,
+) -> np.ndarray:
+    """
+    Computes which performances dominate which other ones, that is, which ones are
+    ranked before them for all ranking scores. The comparison of two performances,
+    :math:`S_j U_i - S_i U_j` with :math:`S = itn ptn + itp ptp` and
+    :math:`U = ifp pfp + ifn pfn`, is bilinear in the canonical importances, so it
+    is positive for all importances when it is positive at the four corners of the
+    Tile, where each of :math:`S` and :math:`U` reduces to one probability.
+
+    When it is only non-negative at the corners, the two performances may be
+    equivalent somewhere, where they are ranked in their order, and the ranking
+    score of one of them may be undefined somewhere, where it is ranked last. The
+    performance j then dominates the performance i only if it comes first in case of
+    equality (it has a lower index, or a higher one when `reverse`) and the one that
+    is ranked first has defined ranking scores at the four corners, and thus
+    everywhere. This also keeps the relation acyclic.
+
+    Args:
+        ptn (np.ndarray): The probabilities of true negatives, of shape (N,).
+        pfp (np.ndarray): The probabilities of false positives, of shape (N,).
+        pfn (np.ndarray): The probabilities of false negatives, of shape (N,).
+        ptp (np.ndarray): The probabilities of true positives, of shape (N,).
+        rows (np.ndarray): The indices j of the dominating performances, of shape
+            (R,).
+        columns (np.ndarray): The indices i of the dominated performances, of shape
+            (C,).
+        reverse (bool, optional): Whether to compute the dominance for being worse
+            instead of better. Defaults to False.
+
+    Returns:
+        np.ndarray: The boolean matrix of shape (R, C) whose element (j, i) tells
+        whether the performance `rows[j]` dominates the performance `columns[i]`.
+    """
+    better = np.ones((rows.shape[0], columns.shape[0]), dtype=bool)
+    at_least_as_good = np.ones_like(better)
+    defined_rows = np.ones(rows.shape[0], dtype=bool)
+    defined_columns = np.ones(columns.shape[0], dtype=bool)
+    for satisfying in (ptn, ptp):
+        for unsatisfying in (pfp, pfn):
+            comparison = (
+                satisfying[rows, np.newaxis] * unsatisfying[np.newaxis, columns]
+                - satisfying[np.newaxis, columns] * unsatisfying[rows, np.newaxis]
+            )
+            if reverse:
+                np.negative(comparison, out=comparison)
+            better &= comparison > 0.0
+            at_least_as_good &= comparison >= 0.0
+            defined_rows &= satisfying[rows] + unsatisfying[rows] > 0.0
+            defined_columns &= satisfying[columns] + unsatisfying[columns] > 0.0
+    if reverse:
+        # j comes after i in case of equality, and i is ranked first.
+        first = rows[:, np.newaxis] > columns[np.newaxis, :]
+        first &= defined_columns[np.newaxis, :]
+    else:
+        first = rows[:, np.newaxis] < columns[np.newaxis, :]
+        first &= defined_rows[:, np.newaxis]
+    return better | (at_least_as_good & first)
+
+
+def _get_dominance_matrix(
+    ptn: np.ndarray,
+    pfp: np.ndarray,
+    pfn: np.ndarray,
+    ptp: np.ndarray,
+    indices: np.ndarray,
+    reverse: bool = False,
+) -> np.ndarray:
+    """
+    Computes the dominance matrix (see `_get_dominance`) between some performances,
+    by blocks of rows, so that only the boolean matrix takes a memory quadratic in
+    their number.
+
+    Returns:
+        np.ndarray: The boolean matrix of shape (M, M) whose element (j, i) tells
+        whether the performance `indices[j]` dominates the performance `indices[i]`.
+    """
+    num = indices.shape[0]
+    out = np.empty((num, num), dtype=bool)
+    block_size = max((1 << 20) // max(num, 1), 1)
+    for start in range(0, num, block_size):
+        rows = slice(start, min(start + block_size, num))
+        out[rows] = _get_dominance(
+            ptn, pfp, pfn, ptp, indices[rows], indices, reverse=reverse
+        )
+    return out
+
+
+def _count_dominating(
+    ptn: np.ndarray,
+    pfp: np.ndarray,
+    pfn: np.ndarray,
+    ptp: np.ndarray,
+    limit: int,
+    reverse: bool = False,
+) -> np.ndarray:
+    """
+    Counts the performances that dominate each performance (see `_get_dominance`),
+    up to a limit, in a memory linear in their number. The dominating performances
+    are compared by blocks, the likely best ones first (by accuracy), and the
+    performances that are dominated `limit` times are not compared anymore, so that
+    few comparisons are done for a small limit.
+
+    Returns:
+        np.ndarray: The numbers of dominating performances, of shape (N,). Those that
+        are at least `limit` are not exact.
+    """
+    num = ptn.shape[0]
+    counts = np.zeros(num, dtype=np.int64)
+    active = np.arange(num)  # the performances dominated less than `limit` times
+    accuracy = ptn + ptp
+    order = np.argsort(accuracy if reverse else -accuracy, kind="stable")
+    start = 0
+    while start < num and active.size > 0:
+        block_size = max((1 << 20) // active.size, 1)
+        rows = order[start : start + block_size]
+        start += block_size
+        dominance = _get_dominance(ptn, pfp, pfn, ptp, rows, active, reverse=reverse)
+        counts[active] += np.count_nonzero(dominance, axis=0)
+        active = active[counts[active] < limit]
+    return counts
+
+
 if __name__ == "__main__":
     import numpy as np
 
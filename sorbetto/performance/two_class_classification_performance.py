@@ -1,13 +1,15 @@
 import math
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 import numpy as np
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 
 from sorbetto.performance.abstract_performance import AbstractPerformance
 from sorbetto.performance.roc import _setupROC
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class TwoClassClassificationPerformance(AbstractPerformance):
     """A two-class (crisp) classification performance :math:`P` is a probability measure over the measurable space :math:`(\\Omega,\\Sigma)` where the sample (a.k.a. universe) is :math:`\\Omega=\\{tn,fp,fn,tp\\}` and the event space is :math:`\\Sigma=2^\\Omega`.
@@ -182,7 +184,7 @@ class TwoClassClassificationPerformance(AbstractPerformance):
     ) -> "TwoClassClassificationPerformance":
         raise NotImplementedError()
 
-    def drawInROC(self, fig: Figure, ax: Axes) -> None:
+    def drawInROC(self, fig: "Figure", ax: "Axes") -> None:
         """
         See https://en.wikipedia.org/wiki/Receiver_operating_characteristic
 
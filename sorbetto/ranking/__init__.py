@@ -1,9 +1,11 @@
 from .abstract_ranking import AbstractRanking
+from .partition_into_ranking_cells import PartitionIntoRankingCells
 from .ranking_induced_by_score import RankingInducedByScore
 from .ranking_score import RankingScore
 
 __all__ = [
     "AbstractRanking",
+    "PartitionIntoRankingCells",
     "RankingInducedByScore",
     "RankingScore",
 ]
@@ -1,13 +1,15 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable as iterable
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 
 from sorbetto.core.entity import Entity
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class AbstractRanking(ABC):
     """
@@ -84,10 +86,12 @@ class AbstractRanking(ABC):
 
     def draw(
         self,
-        fig: Figure | None = None,
-        ax: Axes | None = None,
+        fig: "Figure | None" = None,
+        ax: "Axes | None" = None,
         value_axis_label: str = "",
-    ) -> tuple[Figure, Axes]:
+    ) -> "tuple[Figure, Axes]":
+        import matplotlib.pyplot as plt
+
         if fig is None:
             fig = plt.figure()
             ax = fig.gca()
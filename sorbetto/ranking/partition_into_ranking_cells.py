@@ -0,0 +1,437 @@
+import numpy as np
+
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+class PartitionIntoRankingCells:
+    """
+    The partition of the Tile with the default parameterization, that is the square
+    :math:`(a, b) \\in [0, 1]^2`, into cells in which the ranking of a finite set of
+    performances is constant. The borders of the cells are pieces of the bilinear
+    curves on which two performances are equivalent (see
+    :meth:`RankingScore.equivalent`).
+
+    The partition is the vertical decomposition of the arrangement of these curves.
+    For a fixed :math:`a`, the satisfying part of the ranking scores is constant and
+    their unsatisfying part is linear in :math:`b`, so the curve of two performances
+    crosses any vertical line at most once. The square is cut into vertical slabs at
+    the abscissas where two curves cross, where a curve enters or leaves the square,
+    and where a curve has a vertical asymptote. Inside a slab, the curves do not cross
+    and are ordered along :math:`b`, and the cells are the regions between two
+    consecutive curves.
+
+    Once built, the partition gives the ranking at any point exactly, without
+    evaluating the ranking scores, so that Entity and Ranking Tiles can be rasterized
+    at any resolution or zoom in a time proportional to the number of pixels.
+    Entities that are equivalent everywhere are ranked in the order of the list, as
+    in :meth:`EntityFlavor.getAllEntities`.
+
+    The size of the partition grows quickly with the number N of entities: there are
+    up to :math:`N(N-1)/2` curves, which cross each other, so that the number of
+    slabs and the number of cells grow as :math:`O(N^4)` in the worst case. For
+    performances drawn uniformly at random, there are about 250 thousand cells for
+    20 entities and 3 million for 30 entities, each one storing a ranking of the N
+    entities. The construction therefore stops with a ValueError as soon as the
+    number of cells exceeds `max_cells`, before storing the rankings.
+    """
+
+    def __init__(
+        self,
+        performances: FiniteSetOfTwoClassClassificationPerformances | np.ndarray,
+        max_cells: int | None = 4_000_000,
+    ):
+        """
+        Builds the partition.
+
+        Args:
+            performances (FiniteSetOfTwoClassClassificationPerformances | np.ndarray):
+                The performances of the entities to rank. If an array is given, it
+                must be of shape (N, 4), the last dimension corresponding to
+                (ptn, pfp, pfn, ptp).
+            max_cells (int | None, optional): The maximum number of cells. None means
+                no limit. Defaults to 4 million, about 1 GB for 30 entities.
+
+        Raises:
+            ValueError: If the partition has more than `max_cells` cells.
+        """
+        if isinstance(performances, FiniteSetOfTwoClassClassificationPerformances):
+            array = np.stack(
+                [
+                    performances.ptn,
+                    performances.pfp,
+                    performances.pfn,
+                    performances.ptp,
+                ],
+                axis=-1,
+            )
+        else:
+            array = np.asarray(performances, dtype=float)
+        assert array.ndim == 2 and array.shape[1] == 4
+        assert array.shape[0] >= 1
+        self._performances = array
+        if max_cells is not None:
+            if (not isinstance(max_cells, int)) or max_cells <= 0:
+                raise TypeError(
+                    f"max_cells must be None or a strictly positive integer, got {max_cells!r}"
+                )
+        self._max_cells = max_cells
+        # The rankings are stored with the smallest type that fits, as there is one
+        # per cell.
+        self._index_dtype = np.int16 if array.shape[0] < 2**15 else np.int32
+
+        self._computeCurves()
+        self._computeSlabs()
+        self._computeCells()
+
+    @property
+    def num_entities(self) -> int:
+        return self._performances.shape[0]
+
+    @property
+    def num_cells(self) -> int:
+        return self._cell_entities.shape[0]
+
+    @property
+    def slab_bounds(self) -> np.ndarray:
+        """
+        The abscissas :math:`a` that delimit the vertical slabs, in increasing order,
+        from 0 to 1.
+        """
+        return self._slab_bounds
+
+    @property
+    def cell_entities(self) -> np.ndarray:
+        """
+        The rankings in the cells, of shape (num_cells, N). Each row gives the
+        indices of the entities, from the best one to the worst one.
+        """
+        return self._cell_entities
+
+    def _computeCurves(self) -> None:
+        """
+        Computes the coefficients of the bilinear curves
+        :math:`K_{ab} a b + K_a a + K_b b + K = 0` on which two performances are
+        equivalent, for all pairs of performances, as in
+        :meth:`RankingScore.equivalent`. The curves of the pairs of performances that
+        are equivalent everywhere are dropped.
+        """
+        i, j = np.triu_indices(self.num_entities, k=1)
+        curves = RankingScore.equivalentPairwise(
+            self._performances, np.stack([i, j], axis=-1)
+        )
+        coefficients = np.stack([curves.K, curves.Kx, curves.Ky, curves.Kxy], axis=-1)
+        keep = np.any(coefficients != 0.0, axis=-1)
+        self._curve_entities = np.stack([i[keep], j[keep]], axis=-1)
+        self._curve_coefficients = coefficients[keep]
+
+    def _getCurvesY(self, curves: np.ndarray, a: np.ndarray) -> np.ndarray:
+        """
+        Computes the ordinates :math:`b = -(K + K_a a) / (K_b + K_{ab} a)` of some
+        curves at some abscissas.
+
+        Args:
+            curves (np.ndarray): The indices of the curves, of shape (M,).
+            a (np.ndarray): The abscissas, of shape (P,).
+
+        Returns:
+            np.ndarray: The ordinates, of shape (P, M). They are infinite or NaN where
+            a curve is vertical.
+        """
+        K, Ka, Kb, Kab = self._curve_coefficients[curves].T
+        a = a[:, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -(K + Ka * a) / (Kb + Kab * a)
+
+    def _computeSlabs(self) -> None:
+        """
+        Computes the vertical slabs and, for each slab, the curves that cross it,
+        ordered along :math:`b`.
+        """
+        K, Ka, Kb, Kab = self._curve_coefficients.T
+        events = [np.array([0.0, 1.0])]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            events.append(-K / Ka)  # the curves cross b = 0
+            events.append(-(K + Kb) / (Ka + Kab))  # the curves cross b = 1
+            events.append(-Kb / Kab)  # the curves have a vertical asymptote
+
+            # Two curves, K1 + Ka1 a + (Kb1 + Kab1 a) b = 0 and similarly for the
+            # second one, cross where (K1 + Ka1 a) (Kb2 + Kab2 a) equals
+            # (K2 + Ka2 a) (Kb1 + Kab1 a), a quadratic equation in a.
+            num_curves = K.size
+            for m in range(num_curves - 1):
+                others = slice(m + 1, num_curves)
+                c0 = K[m] * Kb[others] - K[others] * Kb[m]
+                c1 = (
+                    K[m] * Kab[others]
+                    + Ka[m] * Kb[others]
+                    - K[others] * Kab[m]
+                    - Ka[others] * Kb[m]
+                )
+                c2 = Ka[m] * Kab[others] - Ka[others] * Kab[m]
+                discriminant = c1 * c1 - 4.0 * c2 * c0
+                real = discriminant >= 0.0
+                c0, c1, c2 = c0[real], c1[real], c2[real]
+                q = -0.5 * (c1 + np.copysign(np.sqrt(discriminant[real]), c1))
+                roots = np.concatenate([q / c2, c0 / q])
+                roots = roots[(roots > 0.0) & (roots < 1.0)]
+                if roots.size > 0:
+                    # Only the crossings inside the square matter.
+                    b = self._getCurvesY(np.array([m]), roots)[:, 0]
+                    events.append(roots[(b >= 0.0) & (b <= 1.0)])
+
+        events = np.concatenate(events)
+        events = np.unique(events[(events >= 0.0) & (events <= 1.0)])
+        # Slabs thinner than the numerical precision are merged with their neighbor.
+        keep = np.ones(events.shape, dtype=bool)
+        keep[1:] = np.diff(events) > 1e-12
+        keep[-1] = True
+        events = events[keep]
+        if events.size > 2 and events[-1] - events[-2] <= 1e-12:
+            events = np.delete(events, -2)
+        self._slab_bounds = events
+
+        # The curves that cross a slab are those that are in the square at its middle.
+        # There is one more cell than there are curves in each slab.
+        all_curves = np.arange(self._curve_coefficients.shape[0], dtype=np.int32)
+        middles = 0.5 * (events[:-1] + events[1:])
+        num_cells = middles.size
+        self._checkNumCells(num_cells)
+        slab_curves = []
+        num_slab_curves = np.zeros(middles.size, dtype=np.intp)
+        chunk_size = 1024
+        for start in range(0, middles.size, chunk_size):
+            b = self._getCurvesY(all_curves, middles[start : start + chunk_size])
+            inside = (b > 0.0) & (b < 1.0)
+            num_cells += np.count_nonzero(inside)
+            self._checkNumCells(num_cells)
+            for row in range(b.shape[0]):
+                curves = all_curves[inside[row]]
+                curves = curves[np.argsort(b[row, curves], kind="stable")]
+                slab_curves.append(curves)
+                num_slab_curves[start + row] = curves.size
+        self._slab_curves = (
+            np.concatenate(slab_curves) if slab_curves else np.zeros(0, dtype=np.int32)
+        )
+        self._slab_curve_offsets = np.concatenate([[0], np.cumsum(num_slab_curves)])
+
+    def _checkNumCells(self, num_cells: int) -> None:
+        """
+        Stops the construction when the partition has too many cells.
+
+        Args:
+            num_cells (int): A lower bound of the number of cells.
+
+        Raises:
+            ValueError: If there are more than `max_cells` cells.
+        """
+        if self._max_cells is not None and num_cells > self._max_cells:
+            raise ValueError(
+                f"The partition of the Tile for {self.num_entities} entities has more "
+                f"than {self._max_cells} cells (max_cells). Rasterize the Tile with "
+                "the flavors instead, or raise max_cells."
+            )
+
+    def _computeCells(self) -> None:
+        """
+        Computes the ranking in each cell, by evaluating the ranking scores at one
+        point inside the cell. This is done for a chunk of cells at a time, to bound
+        the memory used by the values of the ranking scores.
+        """
+        num_slabs = self._slab_bounds.size - 1
+        offsets = self._slab_curve_offsets
+        # There is one more cell than there are curves in each slab.
+        self._cell_offsets = offsets + np.arange(num_slabs + 1)
+
+        middles = 0.5 * (self._slab_bounds[:-1] + self._slab_bounds[1:])
+        points_a = []
+        points_b = []
+        for s in range(num_slabs):
+            curves = self._slab_curves[offsets[s] : offsets[s + 1]]
+            b = self._getCurvesY(curves, middles[s : s + 1])[0]
+            borders = np.concatenate([[0.0], b, [1.0]])
+            points_a.append(np.full(curves.size + 1, middles[s]))
+            points_b.append(0.5 * (borders[:-1] + borders[1:]))
+        a = np.concatenate(points_a)
+        b = np.concatenate(points_b)
+
+        num_entities = self.num_entities
+        ptn, pfp, pfn, ptp = self._performances.T
+        a = a[:, np.newaxis]
+        b = b[:, np.newaxis]
+        self._cell_entities = np.empty((a.size, num_entities), self._index_dtype)
+        self._cell_ranks = np.empty((a.size, num_entities), self._index_dtype)
+        ranks = np.arange(1, num_entities + 1, dtype=self._index_dtype)
+        chunk_size = max((1 << 22) // num_entities, 1)
+        for start in range(0, a.size, chunk_size):
+            cells = slice(start, start + chunk_size)
+            values = RankingScore._compute(
+                itn=1.0 - a[cells],
+                ifp=1.0 - b[cells],
+                ifn=b[cells],
+                itp=a[cells],
+                ptn=ptn,
+                pfp=pfp,
+                pfn=pfn,
+                ptp=ptp,
+            )
+            np.negative(values, out=values)
+            entities = np.argsort(values, axis=1, kind="stable")
+            self._cell_entities[cells] = entities
+            np.put_along_axis(self._cell_ranks[cells], entities, ranks, axis=1)
+
+    def getCellIds(self, param1: np.ndarray, param2: np.ndarray) -> np.ndarray:
+        """
+        Finds the cells that contain some points. A point on the border between
+        cells is assigned to one of them.
+
+        Args:
+            param1 (np.ndarray): The values of :math:`a`, between 0 and 1.
+            param2 (np.ndarray): The values of :math:`b`, between 0 and 1, with a
+                shape that can be broadcast with the one of `param1`.
+
+        Returns:
+            np.ndarray: The indices of the cells, with the broadcast shape.
+        """
+        a, b = np.broadcast_arrays(
+            np.asarray(param1, dtype=float), np.asarray(param2, dtype=float)
+        )
+        assert np.all((a >= 0.0) & (a <= 1.0))
+        assert np.all((b >= 0.0) & (b <= 1.0))
+        shape = a.shape
+        a = a.ravel()
+        b = b.ravel()
+
+        bounds = self._slab_bounds
+        num_slabs = bounds.size - 1
+        slabs = np.clip(np.searchsorted(bounds, a, side="right") - 1, 0, num_slabs - 1)
+        counts = np.zeros(a.shape, dtype=np.intp)
+
+        # The points are processed slab by slab. In a slab, the ordinates of the
+        # curves are computed once per distinct abscissa, and the number of curves
+        # below each point is found with a single binary search, by shifting each
+        # abscissa to its own range of values.
+        order = np.argsort(slabs, kind="stable")
+        used_slabs, starts = np.unique(slabs[order], return_index=True)
+        stops = np.append(starts[1:], order.size)
+        for s, start, stop in zip(used_slabs, starts, stops):
+            curves = self._slab_curves[
+                self._slab_curve_offsets[s] : self._slab_curve_offsets[s + 1]
+            ]
+            if curves.size == 0:
+                continue
+            points = order[start:stop]
+            # The abscissas are moved slightly inside the slab, where the curves are
+            # well defined.
+            margin = 1e-9 * (bounds[s + 1] - bounds[s])
+            abscissas, inverse = np.unique(
+                np.clip(a[points], bounds[s] + margin, bounds[s + 1] - margin),
+                return_inverse=True,
+            )
+            ordinates = np.sort(
+                np.clip(self._getCurvesY(curves, abscissas), -1.0, 2.0), axis=1
+            )
+            shifts = 4.0 * np.arange(abscissas.size)
+            keys = (ordinates + shifts[:, np.newaxis]).ravel()
+            positions = np.searchsorted(keys, b[points] + shifts[inverse], side="left")
+            counts[points] = positions - inverse * curves.size
+
+        return (self._cell_offsets[slabs] + counts).reshape(shape)
+
+    def getAllEntities(self, param1: np.ndarray, param2: np.ndarray) -> np.ndarray:
+        """
+        Gives the entities at all ranks, for some points of the Tile. This is the
+        exact counterpart of :meth:`EntityFlavor.getAllEntities`.
+
+        Args:
+            param1 (np.ndarray): The values of :math:`a`, between 0 and 1.
+            param2 (np.ndarray): The values of :math:`b`, between 0 and 1.
+
+        Returns:
+            np.ndarray: The indices of the entities plus one, of shape (N, ...), where
+            the first dimension corresponds to the ranks, from 1 to N.
+        """
+        cells = self.getCellIds(param1, param2)
+        return np.moveaxis(self._cell_entities[cells], -1, 0) + 1
+
+    def getAllRanks(self, param1: np.ndarray, param2: np.ndarray) -> np.ndarray:
+        """
+        Gives the ranks of all entities, for some points of the Tile. This is the
+        exact counterpart of :meth:`RankingFlavor.getAllRanks`.
+
+        Args:
+            param1 (np.ndarray): The values of :math:`a`, between 0 and 1.
+            param2 (np.ndarray): The values of :math:`b`, between 0 and 1.
+
+        Returns:
+            np.ndarray: The ranks, of shape (N, ...), where the first dimension
+            corresponds to the entities.
+        """
+        cells = self.getCellIds(param1, param2)
+        return np.moveaxis(self._cell_ranks[cells], -1, 0)
+
+    def getCellPolygon(self, cell_id: int, num_points: int = 16) -> np.ndarray:
+        """
+        Gives a polygon that approximates the border of a cell. The vertical sides
+        are exact, the other sides are sampled on the curves.
+
+        Args:
+            cell_id (int): The index of the cell.
+            num_points (int, optional): The number of points sampled on the bottom
+                and top sides. Defaults to 16.
+
+        Returns:
+            np.ndarray: The vertices of the polygon, in counterclockwise order, of
+            shape (2 * num_points, 2).
+        """
+        assert 0 <= cell_id < self.num_cells
+        assert num_points >= 2
+        s = int(np.searchsorted(self._cell_offsets, cell_id, side="right")) - 1
+        position = cell_id - self._cell_offsets[s]  # number of curves below the cell
+        curves = self._slab_curves[
+            self._slab_curve_offsets[s] : self._slab_curve_offsets[s + 1]
+        ]
+        a_min, a_max = self._slab_bounds[s], self._slab_bounds[s + 1]
+        a = np.linspace(a_min, a_max, num_points)
+        margin = 1e-9 * (a_max - a_min)
+        a_inside = np.clip(a, a_min + margin, a_max - margin)
+
+        if position == 0:
+            bottom = np.zeros(num_points)
+        else:
+            bottom = self._getCurvesY(curves[position - 1 : position], a_inside)[:, 0]
+        if position == curves.size:
+            top = np.ones(num_points)
+        else:
+            top = self._getCurvesY(curves[position : position + 1], a_inside)[:, 0]
+        bottom = np.clip(bottom, 0.0, 1.0)
+        top = np.clip(top, 0.0, 1.0)
+        return np.concatenate(
+            [np.stack([a, bottom], axis=-1), np.stack([a, top], axis=-1)[::-1]]
+        )
+
+    def getCells(self, num_points: int = 16) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Gives all cells, with their polygons and rankings.
+
+        Args:
+            num_points (int, optional): The number of points sampled on the bottom
+                and top sides of the polygons. Defaults to 16.
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: For each cell, its polygon (see
+            :meth:`getCellPolygon`) and the indices of the entities, from the best
+            one to the worst one.
+        """
+        return [
+            (self.getCellPolygon(cell_id, num_points), self._cell_entities[cell_id])
+            for cell_id in range(self.num_cells)
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"partition of the Tile into {self.num_cells} ranking cells, for "
+            f"{self.num_entities} entities"
+        )
@@ -1,12 +1,16 @@
+from typing import TYPE_CHECKING
+
 import numpy as np
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 
 from sorbetto.core.performance_ordering_induced_by_one_score import (
     PerformanceOrderingInducedByOneScore,
 )
 from sorbetto.ranking.abstract_ranking import AbstractRanking
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class RankingInducedByScore(AbstractRanking):
     """
@@ -97,10 +101,10 @@ class RankingInducedByScore(AbstractRanking):
 
     def draw(
         self,
-        fig: Figure | None = None,
-        ax: Axes | None = None,
+        fig: "Figure | None" = None,
+        ax: "Axes | None" = None,
         value_axis_label: str = "",
-    ) -> tuple[Figure, Axes]:
+    ) -> "tuple[Figure, Axes]":
         if value_axis_label == "":
             score = self.performance_ordering.score
             value_axis_label = 'Value taken by the score\n"{}"'.format(score.name)
@@ -2,12 +2,12 @@ import logging
 import math
 from typing import cast, overload
 
-import matplotlib.pyplot as plt
 import numpy as np
-from mpl_toolkits.axes_grid1 import make_axes_locatable
+from numpy.typing import DTypeLike
 
 from sorbetto.core.importance import Importance, _parse_importance
 from sorbetto.geometry.bilinear_curve import BilinearCurve
+from sorbetto.geometry.bilinear_curve_collection import BilinearCurveCollection
 from sorbetto.geometry.conic import Conic
 from sorbetto.geometry.line import Line
 from sorbetto.geometry.pencil_of_lines import PencilOfLines
@@ -129,6 +129,43 @@ class RankingScore(AbstractScore):
         # return Conic(0.0, Kab, 0.0, Ka, Kb, K, "equivalent")
         return BilinearCurve(Kab, Ka, Kb, K, "equivalent")
 
+    @staticmethod
+    def equivalentPairwise(
+        performances: FiniteSetOfTwoClassClassificationPerformances | np.ndarray,
+        pairs: np.ndarray | None = None,
+    ) -> BilinearCurveCollection:
+        """
+        Computes at once, for many pairs of performances, the curves of
+        :meth:`equivalent`, on the Tile with the default parameterization.
+
+        Args:
+            performances (FiniteSetOfTwoClassClassificationPerformances | np.ndarray):
+                The performances. If an array is given, it must be of shape (N, 4),
+                the last dimension corresponding to (ptn, pfp, pfn, ptp).
+            pairs (np.ndarray | None, optional): The indices (i, j) of the pairs of
+                performances, of shape (M, 2). Defaults to None, for all pairs with
+                i < j, in lexicographic order.
+
+        Returns:
+            BilinearCurveCollection: the curves, in the order of the pairs.
+        """
+        if isinstance(performances, FiniteSetOfTwoClassClassificationPerformances):
+            performances = performances.to_array()
+        ptn, pfp, pfn, ptp = np.asarray(performances, dtype=float).T
+        if pairs is None:
+            i, j = np.triu_indices(len(ptn), k=1)
+        else:
+            i, j = np.asarray(pairs).reshape(-1, 2).T
+
+        # Same coefficients as in `equivalent`, with p1 = i and p2 = j.
+        K = ptn[i] * pfp[j] - ptn[j] * pfp[i]
+        Ka = (ptp[i] - ptn[i]) * pfp[j] - (ptp[j] - ptn[j]) * pfp[i]
+        Kb = ptn[i] * (pfn[j] - pfp[j]) - ptn[j] * (pfn[i] - pfp[i])
+        Kab = (ptp[i] - ptn[i]) * (pfn[j] - pfp[j]) - (ptp[j] - ptn[j]) * (
+            pfn[i] - pfp[i]
+        )
+        return BilinearCurveCollection(Kab, Ka, Kb, K, "equivalent")
+
     def isCanonical(self, tol=1e-8) -> bool:
         """
         See :cite:t:`Pierard2024TheTile-arxiv`, Definition 1.
@@ -167,6 +204,9 @@ class RankingScore(AbstractScore):
             show_priors (bool, optional): _description_. Defaults to True.
             show_unbiased (bool, optional): _description_. Defaults to True.
         """
+        # Imported here, so that the scores can be computed without Pyplot.
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
 
         assert isinstance(show_values_map, bool)
         assert isinstance(show_iso_value_lines, bool)
@@ -282,6 +322,10 @@ class RankingScore(AbstractScore):
     def _compute(
         importance: Importance,
         performance: TwoClassClassificationPerformance,
+        *,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> float: ...
 
     # Importance + Performance mixed
@@ -290,6 +334,10 @@ class RankingScore(AbstractScore):
     def _compute(
         importance: Importance,
         performance: FiniteSetOfTwoClassClassificationPerformances | np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> np.ndarray: ...
 
     @overload
@@ -297,6 +345,10 @@ class RankingScore(AbstractScore):
     def _compute(
         importance: list[Importance] | np.ndarray,
         performance: TwoClassClassificationPerformance,
+        *,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> np.ndarray: ...
 
     # Importance + Performance array mode
@@ -305,6 +357,10 @@ class RankingScore(AbstractScore):
     def _compute(
         importance: list[Importance] | np.ndarray,
         performance: FiniteSetOfTwoClassClassificationPerformances | np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> np.ndarray: ...
 
     # I=float, P=float → float
@@ -320,6 +376,9 @@ class RankingScore(AbstractScore):
         pfp: float,
         pfn: float,
         ptp: float,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> float: ...
 
     # I=float, P=np.ndarray → ndarray
@@ -335,6 +394,9 @@ class RankingScore(AbstractScore):
         pfp: np.ndarray,
         pfn: np.ndarray,
         ptp: np.ndarray,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> np.ndarray: ...
 
     # I=np.ndarray, P=float → ndarray
@@ -350,6 +412,9 @@ class RankingScore(AbstractScore):
         pfp: float,
         pfn: float,
         ptp: float,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> np.ndarray: ...
 
     # I=np.ndarray, P=np.ndarray → ndarray
@@ -365,11 +430,14 @@ class RankingScore(AbstractScore):
         pfp: np.ndarray,
         pfn: np.ndarray,
         ptp: np.ndarray,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ) -> np.ndarray: ...
 
     @staticmethod
     def _compute(
-        importance: Importance | list[Importance] | np.ndarray | None = None,
+        importance: Importance | list[Importance] | np.ndarray | tuple | None = None,
         performance: TwoClassClassificationPerformance
         | FiniteSetOfTwoClassClassificationPerformances
         | np.ndarray
@@ -382,16 +450,141 @@ class RankingScore(AbstractScore):
         pfp: float | np.ndarray | None = None,
         pfn: float | np.ndarray | None = None,
         ptp: float | np.ndarray | None = None,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike | None = None,
+        work: np.ndarray | None = None,
     ):
+        """
+        Computes the value of the ranking score(s) for the given importance(s) and
+        performance(s).
+
+        Args:
+            importance (Importance | list[Importance] | np.ndarray | tuple | None, optional):
+                The importance(s): an array of shape (..., 4), the last dimension
+                corresponding to (itn, ifp, ifn, itp), or these four arrays as a
+                tuple whose shapes broadcast together, e.g. as given by
+                :meth:`_prepareImportance`. Either this or all of itn, ifp, ifn,
+                itp must be provided. Defaults to None.
+            performance (TwoClassClassificationPerformance | FiniteSetOfTwoClassClassificationPerformances | np.ndarray | None, optional):
+                The performance(s). Either this or all of ptn, pfp, pfn, ptp must be
+                provided. Defaults to None.
+            itn, ifp, ifn, itp (float | np.ndarray | None, optional): The importances
+                of the four cases. Defaults to None.
+            ptn, pfp, pfn, ptp (float | np.ndarray | None, optional): The
+                probabilities of the four cases. Defaults to None.
+            out (np.ndarray | None, optional): A buffer, with the shape of the
+                result, in which the result is written. Defaults to None, in which
+                case a new array is allocated.
+            dtype (DTypeLike | None, optional): The floating point type used for the
+                computations (e.g., np.float32 when the values are only displayed).
+                Defaults to None, in which case the type of `out` is used if given,
+                and float64 otherwise.
+            work (np.ndarray | None, optional): A scratch buffer, of shape
+                (2, *shape) where shape is the one of the result, and of the type of
+                the result, that is overwritten during the computations. Defaults to
+                None, in which case it is allocated when needed.
+
+        Raises:
+            ValueError: If `out` or `work` does not have the shape or the type of
+                the result.
+
+        Returns:
+            float | np.ndarray: The value(s) of the ranking score(s).
+        """
         itn, ifp, ifn, itp = _parse_importance(
             importance=importance, itn=itn, ifp=ifp, ifn=ifn, itp=itp
         )
         ptn, pfp, pfn, ptp = _parse_performance(
             performance=performance, ptn=ptn, pfp=pfp, pfn=pfn, ptp=ptp
         )
-        satisfying = ptn * itn + ptp * itp
-        unsatisfying = pfp * ifp + pfn * ifn
-        return satisfying / (satisfying + unsatisfying)
+        if dtype is None and out is not None:
+            dtype = out.dtype
+        if dtype is not None:
+            itn, ifp, ifn, itp, ptn, pfp, pfn, ptp = (
+                np.asarray(array, dtype=dtype)
+                for array in (itn, ifp, ifn, itp, ptn, pfp, pfn, ptp)
+            )
+        shape = np.broadcast_shapes(
+            *(np.shape(array) for array in (itn, ifp, ifn, itp, ptn, pfp, pfn, ptp))
+        )
+
+        if shape == () and out is None:  # single value
+            satisfying = ptn * itn + ptp * itp
+            unsatisfying = pfp * ifp + pfn * ifn
+            return satisfying / (satisfying + unsatisfying)
+
+        dtype = np.dtype(np.float64 if dtype is None else dtype)
+        out = _check_buffer(out, shape, dtype, "out")
+        size = math.prod(shape)
+        shape_satisfying = np.broadcast_shapes(
+            *(np.shape(array) for array in (ptn, itn, ptp, itp))
+        )
+        shape_unsatisfying = np.broadcast_shapes(
+            *(np.shape(array) for array in (pfp, ifp, pfn, ifn))
+        )
+        if math.prod(shape_satisfying) < size and math.prod(shape_unsatisfying) < size:
+            # E.g., on a separable grid prepared by `_prepareImportance`, both parts
+            # are small, and only the sum and the quotient are full-size.
+            satisfying = ptn * itn + ptp * itp
+            unsatisfying = pfp * ifp + pfn * ifn
+            np.add(satisfying, unsatisfying, out=out)
+            return np.divide(satisfying, out, out=out)
+
+        # The operations are done in place, in the same order as above, so that the
+        # results are identical.
+        work = _check_buffer(work, (2,) + shape, dtype, "work")
+        np.multiply(pfp, ifp, out=out)
+        np.multiply(pfn, ifn, out=work[0])
+        out += work[0]  # unsatisfying
+        np.multiply(ptn, itn, out=work[0])
+        np.multiply(ptp, itp, out=work[1])
+        work[0] += work[1]  # satisfying
+        out += work[0]
+        return np.divide(work[0], out, out=out)
+
+    @staticmethod
+    def _prepareImportance(
+        importance: Importance | np.ndarray | tuple,
+        dtype: DTypeLike | None = None,
+    ) -> tuple:
+        """
+        Prepares some importances for many calls to :meth:`_compute`, e.g. one per
+        performance, so that this work is done once instead of at each call: they are
+        split into their four components, each one is reduced to a single row or
+        column on a separable grid (see `_get_separable_axes`), and they are converted
+        to `dtype`.
+
+        Args:
+            importance (Importance | np.ndarray | tuple): The importance(s), as for
+                :meth:`_compute`. Importances that are already prepared, e.g. by
+                `AbstractParameterization.getCanonicalImportanceSeparable`, are only
+                converted to `dtype`.
+            dtype (DTypeLike | None, optional): The floating point type used for the
+                computations. Defaults to None, for the type of the importances.
+
+        Returns:
+            tuple: The importances (itn, ifp, ifn, itp), whose shapes broadcast to
+            the shape of the given ones, to be given as `importance` to
+            :meth:`_compute`.
+        """
+        itn, ifp, ifn, itp = _parse_importance(importance=importance)
+        # On a grid where the satisfying and unsatisfying importances each vary
+        # along a single axis (e.g., with the default parameterization), both parts
+        # are computed once per row or column, and combined with broadcasting.
+        separable_axes = None
+        if not isinstance(importance, tuple):
+            separable_axes = _get_separable_axes(itn, ifp, ifn, itp)
+        if separable_axes is not None:
+            axis_sat, axis_unsat = separable_axes
+            itn = np.take(itn, [0], axis=axis_sat)
+            itp = np.take(itp, [0], axis=axis_sat)
+            ifp = np.take(ifp, [0], axis=axis_unsat)
+            ifn = np.take(ifn, [0], axis=axis_unsat)
+        if dtype is not None:
+            itn, ifp, ifn, itp = (
+                np.asarray(array, dtype=dtype) for array in (itn, ifp, ifn, itp)
+            )
+        return itn, ifp, ifn, itp
 
     def __call__(self, performance: TwoClassClassificationPerformance) -> float:
         if self._constraint and not self._constraint(performance):
@@ -716,3 +909,76 @@ class RankingScore(AbstractScore):
         return (
             f"Ranking Score: {self.longLabel} with importance {str(self._importance)}"
         )
+
+
+def _get_separable_axes(
+    itn: float | np.ndarray,
+    ifp: float | np.ndarray,
+    ifn: float | np.ndarray,
+    itp: float | np.ndarray,
+) -> tuple[int, int] | None:
+    """
+    Detects whether a 2D grid of importances is separable, that is, whether the
+    importances of the satisfying cases (itn, itp) are constant along one axis of
+    the grid and those of the unsatisfying cases (ifp, ifn) are constant along the
+    other axis.
+
+    Args:
+        itn (float | np.ndarray): The importances of the true negatives.
+        ifp (float | np.ndarray): The importances of the false positives.
+        ifn (float | np.ndarray): The importances of the false negatives.
+        itp (float | np.ndarray): The importances of the true positives.
+
+    Returns:
+        tuple[int, int] | None: The axis along which the satisfying importances are
+        constant and the one along which the unsatisfying importances are constant,
+        or None if the importances are not a separable 2D grid.
+    """
+    arrays = (itn, ifp, ifn, itp)
+    if not all(isinstance(array, np.ndarray) and array.ndim == 2 for array in arrays):
+        return None
+    itn, ifp, ifn, itp = cast(tuple[np.ndarray, ...], arrays)
+    if itn.shape[0] < 2 or itn.shape[1] < 2:
+        return None  # nothing to gain
+
+    def is_constant(array: np.ndarray, axis: int) -> bool:
+        return bool(np.all(array == np.take(array, [0], axis=axis)))
+
+    for axis_sat, axis_unsat in ((0, 1), (1, 0)):
+        if (
+            is_constant(itn, axis_sat)
+            and is_constant(itp, axis_sat)
+            and is_constant(ifp, axis_unsat)
+            and is_constant(ifn, axis_unsat)
+        ):
+            return axis_sat, axis_unsat
+    return None
+
+
+def _check_buffer(
+    buffer: np.ndarray | None, shape: tuple[int, ...], dtype: np.dtype, name: str
+) -> np.ndarray:
+    """
+    Checks that a buffer given to :meth:`RankingScore._compute` can hold its
+    result, or allocates one if none is given.
+
+    Args:
+        buffer (np.ndarray | None): The buffer, or None.
+        shape (tuple[int, ...]): The shape of the result.
+        dtype (np.dtype): The type of the result.
+        name (str): The name of the argument, for the error message.
+
+    Raises:
+        ValueError: If the buffer does not have the given shape and type.
+
+    Returns:
+        np.ndarray: The buffer.
+    """
+    if buffer is None:
+        return np.empty(shape, dtype=dtype)
+    if buffer.shape != shape or buffer.dtype != dtype:
+        raise ValueError(
+            f"The {name} buffer must have shape {shape} and type {dtype}, got "
+            f"shape {buffer.shape} and type {buffer.dtype}."
+        )
+    return buffer
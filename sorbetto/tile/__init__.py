@@ -1,4 +1,5 @@
 from .best_tile import BestTile
+from .cache import TileCache
 from .correlation_tile import CorrelationTile
 from .entity_tile import EntityTile
 from .numeric_tile import NumericTile
@@ -17,5 +18,6 @@ __all__ = [
     "BestTile",
     "SymbolicTile",
     "Tile",
+    "TileCache",
     "ValueTile",
 ]
@@ -1,8 +1,13 @@
+from typing import cast
+
+import numpy as np
+
 from sorbetto.flavor.best_flavor import BestFlavor
 from sorbetto.parameterization.abstract_parameterization import AbstractParameterization
 from sorbetto.performance.finite_set_of_two_class_classification_performances import (
     FiniteSetOfTwoClassClassificationPerformances,
 )
+from sorbetto.tile.cache import TileCache
 from sorbetto.tile.numeric_tile import NumericTile
 
 
@@ -17,12 +22,18 @@ class BestTile(NumericTile):
         flavor: BestFlavor,
         name: str = "Best Tile",
         resolution: int = 1001,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         super().__init__(
             parameterization=parameterization,
             flavor=flavor,
             name=name,
             resolution=resolution,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            cache=cache,
         )
 
     @property
@@ -33,5 +44,19 @@ class BestTile(NumericTile):
     def performances(self) -> FiniteSetOfTwoClassClassificationPerformances:
         return self.flavor.performances
 
+    def _updateMatValue(self) -> np.ndarray | None:
+        # Only the appended performances are evaluated.
+        appended = self.flavor.performances.getIndicesAppendedSince(
+            self._mat_value_version
+        )
+        if appended is None:
+            return None
+        values = self._evaluate(
+            lambda importance: self.flavor.getValueAmong(importance, appended),
+            self._mat_x,
+            self._mat_y,
+        )
+        return np.maximum(cast(np.ndarray, self._mat_value), values)
+
     def getExplanation(self) -> str:
         return "Explanation for this tile is not implemented yet"
@@ -0,0 +1,227 @@
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+from typing import Any
+
+import numpy as np
+
+# Changing this invalidates all the values cached before, e.g. when the way a flavor
+# is computed changes.
+_FORMAT_VERSION = 1
+
+
+class TileCache:
+    """
+    A cache of the values of Tiles, shared between processes through a directory.
+
+    The values of a Tile are stored in a `.npy` file whose name is a hash of
+    everything they depend on: the type of the Tile, its parameterization, the type
+    and content of its flavor (e.g. the performances), the zoom, the resolution, and
+    the floating point type. Unchanged Tiles are thus read back instead of being
+    computed again, even by another process, and the files are memory-mapped so that
+    only the parts that are used are read.
+
+    When the files take more than `max_size` bytes, the least recently used ones are
+    removed.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_size: int = 1 << 30):
+        """
+        Args:
+            directory (str | os.PathLike): The directory in which the values are
+                stored. It is created if needed.
+            max_size (int, optional): The maximum size, in bytes, of the stored
+                values. Defaults to 1 GiB.
+
+        Raises:
+            TypeError: If `max_size` is not a positive integer.
+        """
+        if (not isinstance(max_size, int)) or max_size < 0:
+            raise TypeError(f"max_size must be a positive integer, got {max_size!r}")
+        self._directory = os.fspath(directory)
+        self._max_size = max_size
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @staticmethod
+    def hashKey(key: Any) -> str:
+        """
+        Computes a hash of a key that is the same in all processes, unlike the
+        built-in `hash`.
+
+        Args:
+            key (Any): The key, made of None, booleans, integers, floats, strings,
+                bytes, NumPy arrays and scalars, and tuples or lists of them.
+
+        Returns:
+            str: The hash, in hexadecimal.
+
+        Raises:
+            TypeError: If the key contains something else.
+        """
+        digest = hashlib.sha256()
+        _update_digest(digest, (_FORMAT_VERSION, key))
+        return digest.hexdigest()
+
+    def getPath(self, key: Any) -> str:
+        """
+        Gives the path of the file in which the values for some key are stored.
+
+        Args:
+            key (Any): The key (see `hashKey`).
+
+        Returns:
+            str: The path.
+        """
+        return os.path.join(self._directory, TileCache.hashKey(key) + ".npy")
+
+    def load(self, key: Any) -> np.ndarray | None:
+        """
+        Reads the values stored for some key.
+
+        Args:
+            key (Any): The key (see `hashKey`).
+
+        Returns:
+            np.ndarray | None: The values, as a read-only memory-mapped array, or
+            None if there are none.
+        """
+        path = self.getPath(key)
+        try:
+            value = np.load(path, mmap_mode="r")
+            os.utime(path)  # for the eviction of the least recently used values
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            message = "The cached Tile {!r} could not be read, got {}".format(path, e)
+            logging.warning(message)
+            return None
+        return value
+
+    def save(self, key: Any, value: np.ndarray) -> None:
+        """
+        Stores the values for some key. The file is written under a temporary name
+        and then renamed, so that other processes never read a partial file.
+
+        Args:
+            key (Any): The key (see `hashKey`).
+            value (np.ndarray): The values.
+        """
+        if value.dtype.hasobject:
+            return  # such arrays can only be pickled
+        path = self.getPath(key)
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self._directory, suffix=".tmp", delete=False
+            ) as file:
+                tmp_path = file.name
+                np.save(file, value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            message = "The Tile could not be cached in {!r}, got {}".format(path, e)
+            logging.warning(message)
+            if tmp_path is not None:
+                _remove(tmp_path)
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """
+        Removes all the stored values.
+        """
+        for path, _ in self._listFiles():
+            _remove(path)
+
+    def getSize(self) -> int:
+        """
+        Computes the size of the stored values.
+
+        Returns:
+            int: The size, in bytes.
+        """
+        return sum(stat.st_size for _, stat in self._listFiles())
+
+    def _listFiles(self) -> list[tuple[str, os.stat_result]]:
+        files = list()
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".npy"):
+                    continue
+                try:
+                    files.append((entry.path, entry.stat()))
+                except FileNotFoundError:  # removed by another process
+                    pass
+        return files
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used values, until the stored ones take at most
+        `max_size` bytes.
+        """
+        files = self._listFiles()
+        size = sum(stat.st_size for _, stat in files)
+        files.sort(key=lambda file: file[1].st_mtime)
+        for path, stat in files:
+            if size <= self._max_size:
+                break
+            _remove(path)
+            size -= stat.st_size
+
+    def __str__(self) -> str:
+        return "Tile cache in {!r}".format(self._directory)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:  # removed by another process, or still memory-mapped
+        pass
+
+
+def _update_digest(digest, value: Any) -> None:
+    """
+    Feeds a value to a hash, in a way that does not depend on the process.
+
+    Args:
+        digest (_type_): The hash, e.g. from `hashlib`.
+        value (Any): The value (see `TileCache.hashKey`).
+
+    Raises:
+        TypeError: If the value can not be hashed.
+    """
+    if value is None:
+        digest.update(b"N")
+    elif isinstance(value, (bool, np.bool_)):
+        digest.update(b"T" if value else b"F")
+    elif isinstance(value, (int, np.integer)):
+        text = str(int(value)).encode()
+        digest.update(b"i" + struct.pack("<Q", len(text)) + text)
+    elif isinstance(value, (float, np.floating)):
+        digest.update(b"f" + struct.pack("<d", float(value)))
+    elif isinstance(value, str):
+        value = value.encode()
+        digest.update(b"s" + struct.pack("<Q", len(value)) + value)
+    elif isinstance(value, bytes):
+        digest.update(b"b" + struct.pack("<Q", len(value)) + value)
+    elif isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("Arrays of objects can not be hashed.")
+        header = "{}{}".format(value.dtype.str, value.shape).encode()
+        digest.update(b"a" + struct.pack("<Q", len(header)) + header)
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (tuple, list)):
+        digest.update(b"t" + struct.pack("<Q", len(value)))
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        raise TypeError(f"Values of type {type(value)} can not be hashed.")
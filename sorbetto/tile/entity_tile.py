@@ -1,12 +1,16 @@
+from typing import Any
+
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
+from sorbetto.core.entity import Entity
 from sorbetto.flavor.entity_flavor import EntityFlavor
 from sorbetto.parameterization.abstract_parameterization import AbstractParameterization
 from sorbetto.performance.finite_set_of_two_class_classification_performances import (
     FiniteSetOfTwoClassClassificationPerformances,
 )
+from sorbetto.tile.cache import TileCache
 from sorbetto.tile.symbolic_tile import SymbolicTile
 
 
@@ -18,6 +22,9 @@ class EntityTile(SymbolicTile):
         name: str = "Entity Tile",
         resolution: int = 1001,
         disable_colorbar: bool = False,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         super().__init__(
             parameterization=parameterization,
@@ -25,10 +32,12 @@ class EntityTile(SymbolicTile):
             name=name,
             resolution=resolution,
             disable_colorbar=disable_colorbar,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            cache=cache,
         )
         self._rank = self.flavor.rank
         self._entities = self.flavor.entity_set
-        self._colormap = self.flavor.colormap
         self._performance = self.flavor.performances
 
     @property
@@ -40,12 +49,13 @@ class EntityTile(SymbolicTile):
         return self._entities
 
     @property
-    def colormap(self) -> np.ndarray:
-        return self._colormap
+    def colormap(self) -> Any:
+        # Read from the flavor, whose default colormap follows the added entities.
+        return self.flavor.colormap
 
     @colormap.setter
-    def colormap(self, value: np.ndarray):
-        self._colormap = value
+    def colormap(self, value: Any):
+        self.flavor.colormap = value
 
     @property
     def rank(self) -> int:
@@ -55,9 +65,102 @@ class EntityTile(SymbolicTile):
     def performance(self) -> FiniteSetOfTwoClassClassificationPerformances:
         return self._performance
 
+    def _update_grid(self):
+        super()._update_grid()
+        # The indices, in the performances, of the entities at the ranks 1 to `rank`,
+        # kept to update the values when entities are added.
+        self._top_entities: np.ndarray | None = None
+        self._top_entities_version = 0
+
+    def _updateMatValue(self) -> np.ndarray | None:
+        performances = self.flavor.performances
+        appended = performances.getIndicesAppendedSince(self._mat_value_version)
+        # Comparing each added entity to the entities at the first ranks only pays
+        # off when they are few.
+        if appended is None or self._rank * len(appended) > len(performances):
+            self._top_entities = None
+            return None
+        flavor = self.flavor
+        if (
+            self._top_entities is None
+            or self._top_entities_version != self._mat_value_version
+        ):
+            # The first update ranks all entities, to know the entities at the
+            # first ranks. The next ones only compare the added entities to them.
+            top_entities = self._evaluate(
+                lambda importance: flavor.getTopEntities(importance, self._rank),
+                self._mat_x,
+                self._mat_y,
+            )
+        else:
+            top_entities = self._evaluate(
+                lambda importance, top_entities: flavor.insertEntities(
+                    importance, top_entities, appended
+                ),
+                self._mat_x,
+                self._mat_y,
+                self._top_entities,
+            )
+        self._top_entities = top_entities
+        self._top_entities_version = flavor.version
+        return flavor._map(top_entities[-1])
+
     def getExplanation(self):
         return "Explanation of the entity tile not yet defined"
 
+    @staticmethod
+    def getForAllRanks(
+        parameterization: AbstractParameterization,
+        entity_list: list[Entity] | set[Entity],
+        resolution: int = 1001,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+    ) -> list["EntityTile"]:
+        """
+        Builds one Entity Tile per rank. The entities at all ranks are computed once,
+        with a single sort, and the tiles share this result: the value of each tile is
+        a view on it.
+
+        Args:
+            parameterization (AbstractParameterization): The parameterization to be
+                used for the tiles.
+            entity_list (list[Entity] | set[Entity]): The entities.
+            resolution (int, optional): Resolution of the tiles. Defaults to 1001.
+            chunk_size (int | None, optional): See Tile. Defaults to None.
+            n_jobs (int | None, optional): See Tile. Defaults to None.
+
+        Returns:
+            list[EntityTile]: The tiles, for the ranks 1 to N.
+        """
+        tiles = list()
+        sorted_codomain = None
+        for rank in range(1, len(entity_list) + 1):
+            flavor = EntityFlavor(
+                rank, entity_list, name="Entity Flavor for rank {}".format(rank)
+            )
+            # All flavors must map the entities in the same way.
+            if sorted_codomain is None:
+                sorted_codomain = flavor._getSortedCodomain()
+            flavor._sorted_codomain = sorted_codomain
+            tile = EntityTile(
+                parameterization,
+                flavor,
+                name="Entity Tile for rank {}".format(rank),
+                resolution=resolution,
+                chunk_size=chunk_size,
+                n_jobs=n_jobs,
+            )
+            tiles.append(tile)
+
+        if len(tiles) > 0:
+            tile = tiles[0]
+            all_entities = tile._evaluate(
+                tile.flavor.getAllEntities, tile._mat_x, tile._mat_y
+            )
+            for tile in tiles:
+                tile._setMatValue(all_entities[tile.rank - 1])
+        return tiles
+
     def draw(
         self, fig: Figure | None = None, ax: Axes | None = None
     ) -> tuple[Figure, Axes]:
@@ -1,3 +1,4 @@
+import math
 from typing import cast
 
 import matplotlib.pyplot as plt
@@ -7,6 +8,7 @@ from matplotlib.figure import Figure
 
 from sorbetto.flavor.abstract_numeric_flavor import AbstractNumericFlavor
 from sorbetto.parameterization.abstract_parameterization import AbstractParameterization
+from sorbetto.tile.cache import TileCache
 from sorbetto.tile.tile import Tile
 
 
@@ -18,6 +20,9 @@ class NumericTile(Tile):
         name: str = "Numeric Tile",
         resolution: int = 1001,
         disable_colorbar: bool = False,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         assert isinstance(flavor, AbstractNumericFlavor)
         Tile.__init__(
@@ -27,6 +32,9 @@ class NumericTile(Tile):
             name=name,
             resolution=resolution,
             disable_colorbar=disable_colorbar,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            cache=cache,
         )
 
         self._min: float | int | None = None
@@ -34,20 +42,158 @@ class NumericTile(Tile):
 
     @property
     def min(self) -> float | int:
+        mat_value = self.mat_value  # resets the extrema if the values have changed
         if self._min is None:
-            self._min = np.min(self.mat_value)
+            self._min = np.min(mat_value)
         return cast(float, self._min)
 
     @property
     def max(self) -> float | int:
+        mat_value = self.mat_value  # resets the extrema if the values have changed
         if self._max is None:
-            self._max = np.max(self.mat_value)
+            self._max = np.max(mat_value)
         return cast(float, self._max)
 
+    def _update_grid(self):
+        super()._update_grid()
+        self._min = None
+        self._max = None
+
+    def _setMatValue(self, mat_value: np.ndarray) -> None:
+        super()._setMatValue(mat_value)
+        # The extrema are computed again from the new values, when needed.
+        self._min = None
+        self._max = None
+
     @property
     def flavor(self) -> AbstractNumericFlavor:
         return super().flavor  # type: ignore
 
+    def argmin(
+        self, precision: float = 1e-8, num_starts: int = 1
+    ) -> tuple[float, float, float]:
+        """
+        Tries to find where the flavor takes its smallest value on the Tile, with the
+        coarse-to-fine grid-based direct search described in `_search`. There is no
+        guarantee to find the minimum.
+
+        Args:
+            precision (float, optional): the desired precision for the coordinates of
+                the point on the Tile. Defaults to 1e-8.
+            num_starts (int, optional): the number of points of the first grid from
+                which the search is refined, to avoid local minima. Defaults to 1.
+
+        Returns:
+            float: the first coordinate of the point where the smallest value has been found.
+            float: the second coordinate of the point where the smallest value has been found.
+            float: the smallest value that has been found.
+        """
+        x, y, value = self._search(1.0, precision, num_starts)
+        return x, y, value
+
+    def argmax(
+        self, precision: float = 1e-8, num_starts: int = 1
+    ) -> tuple[float, float, float]:
+        """
+        Tries to find where the flavor takes its largest value on the Tile, with the
+        coarse-to-fine grid-based direct search described in `_search`. There is no
+        guarantee to find the maximum.
+
+        Args:
+            precision (float, optional): the desired precision for the coordinates of
+                the point on the Tile. Defaults to 1e-8.
+            num_starts (int, optional): the number of points of the first grid from
+                which the search is refined, to avoid local maxima. Defaults to 1.
+
+        Returns:
+            float: the first coordinate of the point where the largest value has been found.
+            float: the second coordinate of the point where the largest value has been found.
+            float: the largest value that has been found.
+        """
+        x, y, value = self._search(-1.0, precision, num_starts)
+        return x, y, -value
+
+    def _search(
+        self, sign: float, precision: float, num_starts: int
+    ) -> tuple[float, float, float]:
+        """
+        Minimizes `sign` times the value of the flavor. As described in Section A.7.2
+        of the supplementary material for :cite:t:`Pierard2025Foundations`, this
+        implements a custom coarse-to-fine grid-based direct search
+        :cite:t:`Conn2009Introduction`: we compute the value on a coarse grid over the
+        whole parameterization, locate the minimum on the grid, center a smaller
+        region of interrest and a finer grid around that point, and iterate until the
+        region of interrest is small enough.
+
+        Each grid is evaluated with a single call to the flavor. With several starts,
+        the best points of the first grid are all refined, with a single call to the
+        flavor per iteration, and the best result is kept.
+
+        Args:
+            sign (float): 1.0 to minimize, -1.0 to maximize.
+            precision (float): the desired precision for the coordinates of the point.
+            num_starts (int): the number of points of the first grid that are refined.
+
+        Returns:
+            float: the first coordinate of the point where the best value has been found.
+            float: the second coordinate of the point where the best value has been found.
+            float: the best value that has been found, multiplied by `sign`.
+        """
+        assert isinstance(num_starts, int)
+        assert num_starts >= 1
+
+        parameterization = self.parameterization
+        flavor = self.flavor
+        assert flavor is not None
+
+        min_x, max_x = parameterization.getBoundsParameter1()
+        min_y, max_y = parameterization.getBoundsParameter2()
+
+        grid_size = 16
+        offsets = np.linspace(-1.0, 1.0, grid_size)
+
+        # initial point for the optimization
+        best_x = np.array([0.5 * (min_x + max_x)])
+        best_y = np.array([0.5 * (min_y + max_y)])
+        best_val = np.array([math.inf])
+        scale_x = max_x - min_x
+        scale_y = max_y - min_y
+        for iteration in range(64):
+            if precision > scale_x and precision > scale_y:
+                break
+            scale_x = scale_x * 0.5
+            scale_y = scale_y * 0.5
+
+            # One grid per start, stacked along the rows.
+            num = best_x.size
+            mat_x = best_x[:, None, None] + scale_x * offsets[None, None, :]
+            mat_y = best_y[:, None, None] + scale_y * offsets[None, :, None]
+            mat_x, mat_y = np.broadcast_arrays(mat_x, mat_y)
+            mat_x = np.clip(mat_x, min_x, max_x).reshape(num * grid_size, grid_size)
+            mat_y = np.clip(mat_y, min_y, max_y).reshape(num * grid_size, grid_size)
+
+            importance = parameterization.getCanonicalImportanceVectorized(mat_x, mat_y)
+            values = sign * np.asarray(flavor(importance), dtype=float)
+            values = np.where(np.isnan(values), math.inf, values).reshape(num, -1)
+            mat_x = mat_x.reshape(num, -1)
+            mat_y = mat_y.reshape(num, -1)
+
+            if iteration == 0 and num_starts > 1:
+                # The first grid covers the whole Tile, its best points are the starts.
+                ids = np.argsort(values[0], kind="stable")[:num_starts]
+                best_x, best_y, best_val = mat_x[0, ids], mat_y[0, ids], values[0, ids]
+                continue
+
+            ids = np.argmin(values, axis=1)
+            rows = np.arange(num)
+            improved = values[rows, ids] < best_val
+            best_x = np.where(improved, mat_x[rows, ids], best_x)
+            best_y = np.where(improved, mat_y[rows, ids], best_y)
+            best_val = np.where(improved, values[rows, ids], best_val)
+
+        best = np.argmin(best_val)
+        return float(best_x[best]), float(best_y[best]), float(best_val[best])
+
     def draw(
         self, fig: Figure | None = None, ax: Axes | None = None
     ) -> tuple[Figure, Axes]:
@@ -1,14 +1,17 @@
+from typing import Any, Literal, cast
+
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
+from sorbetto.core.entity import Entity
 from sorbetto.flavor.ranking_flavor import RankingFlavor
 from sorbetto.parameterization.abstract_parameterization import AbstractParameterization
 from sorbetto.performance.finite_set_of_two_class_classification_performances import (
     FiniteSetOfTwoClassClassificationPerformances,
 )
+from sorbetto.tile.cache import TileCache
 from sorbetto.tile.numeric_tile import NumericTile
-from sorbetto.tile.utils import get_colors
 
 
 class RankingTile(NumericTile):
@@ -19,6 +22,9 @@ class RankingTile(NumericTile):
         name: str = "Ranking Tile",
         resolution: int = 1001,
         disable_colorbar: bool = False,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         super().__init__(
             parameterization=parameterization,
@@ -26,15 +32,15 @@ class RankingTile(NumericTile):
             name=name,
             resolution=resolution,
             disable_colorbar=disable_colorbar,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            cache=cache,
         )
 
         self._entities = self.flavor.entity_list
         self._performance = self.flavor.performances
         self._id_entity = self.flavor.id_entity
 
-        # FIXME properly get colors from the Entities themselves
-        self._colormap = get_colors(len(self._entities))
-
     @property
     def flavor(self) -> RankingFlavor:
         return super().flavor  # type: ignore
@@ -44,12 +50,17 @@ class RankingTile(NumericTile):
         return self._entities
 
     @property
-    def colormap(self) -> np.ndarray:
-        return self._colormap
+    def colormap(self) -> Any:
+        # Read from the flavor, whose default colormap follows the added entities.
+        return self.flavor.colormap
 
     @colormap.setter
-    def colormap(self, value: np.ndarray):
-        self._colormap = value
+    def colormap(self, value: Any):
+        self.flavor.colormap = value
+
+    @property
+    def id_entity(self) -> int:
+        return self._id_entity
 
     @property
     def rank(self) -> int:
@@ -67,9 +78,77 @@ class RankingTile(NumericTile):
     def performance(self, value: FiniteSetOfTwoClassClassificationPerformances):
         self._performance = value
 
+    def _updateMatValue(self) -> np.ndarray | None:
+        # Only the added entities are compared to the entity.
+        appended = self.flavor.performances.getIndicesAppendedSince(
+            self._mat_value_version
+        )
+        if appended is None:
+            return None
+        increase = self._evaluate(
+            lambda importance: self.flavor.getRankIncrease(importance, appended),
+            self._mat_x,
+            self._mat_y,
+        )
+        return cast(np.ndarray, self._mat_value) + increase
+
     def getExplanation(self):
         return "Explanation of the Ranking tile not yet defined"
 
+    @staticmethod
+    def getForAllEntities(
+        parameterization: AbstractParameterization,
+        entity_list: list[Entity],
+        resolution: int = 1001,
+        tie_policy: Literal["min", "max", "average"] = "min",
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+    ) -> list["RankingTile"]:
+        """
+        Builds one Ranking Tile per entity. The ranks of all entities are computed
+        once, with a single sort, and the tiles share this result: the value of each
+        tile is a view on it.
+
+        Args:
+            parameterization (AbstractParameterization): The parameterization to be
+                used for the tiles.
+            entity_list (list[Entity]): The entities.
+            resolution (int, optional): Resolution of the tiles. Defaults to 1001.
+            tie_policy (Literal["min", "max", "average"], optional): See RankingFlavor.
+                Defaults to "min".
+            chunk_size (int | None, optional): See Tile. Defaults to None.
+            n_jobs (int | None, optional): See Tile. Defaults to None.
+
+        Returns:
+            list[RankingTile]: The tiles, in the same order as the entities.
+        """
+        tiles = list()
+        for entity in entity_list:
+            flavor = RankingFlavor(
+                entity,
+                entity_list,
+                name="Ranking Flavor for {}".format(entity.name),
+                tie_policy=tie_policy,
+            )
+            tile = RankingTile(
+                parameterization,
+                flavor,
+                name="Ranking Tile for {}".format(entity.name),
+                resolution=resolution,
+                chunk_size=chunk_size,
+                n_jobs=n_jobs,
+            )
+            tiles.append(tile)
+
+        if len(tiles) > 0:
+            tile = tiles[0]
+            all_ranks = tile._evaluate(
+                tile.flavor.getAllRanks, tile._mat_x, tile._mat_y
+            )
+            for tile in tiles:
+                tile._setMatValue(all_ranks[tile.id_entity])
+        return tiles
+
     def draw(
         self, fig: Figure | None = None, ax: Axes | None = None
     ) -> tuple[Figure, Axes]:
@@ -4,6 +4,7 @@ from matplotlib.figure import Figure
 
 from sorbetto.flavor.abstract_symbolic_flavor import AbstractSymbolicFlavor
 from sorbetto.parameterization.abstract_parameterization import AbstractParameterization
+from sorbetto.tile.cache import TileCache
 from sorbetto.tile.tile import Tile
 
 
@@ -15,6 +16,9 @@ class SymbolicTile(Tile):
         name: str = "Symbolic Tile",
         resolution: int = 1001,
         disable_colorbar: bool = False,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         assert isinstance(flavor, AbstractSymbolicFlavor)
         Tile.__init__(
@@ -24,6 +28,9 @@ class SymbolicTile(Tile):
             name=name,
             resolution=resolution,
             disable_colorbar=disable_colorbar,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            cache=cache,
         )
 
     @property
@@ -1,6 +1,9 @@
 import io
 import logging
-from typing import Iterator, SupportsIndex, cast
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, SupportsIndex, cast
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -12,6 +15,7 @@ from sorbetto.annotation.abstract_annotation import AbstractAnnotation
 from sorbetto.core.types import Extent
 from sorbetto.flavor.abstract_flavor import AbstractFlavor
 from sorbetto.parameterization.abstract_parameterization import AbstractParameterization
+from sorbetto.tile.cache import TileCache
 
 
 class Tile:
@@ -32,6 +36,9 @@ class Tile:
         name: str = "Tile",
         resolution: int = 1001,
         disable_colorbar: bool = True,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         """
         Args:
@@ -40,6 +47,19 @@ class Tile:
             flavor (AbstractFlavor | None, optional): The flavor to use. Defaults to None.
             resolution (int, optional): Resolution of the tile. Defaults to 1001.
             name (str | None, optional): Name of the tile. Defaults to None.
+            chunk_size (int | None, optional): Number of rows of the tile given at once
+                to the flavor. Smaller values bound the peak memory used by the flavors
+                that work on all entities at once, at the cost of more calls. If None,
+                the whole tile is given at once. Defaults to None.
+            n_jobs (int | None, optional): Number of bands of the tile evaluated
+                concurrently, by a pool of threads sharing the performances of the
+                flavor. -1 means as many as there are CPUs. If None, the tile is
+                evaluated sequentially. Defaults to None.
+            cache (TileCache | None, optional): A cache from which the values of the
+                tile are read, when they have already been computed, and to which they
+                are written otherwise. The values read from the cache are a read-only
+                memory-mapped array, to be copied before being modified. If None, the
+                values are always computed. Defaults to None.
 
         Raises:
             TypeError: If the types of the arguments are incorrect.
@@ -65,9 +85,14 @@ class Tile:
             )
         self._resolution = resolution
 
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        self.cache = cache
+
         self._zoom = self._parameterization.getExtent()
 
         self._mat_value: np.ndarray | None = None
+        self._mat_value_version = 0  # version of the flavor for the cached values
         self._update_grid()
 
         self._annotations: list[AbstractAnnotation] = list()
@@ -87,6 +112,52 @@ class Tile:
         self._resolution = resolution
         self._update_grid()
 
+    @property
+    def chunk_size(self) -> int | None:
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size: int | None):
+        if chunk_size is not None:
+            if (not isinstance(chunk_size, int)) or chunk_size <= 0:
+                raise TypeError(
+                    f"chunk_size must be None or a strictly positive integer, got {chunk_size!r}"
+                )
+        self._chunk_size = chunk_size
+
+    @property
+    def n_jobs(self) -> int | None:
+        return self._n_jobs
+
+    @n_jobs.setter
+    def n_jobs(self, n_jobs: int | None):
+        if n_jobs is not None:
+            if (not isinstance(n_jobs, int)) or (n_jobs <= 0 and n_jobs != -1):
+                raise TypeError(
+                    f"n_jobs must be None, -1, or a strictly positive integer, got {n_jobs!r}"
+                )
+        self._n_jobs = n_jobs
+
+    @property
+    def cache(self) -> TileCache | None:
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: TileCache | None):
+        if cache is not None:
+            if not isinstance(cache, TileCache):
+                raise TypeError(
+                    f"cache must be None or an instance of TileCache, got {type(cache)}"
+                )
+        self._cache = cache
+
+    def _getNumWorkers(self) -> int:
+        if self._n_jobs is None:
+            return 1
+        if self._n_jobs == -1:
+            return os.cpu_count() or 1
+        return self._n_jobs
+
     @property
     def zoom(self) -> Extent:
         return self._zoom
@@ -113,6 +184,7 @@ class Tile:
         assert all(isinstance(v, float) for v in zoom)
         extent = self._parameterization.getExtent()
         self._zoom = intersection(zoom, extent)
+        self._update_grid()
 
     @property
     def name(self) -> str:
@@ -166,14 +238,82 @@ class Tile:
 
     @property
     def mat_value(self) -> np.ndarray:
+        """
+        The values of the flavor on the grid of the tile, computed at the first access
+        and kept until the flavor changes. When they are read from the cache, this is
+        a read-only memory-mapped array.
+        """
         if self._flavor is None:
             tmp = np.empty([self.resolution, self.resolution])
             tmp[:] = np.nan
             return tmp
-        if self._mat_value is None:
-            self._mat_value = self._compute_mat_value(self._mat_x, self._mat_y)
+        if self._mat_value is None or self._mat_value_version != self._flavor.version:
+            key = self._getCacheKey() if self._cache is not None else None
+            mat_value = None
+            if key is not None:
+                mat_value = cast(TileCache, self._cache).load(key)
+            if mat_value is None:
+                if self._mat_value is not None:
+                    mat_value = self._updateMatValue()
+                if mat_value is None:
+                    mat_value = self._compute_mat_value(self._mat_x, self._mat_y)
+                if key is not None:
+                    cast(TileCache, self._cache).save(key, mat_value)
+            self._setMatValue(mat_value)
         return cast(np.ndarray, self._mat_value)
 
+    def _getCacheKey(self) -> Any:
+        """
+        Gives everything the values of the tile depend on, to find them in the cache.
+
+        Returns:
+            Any: The key (see `TileCache.hashKey`), or None if the values of the
+            flavor can not be cached.
+        """
+        flavor = self._flavor
+        if flavor is None:
+            return None
+        flavor_key = flavor.getCacheKey()
+        if flavor_key is None:
+            return None
+        parameterization = self._parameterization
+        dtype = None if flavor.dtype is None else np.dtype(flavor.dtype).str
+        return (
+            _get_qualified_name(self),
+            _get_qualified_name(parameterization),
+            tuple(parameterization.getExtent()),
+            _get_qualified_name(flavor),
+            flavor_key,
+            dtype,
+            # The grid on which the values are computed.
+            (float(self._vec_x[0]), float(self._vec_x[-1]), self._vec_x.shape[0]),
+            (float(self._vec_y[0]), float(self._vec_y[-1]), self._vec_y.shape[0]),
+        )
+
+    def _updateMatValue(self) -> np.ndarray | None:
+        """
+        Updates the cached values after the flavor has changed, e.g. when entities
+        have been added, without evaluating the flavor again on the whole grid. Tiles
+        whose flavor allows it override this method.
+
+        Returns:
+            np.ndarray | None: The updated values, or None if they must be computed
+            again.
+        """
+        return None
+
+    def _setMatValue(self, mat_value: np.ndarray) -> None:
+        """
+        Caches the values of the flavor on the grid, for the current version of the
+        flavor.
+
+        Args:
+            mat_value (np.ndarray): The values, of shape (resolution, resolution).
+        """
+        assert self._flavor is not None
+        self._mat_value = mat_value
+        self._mat_value_version = self._flavor.version
+
     def _compute_mat_value(
         self,
         param1: list[float] | np.ndarray | None = None,  # TODO: or float ?
@@ -184,14 +324,151 @@ class Tile:
         if not isinstance(param2, (np.ndarray)):
             param2 = np.array(param2)
 
-        importance = self.parameterization.getCanonicalImportanceVectorized(
-            param1, param2
-        )
-
         if self.flavor is None:
-            return np.zeros_like(importance.shape[:-1])
+            return np.zeros(param1.shape)
+
+        return self._evaluate(self.flavor, param1, param2)
+
+    def _genBands(self, num_rows: int) -> Iterator[slice]:
+        """
+        Splits the rows of the tile into bands of at most `chunk_size` rows. Without
+        `chunk_size`, the rows are split evenly between the workers.
+
+        Args:
+            num_rows (int): The number of rows to split.
+
+        Yields:
+            slice: The rows of each band.
+        """
+        if self._chunk_size is not None:
+            step = self._chunk_size
+        else:
+            step = max(math.ceil(num_rows / self._getNumWorkers()), 1)
+        for start in range(0, num_rows, step):
+            yield slice(start, min(start + step, num_rows))
+
+    def _evaluate(
+        self,
+        function: Callable[..., np.ndarray],
+        param1: np.ndarray,
+        param2: np.ndarray,
+        *args: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Evaluates `function ( importances, *args )` for the given parameters, band by
+        band when a `chunk_size` or `n_jobs` is set, and writes the results into a
+        preallocated array.
+
+        The function may return some leading dimensions (e.g. one per entity) before
+        the dimensions of the parameters. The additional arguments are arrays with
+        the same layout, e.g. results of a previous evaluation, and the function
+        receives the band of them that matches the importances.
+
+        On a regular grid, when the parameterization is separable (see
+        `AbstractParameterization.getCanonicalImportanceSeparable`), the function
+        receives the importances as a tuple of single rows or columns (see
+        `RankingScore._prepareImportance`) instead of an array of shape (..., 4).
+
+        When `n_jobs` is set, the bands are evaluated concurrently by threads. They
+        share the function, and thus the performances of the flavor, instead of
+        receiving a copy of them. The function must therefore not modify its state
+        while it is called. The flavor of the tile is thus prepared (see
+        `AbstractFlavor.prepare`) before the bands are submitted, so that the state
+        it fills lazily is filled once, by the calling thread.
 
-        return self.flavor(importance=importance)
+        Args:
+            function (Callable[..., np.ndarray]): The function to evaluate,
+                typically a flavor.
+            param1 (np.ndarray): The first parameter.
+            param2 (np.ndarray): The second parameter, of the same shape as `param1`.
+            *args (np.ndarray): Arrays of shape (..., *param1.shape) whose bands are
+                given to the function.
+
+        Returns:
+            np.ndarray: The values, of shape (..., *param1.shape).
+        """
+        parameterization = self.parameterization
+        separable = None
+        grid_axes = Tile._getGridAxes(param1, param2)
+        if grid_axes is not None:
+            separable = parameterization.getCanonicalImportanceSeparable(*grid_axes)
+
+        def get_importance(band):
+            if separable is None:
+                return parameterization.getCanonicalImportanceVectorized(
+                    param1[band], param2[band]
+                )
+            # Only the importances that vary along the rows are split into bands.
+            return tuple(
+                array[band] if array.shape[0] > 1 else array for array in separable
+            )
+
+        def evaluate_band(band) -> np.ndarray:
+            band_args = (
+                arg[(slice(None),) * (arg.ndim - param1.ndim) + (band,)] for arg in args
+            )
+            return np.asarray(function(get_importance(band), *band_args))
+
+        bands = list(self._genBands(param1.shape[0])) if param1.ndim > 0 else []
+        if len(bands) <= 1:
+            return function(get_importance(...), *args)
+
+        num_workers = min(self._getNumWorkers(), len(bands))
+        if num_workers > 1:
+            if self._flavor is not None:
+                self._flavor.prepare()
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                values = executor.map(evaluate_band, bands)
+                return Tile._gatherBands(bands, values, param1.shape)
+        return Tile._gatherBands(bands, map(evaluate_band, bands), param1.shape)
+
+    @staticmethod
+    def _getGridAxes(
+        param1: np.ndarray, param2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Detects whether the parameters form a regular grid, as the one of the tile,
+        where the first parameter only varies along the columns and the second one
+        along the rows.
+
+        Args:
+            param1 (np.ndarray): The first parameter.
+            param2 (np.ndarray): The second parameter, of the same shape as `param1`.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: The values of the first parameter
+            along the columns and of the second one along the rows, or None if the
+            parameters do not form such a grid.
+        """
+        if param1.ndim != 2 or param1.shape != param2.shape:
+            return None
+        if not (np.all(param1 == param1[:1]) and np.all(param2 == param2[:, :1])):
+            return None
+        return param1[0], param2[:, 0]
+
+    @staticmethod
+    def _gatherBands(
+        bands: list[slice], values: Iterable[np.ndarray], shape: tuple[int, ...]
+    ) -> np.ndarray:
+        """
+        Writes the values computed for each band into a single preallocated array.
+
+        Args:
+            bands (list[slice]): The rows of each band.
+            values (Iterable[np.ndarray]): The values computed for each band, in the
+                same order as the bands.
+            shape (tuple[int, ...]): The shape of the parameters of the whole tile.
+
+        Returns:
+            np.ndarray: The values, of shape (..., *shape).
+        """
+        out: np.ndarray | None = None
+        for band, value in zip(bands, values):
+            num_leading = value.ndim - len(shape)
+            if out is None:
+                out = np.empty(value.shape[:num_leading] + shape, dtype=value.dtype)
+            out[(slice(None),) * num_leading + (band,)] = value
+        return cast(np.ndarray, out)
 
     def __call__(self, param1: np.ndarray, param2: np.ndarray) -> np.ndarray:
         return self._compute_mat_value(param1, param2)
@@ -300,3 +577,7 @@ class Tile:
             for annotation in self._annotations:
                 buffer.write("- {}\n".format(annotation.name))
         return buffer.getvalue()
+
+
+def _get_qualified_name(value: Any) -> str:
+    return "{}.{}".format(type(value).__module__, type(value).__qualname__)
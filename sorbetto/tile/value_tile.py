@@ -10,6 +10,7 @@ from sorbetto.parameterization.parameterization_default import ParameterizationD
 from sorbetto.performance.two_class_classification_performance import (
     TwoClassClassificationPerformance,
 )
+from sorbetto.tile.cache import TileCache
 from sorbetto.tile.numeric_tile import NumericTile
 
 
@@ -57,6 +58,9 @@ class ValueTile(NumericTile):
         name: str = "Value Tile",
         resolution: int = 1001,
         disable_colorbar: bool = False,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         super().__init__(
             parameterization=parameterization,
@@ -64,6 +68,9 @@ class ValueTile(NumericTile):
             name=name,
             resolution=resolution,
             disable_colorbar=disable_colorbar,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            cache=cache,
         )
         self._performance = self.flavor.performance
 
@@ -1,8 +1,13 @@
+from typing import cast
+
+import numpy as np
+
 from sorbetto.flavor.worst_flavor import WorstFlavor
 from sorbetto.parameterization.abstract_parameterization import AbstractParameterization
 from sorbetto.performance.two_class_classification_performance import (
     TwoClassClassificationPerformance,
 )
+from sorbetto.tile.cache import TileCache
 from sorbetto.tile.numeric_tile import NumericTile
 
 
@@ -17,12 +22,18 @@ class WorstTile(NumericTile):
         flavor: WorstFlavor,
         name: str = "Worst Tile",
         resolution: int = 1001,
+        chunk_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: TileCache | None = None,
     ):
         super().__init__(
             parameterization=parameterization,
             flavor=flavor,
             name=name,
             resolution=resolution,
+            chunk_size=chunk_size,
+            n_jobs=n_jobs,
+            cache=cache,
         )
         self._performances = self.flavor.performances
 
@@ -38,5 +49,19 @@ class WorstTile(NumericTile):
     def performances(self, value: TwoClassClassificationPerformance):
         self._performances = value
 
+    def _updateMatValue(self) -> np.ndarray | None:
+        # Only the appended performances are evaluated.
+        appended = self.flavor.performances.getIndicesAppendedSince(
+            self._mat_value_version
+        )
+        if appended is None:
+            return None
+        values = self._evaluate(
+            lambda importance: self.flavor.getValueAmong(importance, appended),
+            self._mat_x,
+            self._mat_y,
+        )
+        return np.minimum(cast(np.ndarray, self._mat_value), values)
+
     def getExplanation(self) -> str:
         return "Explanation for this tile is not implemented yet"
@@ -0,0 +1,65 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sorbetto.annotation.annotation_frontiers_between_rankings import (
+    AnnotationFrontiersBetweenRankings,
+)
+from sorbetto.core.entity import Entity
+from sorbetto.flavor.entity_flavor import EntityFlavor
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.tile.entity_tile import EntityTile
+
+
+def _draw(performances, ranks):
+    entities = [Entity(p) for p in performances]
+    tile = EntityTile(
+        ParameterizationDefault(), EntityFlavor(1, entities), resolution=5
+    )
+    fig, ax = plt.subplots()
+    AnnotationFrontiersBetweenRankings(performances, ranks=ranks).draw(tile, fig, ax)
+    points = np.concatenate(ax.collections[0].get_segments())  # type: ignore
+    plt.close(fig)
+    return points[np.all(np.isfinite(points), axis=1)]
+
+
+def _get_scores(performances, points):
+    ptn, pfp, pfn, ptp = performances.to_array().T
+    a, b = points[:, 0, np.newaxis], points[:, 1, np.newaxis]
+    satisfying = ptn + a * (ptp - ptn)
+    unsatisfying = pfp + b * (pfn - pfp)
+    return satisfying / (satisfying + unsatisfying)
+
+
+def test_frontiers_of_the_best_performance():
+    rng = np.random.default_rng(0)
+    performances = FiniteSetOfTwoClassClassificationPerformances(
+        rng.dirichlet(np.ones(4), size=12)
+    )
+
+    points = _draw(performances, ranks=[1])
+    all_points = _draw(performances, ranks=None)
+
+    # On the frontiers of the first rank, the two best performances are equivalent.
+    scores = np.sort(_get_scores(performances, points), axis=1)
+    assert len(points) > 0
+    assert np.allclose(scores[:, -1], scores[:, -2], atol=1e-9)
+    assert len(points) < len(all_points)
+
+
+def test_frontiers_of_a_deeper_rank():
+    rng = np.random.default_rng(1)
+    performances = FiniteSetOfTwoClassClassificationPerformances(
+        rng.dirichlet(np.ones(4), size=12)
+    )
+
+    points = _draw(performances, ranks=[3])
+
+    # The performance at rank 3 changes when it is swapped with the one at rank 2 or 4.
+    scores = np.sort(_get_scores(performances, points), axis=1)[:, ::-1]
+    tied_2_3 = np.isclose(scores[:, 1], scores[:, 2], atol=1e-9)
+    tied_3_4 = np.isclose(scores[:, 2], scores[:, 3], atol=1e-9)
+    assert len(points) > 0
+    assert np.all(tied_2_3 | tied_3_4)
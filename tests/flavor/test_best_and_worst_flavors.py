@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from sorbetto.flavor.best_flavor import BestFlavor
+from sorbetto.flavor.worst_flavor import WorstFlavor
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+def _get_performances():
+    rng = np.random.default_rng(0)
+    tnr, tpr = rng.uniform(0.6, 0.95, size=(2, 50))
+    array = np.stack([0.7 * tnr, 0.7 * (1 - tnr), 0.3 * (1 - tpr), 0.3 * tpr], axis=-1)
+    array = np.concatenate([array, array[:3]])  # with duplicates
+    return FiniteSetOfTwoClassClassificationPerformances(array)
+
+
+@pytest.mark.parametrize(
+    "flavor_class, reduce, get_candidates",
+    [
+        (BestFlavor, np.max, "getCandidatesForTopK"),
+        (WorstFlavor, np.min, "getCandidatesForBottomK"),
+    ],
+)
+def test_pruned_entities_do_not_change_the_values(flavor_class, reduce, get_candidates):
+    performances = _get_performances()
+    flavor = flavor_class(performances, [])
+    vec = np.linspace(0.0, 1.0, 51)
+    mat_a, mat_b = np.meshgrid(vec, vec, indexing="xy")
+    importance = ParameterizationDefault().getCanonicalImportanceVectorized(
+        mat_a, mat_b
+    )
+
+    values = RankingScore._compute(importance=importance, performance=performances)
+
+    assert len(getattr(performances, get_candidates)(1)) < len(performances)
+    assert np.array_equal(flavor(importance), reduce(values, axis=0))
@@ -0,0 +1,107 @@
+import numpy as np
+from scipy import stats
+
+from sorbetto.flavor.correlation_flavor import CorrelationFlavor
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+def _get_performances():
+    array = np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.055, 0.045, 0.60),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+            (0.20, 0.10, 0.20, 0.50),
+            (0.25, 0.25, 0.25, 0.25),
+        ]
+    )
+    return FiniteSetOfTwoClassClassificationPerformances(array)
+
+
+def _accuracy(performances):
+    return RankingScore._compute(
+        importance=RankingScore.getAccuracy().importance, performance=performances
+    ).ravel()
+
+
+def test_correlation_coefficients_match_scipy():
+    performances = _get_performances()
+    vec = np.linspace(0.05, 0.95, 7)
+    mat_a, mat_b = np.meshgrid(vec, vec, indexing="xy")
+    importance = ParameterizationDefault().getCanonicalImportanceVectorized(
+        mat_a, mat_b
+    )
+    x_scores = _accuracy(performances)
+    values = RankingScore._compute(importance=importance, performance=performances)
+
+    functions = {
+        "pearson_r": stats.pearsonr,
+        "spearman_rho": stats.spearmanr,
+        "kendall_tau": stats.kendalltau,
+    }
+    for correlation_coefficient, function in functions.items():
+        flavor = CorrelationFlavor(performances, _accuracy, correlation_coefficient)
+        expected = np.array(
+            [
+                [function(x_scores, values[:, i, j])[0] for j in range(vec.size)]
+                for i in range(vec.size)
+            ]
+        )
+
+        assert np.allclose(flavor(importance), expected)
+
+
+def test_x_scores_are_computed_once():
+    performances = _get_performances()
+    num_calls = 0
+
+    def score(performances):
+        nonlocal num_calls
+        num_calls += 1
+        return _accuracy(performances)
+
+    flavor = CorrelationFlavor(performances, score, "spearman_rho")
+    importance = RankingScore.getAccuracy().importance
+    first = flavor(importance)
+    second = flavor(importance)
+
+    assert num_calls == 1
+    assert np.array_equal(first, second)
+
+
+def test_x_scores_follow_the_performances():
+    performances = _get_performances()
+    array = performances.to_array()
+    growing = FiniteSetOfTwoClassClassificationPerformances(array[:3])
+    flavor = CorrelationFlavor(growing, _accuracy, "pearson_r")
+    importance = RankingScore.getAccuracy().importance
+    flavor(importance)
+
+    growing.extend(array[3:])
+
+    expected = CorrelationFlavor(performances, _accuracy, "pearson_r")
+    assert np.array_equal(flavor.x_scores, _accuracy(performances))
+    assert np.allclose(flavor(importance), expected(importance))
+
+
+def test_kendall_tau_with_ties_matches_scipy():
+    rng = np.random.default_rng(0)
+    array = rng.dirichlet(np.ones(4), size=40)
+    array = np.concatenate([array, array[:10]])  # ties in both variables
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+    importance = ParameterizationDefault().getCanonicalImportanceVectorized(
+        np.linspace(0.05, 0.95, 5), np.full(5, 0.3)
+    )
+    x_scores = np.round(_accuracy(performances), 1)  # more ties in x
+    values = RankingScore._compute(importance=importance, performance=performances)
+    values = values.reshape(len(performances), -1)
+
+    flavor = CorrelationFlavor(performances, lambda p: x_scores, "kendall_tau")
+    expected = [stats.kendalltau(x_scores, values[:, i])[0] for i in range(5)]
+
+    assert np.allclose(np.ravel(flavor(importance)), expected)
@@ -0,0 +1,76 @@
+import numpy as np
+
+from sorbetto.core.entity import Entity
+from sorbetto.flavor.entity_flavor import EntityFlavor
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+def _get_entities():
+    array = np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.055, 0.045, 0.60),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+            (0.20, 0.10, 0.20, 0.50),
+            (0.20, 0.30, 0.30, 0.20),  # dominated by all others
+            (0.30, 0.16, 0.14, 0.40),  # equivalent to another one
+        ]
+    )
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+    return [Entity(p, name=f"entity {i}") for i, p in enumerate(performances)]
+
+
+def _get_importance():
+    vec = np.linspace(0.0, 1.0, 41)
+    mat_a, mat_b = np.meshgrid(vec, vec, indexing="xy")
+    return ParameterizationDefault().getCanonicalImportanceVectorized(mat_a, mat_b)
+
+
+def test_entity_at_each_rank_matches_sorting():
+    entities = _get_entities()
+    importance = _get_importance()
+
+    for rank in range(1, len(entities) + 1):
+        flavor = EntityFlavor(rank, entities)
+        values = RankingScore._compute(
+            importance=importance, performance=flavor.performances
+        )
+        expected = -np.sort(-values, axis=0)[rank - 1]
+
+        indices = flavor(importance) - 1
+        found = np.take_along_axis(values, indices[np.newaxis], axis=0)[0]
+
+        assert np.allclose(found, expected, equal_nan=True)
+
+
+def test_first_entity_is_the_first_best():
+    entities = _get_entities()
+    importance = _get_importance()
+
+    flavor = EntityFlavor(1, entities)
+    values = RankingScore._compute(
+        importance=importance, performance=flavor.performances
+    )
+
+    assert np.array_equal(flavor(importance), np.argmax(values, axis=0) + 1)
+
+
+def test_ties_are_broken_the_same_way_by_all_methods():
+    rng = np.random.default_rng(0)
+    array = rng.dirichlet(np.ones(4), size=30)
+    array = np.concatenate([array, array[:10]])  # with equivalent entities
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+    entities = [Entity(p, name=f"entity {i:02d}") for i, p in enumerate(performances)]
+    importance = _get_importance()
+
+    all_entities = EntityFlavor(1, entities).getAllEntities(importance)
+    for rank in range(1, len(entities) + 1):
+        flavor = EntityFlavor(rank, entities)
+        assert np.array_equal(flavor(importance), all_entities[rank - 1])
+        top_entities = flavor.getTopEntities(importance, rank)
+        assert np.array_equal(flavor._map(top_entities), all_entities[:rank])
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from sorbetto.core.entity import Entity
+from sorbetto.flavor.ranking_flavor import RankingFlavor
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+def _get_entities():
+    array = np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.055, 0.045, 0.60),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.40, 0.045, 0.055, 0.50),
+            (0.20, 0.10, 0.20, 0.50),
+        ]
+    )
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+    return [Entity(p, name=f"entity {i}") for i, p in enumerate(performances)]
+
+
+def _get_importance():
+    vec = np.linspace(0.0, 1.0, 41)
+    mat_a, mat_b = np.meshgrid(vec, vec, indexing="xy")
+    return ParameterizationDefault().getCanonicalImportanceVectorized(mat_a, mat_b)
+
+
+def test_ranks_match_rankdata():
+    entities = _get_entities()
+    importance = _get_importance()
+
+    for tie_policy in ("min", "max", "average"):
+        for id_entity, entity in enumerate(entities):
+            flavor = RankingFlavor(entity, entities, tie_policy=tie_policy)
+            values = RankingScore._compute(
+                importance=importance, performance=flavor.performances
+            )
+            expected = stats.rankdata(-values, method=tie_policy, axis=0)
+
+            assert np.array_equal(flavor(importance), expected[id_entity])
+
+
+def test_unknown_tie_policy():
+    entities = _get_entities()
+    with pytest.raises(ValueError):
+        RankingFlavor(entities[0], entities, tie_policy="dense")  # type: ignore
+
+
+def test_all_ranks_match_rankdata():
+    entities = _get_entities()
+    importance = _get_importance()
+
+    for tie_policy in ("min", "max", "average"):
+        flavor = RankingFlavor(entities[0], entities, tie_policy=tie_policy)
+        values = RankingScore._compute(
+            importance=importance, performance=flavor.performances
+        )
+        expected = stats.rankdata(-values, method=tie_policy, axis=0)
+
+        assert np.array_equal(flavor.getAllRanks(importance), expected)
@@ -0,0 +1,34 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sorbetto.geometry.bilinear_curve_collection import BilinearCurveCollection
+
+
+def test_segments_match_the_curves():
+    rng = np.random.default_rng(0)
+    curves = BilinearCurveCollection(*rng.normal(size=(4, 20)))
+    extent = (0.0, 1.0, 0.0, 1.0)
+
+    fig, ax = plt.subplots()
+    for index in range(len(curves)):
+        curves[index].draw(fig, ax, extent)
+    expected = np.concatenate([line.get_xydata() for line in ax.lines])  # type: ignore
+    plt.close(fig)
+
+    segments = curves.getSegments(extent).reshape(-1, 2)
+    expected = expected[np.all(np.isfinite(expected), axis=1)]
+    segments = segments[np.all(np.isfinite(segments), axis=1)]
+    assert segments.shape == expected.shape
+    assert np.allclose(np.sort(segments, axis=0), np.sort(expected, axis=0))
+
+
+def test_draw_as_a_single_collection():
+    rng = np.random.default_rng(1)
+    curves = BilinearCurveCollection(*rng.normal(size=(4, 20)))
+    fig, ax = plt.subplots()
+
+    curves.draw(fig, ax, (0.0, 1.0, 0.0, 1.0), color="gray")
+
+    assert len(ax.lines) == 0
+    assert len(ax.collections) == 1
+    plt.close(fig)
@@ -0,0 +1,24 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sorbetto.geometry.conic import Conic
+
+
+def test_draw_circle():
+    # (x - 0.5)^2 + (y - 0.5)^2 = 0.4^2
+    conic = Conic(1.0, 0.0, 1.0, -1.0, -1.0, 0.34)
+    fig, ax = plt.subplots()
+
+    conic.draw(fig, ax, (0.0, 1.0, 0.0, 1.0))
+
+    assert len(ax.lines) == 4
+    for line in ax.lines:
+        x, y = line.get_xydata().T  # type: ignore
+        drawn = np.isfinite(x) & np.isfinite(y)
+        x, y = x[drawn], y[drawn]
+        assert np.allclose((x - 0.5) ** 2 + (y - 0.5) ** 2, 0.16)
+        # Only the parts where each branch has a slope of at most one are drawn.
+        assert np.all(np.abs(x - 0.5) <= 0.4 / np.sqrt(2.0) + 1e-9) or np.all(
+            np.abs(y - 0.5) <= 0.4 / np.sqrt(2.0) + 1e-9
+        )
+    plt.close(fig)
@@ -0,0 +1,136 @@
+import itertools
+import random
+
+import numpy as np
+
+from sorbetto.performance.distribution import (
+    UniformDistributionOfTwoClassClassificationPerformances,
+    UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors,
+    UniformDistributionOfTwoClassClassificationPerformancesForFixedPredictionRates,
+)
+
+
+def test_sample_on_regular_grid():
+    distribution = UniformDistributionOfTwoClassClassificationPerformances("uniform")
+    grid_size = 7
+
+    performances = distribution.sampleOnRegularGrid(grid_size)
+
+    expected = [
+        [seq.count(case) / grid_size for case in range(4)]
+        for seq in itertools.combinations_with_replacement(range(4), grid_size)
+    ]
+    assert len(performances) == 120
+    assert np.array_equal(performances.to_array(), np.array(expected))
+
+
+def test_gen_on_regular_grid():
+    distribution = UniformDistributionOfTwoClassClassificationPerformances("uniform")
+
+    chunks = list(distribution.genOnRegularGrid(6, chunk_size=20))
+
+    assert [len(chunk) for chunk in chunks] == [20, 15, 21, 28]
+    assert np.array_equal(
+        np.concatenate([chunk.to_array() for chunk in chunks]),
+        distribution.sampleOnRegularGrid(6).to_array(),
+    )
+
+
+def test_draw_at_random_for_fixed_class_priors():
+    distribution = (
+        UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors(0.3)
+    )
+
+    performances = distribution.drawAtRandom(1000, rng=0)
+
+    assert len(performances) == 1000
+    assert np.allclose(performances.pfn + performances.ptp, 0.3)
+    assert np.array_equal(
+        performances.to_array(), distribution.drawAtRandom(1000, rng=0).to_array()
+    )
+
+
+def test_draw_at_random_uses_the_global_state_by_default():
+    distribution = UniformDistributionOfTwoClassClassificationPerformances("uniform")
+    np.random.seed(0)
+    performances = distribution.drawAtRandom(10)
+    np.random.seed(0)
+    assert np.array_equal(
+        performances.to_array(), distribution.drawAtRandom(10).to_array()
+    )
+
+    distribution = (
+        UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors(0.3)
+    )
+    random.seed(0)
+    performances = distribution.drawAtRandom(10)
+    random.seed(0)
+    tnr, tpr = random.random(), random.random()  # drawn first, in turn
+    assert np.allclose(performances.ptn[0], tnr * 0.7)
+    assert np.allclose(performances.ptp[0], tpr * 0.3)
+
+
+def test_sample_on_regular_grid_for_fixed_prediction_rates():
+    distribution = (
+        UniformDistributionOfTwoClassClassificationPerformancesForFixedPredictionRates(
+            0.4
+        )
+    )
+
+    performances = distribution.sampleOnRegularGrid(5, open=True)
+
+    npv = np.linspace(0.1, 0.9, 5)
+    assert len(performances) == 25
+    assert np.allclose(performances.ptn, np.repeat(npv, 5) * 0.6)
+    assert np.allclose(performances.ptp, np.tile(npv, 5) * 0.4)
+    assert np.allclose(performances.pfp + performances.ptp, 0.4)
+
+
+def test_gen_batches():
+    distribution = UniformDistributionOfTwoClassClassificationPerformances("uniform")
+
+    batches = list(distribution.genBatches(2500, 1000, rng=0))
+
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert np.array_equal(
+        batches[-1].to_array(),
+        list(distribution.genBatches(2500, 1000, rng=0))[-1].to_array(),
+    )
+
+
+def test_draw_quasi_random():
+    distribution = UniformDistributionOfTwoClassClassificationPerformances("uniform")
+
+    for method in ("sobol", "halton"):
+        performances = distribution.drawQuasiRandom(1024, method=method, rng=0)
+
+        assert len(performances) == 1024
+        assert np.allclose(np.mean(performances.to_array(), axis=0), 0.25, atol=1e-3)
+
+
+def test_draw_stratified():
+    distribution = (
+        UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors(0.3)
+    )
+
+    performances = distribution.drawStratified(100, rng=0)
+
+    # One true negative rate and one true positive rate per stratum.
+    tnr = performances.ptn / 0.7
+    tpr = performances.ptp / 0.3
+    assert np.array_equal(np.sort(np.floor(tnr * 100)), np.arange(100))
+    assert np.array_equal(np.sort(np.floor(tpr * 100)), np.arange(100))
+
+
+def test_gen_batches_uses_a_generator_by_default():
+    distribution = (
+        UniformDistributionOfTwoClassClassificationPerformancesForFixedClassPriors(0.3)
+    )
+    random.seed(0)
+    expected = random.random()
+    random.seed(0)
+
+    batches = list(distribution.genBatches(2500, 1000))
+
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert random.random() == expected  # the slow global state is not used
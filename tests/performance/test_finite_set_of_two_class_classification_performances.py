@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+def _get_performances():
+    rng = np.random.default_rng(0)
+    tnr, tpr = rng.uniform(0.5, 0.95, size=(2, 30))
+    array = np.stack([0.6 * tnr, 0.6 * (1 - tnr), 0.4 * (1 - tpr), 0.4 * tpr], axis=-1)
+    others = [
+        (0.40, 0.10, 0.20, 0.30),
+        (0.40, 0.10, 0.10, 0.40),  # better, except where a = b = 0
+        (0.00, 0.00, 0.40, 0.60),  # undefined ranking scores where b = 0
+    ]
+    array = np.concatenate([array, array[:2], others, others[-1:]])  # with duplicates
+    return FiniteSetOfTwoClassClassificationPerformances(array)
+
+
+def _get_values(performances):
+    vec = np.linspace(0.0, 1.0, 61)
+    mat_a, mat_b = np.meshgrid(vec, vec, indexing="xy")
+    importance = ParameterizationDefault().getCanonicalImportanceVectorized(
+        mat_a, mat_b
+    )
+    values = RankingScore._compute(importance=importance, performance=performances)
+    return values.reshape(len(performances), -1)
+
+
+def _get_order(values):
+    # Equivalent performances are ranked in their order, and undefined values last.
+    keys = np.where(np.isnan(values), np.inf, -values)
+    return np.argsort(keys, axis=0, kind="stable")
+
+
+def test_dominance_matrix():
+    performances = _get_performances()
+    values = _get_values(performances)
+
+    order = _get_order(values)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(performances))[:, None], axis=0)
+
+    for reverse in (False, True):
+        dominance = performances.getDominanceMatrix(reverse=reverse)
+        assert not np.any(dominance & dominance.T)
+        indices = np.arange(0, len(performances), 3)
+        assert np.array_equal(
+            performances.getDominanceMatrix(reverse=reverse, indices=indices),
+            dominance[np.ix_(indices, indices)],
+        )
+        for j, i in zip(*np.nonzero(dominance)):
+            if reverse:
+                assert np.all(ranks[j] > ranks[i])
+            else:
+                assert np.all(ranks[j] < ranks[i])
+
+
+def test_candidates_for_top_k_and_bottom_k():
+    performances = _get_performances()
+    values = _get_values(performances)
+    order = _get_order(values)
+
+    num_dominating = np.count_nonzero(performances.getDominanceMatrix(), axis=0)
+    num_dominating_reverse = np.count_nonzero(
+        performances.getDominanceMatrix(reverse=True), axis=0
+    )
+    for k in (1, 3, 10):
+        top_k = np.unique(order[:k])
+        bottom_k = np.unique(order[::-1][:k])
+
+        candidates = performances.getCandidatesForTopK(k)
+        assert np.all(np.isin(top_k, candidates))
+        assert np.array_equal(candidates, np.flatnonzero(num_dominating < k))
+        candidates = performances.getCandidatesForBottomK(k)
+        assert np.all(np.isin(bottom_k, candidates))
+        assert np.array_equal(candidates, np.flatnonzero(num_dominating_reverse < k))
+    assert len(performances.getCandidatesForTopK(1)) < len(performances)
+
+
+def test_columnar_storage():
+    array = np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+        ]
+    )
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+
+    assert len(performances) == 3
+    assert np.array_equal(performances.to_array(), array)
+    assert np.array_equal(performances.ptp, array[:, 3])
+    assert performances[1].pfp == 0.16
+    assert performances[1] is performances[1]
+    assert [p.ptn for p in performances] == [0.40, 0.30, 0.70]
+
+    rebuilt = FiniteSetOfTwoClassClassificationPerformances(
+        performances.performance_list
+    )
+    assert np.array_equal(rebuilt.to_array(), array)
+
+
+def test_invalid_arrays():
+    with pytest.raises(ValueError):
+        FiniteSetOfTwoClassClassificationPerformances(np.zeros((0, 4)))
+    with pytest.raises(ValueError):
+        FiniteSetOfTwoClassClassificationPerformances(np.full((2, 3), 1 / 3))
+    with pytest.raises(ValueError):
+        FiniteSetOfTwoClassClassificationPerformances(np.array([[0.5, 0.5, 0.5, 0.5]]))
+    with pytest.raises(ValueError):
+        FiniteSetOfTwoClassClassificationPerformances(np.array([[1.5, -0.5, 0, 0]]))
+
+
+def test_append_extend_and_remove():
+    array = np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+        ]
+    )
+    performances = FiniteSetOfTwoClassClassificationPerformances(array[:1])
+    version = performances.version
+
+    performances.append(FiniteSetOfTwoClassClassificationPerformances(array)[1])
+    performances.extend(array[2:])
+    assert np.array_equal(performances.to_array(), array)
+    assert np.array_equal(performances.getIndicesAppendedSince(version), [1, 2])
+    assert performances.getCandidatesForTopK(3).size == 3
+
+    version = performances.version
+    before = performances.to_array()
+    ptn = performances.ptn
+    removed = performances.pop(0)
+    assert np.array_equal(before, array)  # the arrays returned before are unchanged
+    assert np.array_equal(ptn, array[:, 0])
+    assert removed.ptn == 0.40
+    performances.remove(performances[1])
+    assert np.array_equal(performances.to_array(), array[1:2])
+    assert performances.getIndicesAppendedSince(version) is None
+    with pytest.raises(ValueError):
+        performances.pop()
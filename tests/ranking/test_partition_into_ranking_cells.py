@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from sorbetto.ranking.partition_into_ranking_cells import PartitionIntoRankingCells
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+def _get_performances():
+    return np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.055, 0.045, 0.60),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+            (0.20, 0.10, 0.20, 0.50),
+            (0.40, 0.045, 0.055, 0.50),  # equivalent to the first one everywhere
+        ]
+    )
+
+
+def _compute_values(performances, a, b):
+    ptn, pfp, pfn, ptp = performances.T.reshape((4, -1) + (1,) * np.ndim(a))
+    return RankingScore._compute(
+        itn=1.0 - a, ifp=1.0 - b, ifn=b, itp=a, ptn=ptn, pfp=pfp, pfn=pfn, ptp=ptp
+    )
+
+
+def test_rankings_match_evaluation():
+    performances = _get_performances()
+    partition = PartitionIntoRankingCells(performances)
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(size=(2, 1000))
+
+    values = _compute_values(performances, a, b)
+    expected = np.argsort(-values, axis=0, kind="stable") + 1
+    entities = partition.getAllEntities(a, b)
+    ranks = partition.getAllRanks(a, b)
+
+    assert np.array_equal(entities, expected)
+    assert np.array_equal(
+        np.take_along_axis(ranks, entities - 1, axis=0),
+        np.broadcast_to(np.arange(1, 7)[:, np.newaxis], ranks.shape),
+    )
+
+
+def test_rasterization_on_grid():
+    performances = _get_performances()
+    partition = PartitionIntoRankingCells(performances)
+    vec = np.linspace(0.0, 1.0, 101)
+    mat_a, mat_b = np.meshgrid(vec, vec, indexing="xy")
+
+    entities = partition.getAllEntities(mat_a, mat_b)
+
+    # The pixels may lie on the curves, so the values are compared, not the entities.
+    values = _compute_values(performances, mat_a, mat_b)
+    sorted_values = np.take_along_axis(values, entities - 1, axis=0)
+    assert entities.shape == (6, 101, 101)
+    assert np.all(np.diff(sorted_values, axis=0) <= 1e-12)
+
+
+def test_cells():
+    performances = _get_performances()
+    partition = PartitionIntoRankingCells(performances)
+    cells = partition.getCells(num_points=8)
+
+    assert len(cells) == partition.num_cells
+    for cell_id, (polygon, entities) in enumerate(cells):
+        assert polygon.shape == (16, 2)
+        # The centroid of the vertices lies in the cell, as the cells are convex
+        # along the vertical direction.
+        a, b = 0.5 * (polygon[0] + polygon[-1])
+        if polygon[-1, 1] - polygon[0, 1] > 1e-6:
+            assert partition.getCellIds(a, b) == cell_id
+            assert np.array_equal(partition.getAllEntities(a, b) - 1, entities)
+
+
+def test_number_of_cells_is_bounded():
+    performances = _get_performances()
+    num_cells = PartitionIntoRankingCells(performances).num_cells
+
+    with pytest.raises(ValueError):
+        PartitionIntoRankingCells(performances, max_cells=num_cells - 1)
+    partition = PartitionIntoRankingCells(performances, max_cells=num_cells)
+    assert partition.num_cells == num_cells
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+
+
+def _get_performances():
+    return np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+            (0.25, 0.25, 0.25, 0.25),
+        ]
+    )
+
+
+def _compute_reference(importance, performances):
+    itn, ifp, ifn, itp = (importance[..., k] for k in range(4))
+    ptn, pfp, pfn, ptp = (performances[:, k, None, None] for k in range(4))
+    satisfying = ptn * itn + ptp * itp
+    unsatisfying = pfp * ifp + pfn * ifn
+    return satisfying / (satisfying + unsatisfying)
+
+
+def test_compute_on_separable_grid():
+    performances = _get_performances()
+    vec_a = np.linspace(0.0, 1.0, 11)
+    vec_b = np.linspace(0.0, 1.0, 7)
+    mat_a, mat_b = np.meshgrid(vec_a, vec_b, indexing="xy")
+    importance = ParameterizationDefault().getCanonicalImportanceVectorized(
+        mat_a, mat_b
+    )
+
+    for grid in (importance, np.swapaxes(importance, 0, 1)):
+        prepared = RankingScore._prepareImportance(grid)
+        assert all(np.size(array) < grid.shape[0] * grid.shape[1] for array in prepared)
+        values = RankingScore._compute(importance=prepared, performance=performances)
+        expected = _compute_reference(grid, performances)
+
+        assert values.shape == expected.shape
+        assert np.array_equal(values, expected, equal_nan=True)
+
+
+def test_compute_on_non_separable_grid():
+    performances = _get_performances()
+    rng = np.random.default_rng(0)
+    importance = rng.uniform(size=(5, 6, 4))
+
+    values = RankingScore._compute(importance=importance, performance=performances)
+
+    assert np.array_equal(values, _compute_reference(importance, performances))
+
+
+def test_compute_into_buffers():
+    performances = _get_performances()
+    rng = np.random.default_rng(0)
+    importance = rng.uniform(size=(5, 6, 4))
+    expected = _compute_reference(importance, performances)
+
+    out = np.empty(expected.shape)
+    work = np.empty((2,) + expected.shape)
+    values = RankingScore._compute(
+        importance=importance, performance=performances, out=out, work=work
+    )
+    assert values is out
+    assert np.array_equal(out, expected)
+
+    values = RankingScore._compute(
+        importance=importance, performance=performances, dtype=np.float32
+    )
+    assert values.dtype == np.float32
+    assert np.allclose(values, expected, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        RankingScore._compute(
+            importance=importance, performance=performances, out=np.empty((2, 3))
+        )
+
+
+def test_equivalent_pairwise():
+    rng = np.random.default_rng(0)
+    performances = FiniteSetOfTwoClassClassificationPerformances(
+        rng.dirichlet(np.ones(4), size=5)
+    )
+
+    curves = RankingScore.equivalentPairwise(performances)
+
+    assert len(curves) == 10
+    i, j = np.triu_indices(5, k=1)
+    for index in range(len(curves)):
+        expected = RankingScore.equivalent(
+            performances[int(i[index])], performances[int(j[index])]
+        )
+        curve = curves[index]
+        assert np.allclose(
+            [curve.b, curve.d, curve.e, curve.f],
+            [expected.b, expected.d, expected.e, expected.f],
+        )
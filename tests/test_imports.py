@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from pathlib import Path
+
+_NUMERIC_CORE = [
+    "sorbetto.core",
+    "sorbetto.flavor",
+    "sorbetto.geometry",
+    "sorbetto.parameterization",
+    "sorbetto.performance",
+    "sorbetto.performance.distribution",
+    "sorbetto.ranking",
+]
+
+_HEAVY_LIBRARIES = ["jax", "matplotlib", "mpl_toolkits", "scipy"]
+
+
+def _check_imports(modules):
+    # A fresh interpreter is needed, as other tests import these libraries. The
+    # assertion on `sys.modules` is made in it.
+    code = "\n".join(
+        ["import sys"]
+        + [f"import {module}" for module in modules]
+        + [
+            f"loaded = [m for m in {_HEAVY_LIBRARIES!r} if m in sys.modules]",
+            "assert not loaded, f'imported: {loaded}'",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parents[1],
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_package_does_not_import_heavy_libraries():
+    _check_imports(["sorbetto"])
+
+
+def test_numeric_core_does_not_import_plotting_libraries():
+    _check_imports(["sorbetto"] + _NUMERIC_CORE)
@@ -0,0 +1,145 @@
+import os
+
+import numpy as np
+
+from sorbetto.core.entity import Entity
+from sorbetto.flavor.best_flavor import BestFlavor
+from sorbetto.flavor.entity_flavor import EntityFlavor
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.tile.best_tile import BestTile
+from sorbetto.tile.cache import TileCache
+from sorbetto.tile.entity_tile import EntityTile
+
+
+def _get_performances(size=10, seed=0):
+    rng = np.random.default_rng(seed)
+    return FiniteSetOfTwoClassClassificationPerformances(
+        rng.dirichlet(np.ones(4), size=size)
+    )
+
+
+def _get_entities(tile):
+    codomain = tile.flavor._getSortedCodomain()
+    return np.array([codomain[value - 1] for value in tile.mat_value.ravel()])
+
+
+def test_values_are_read_back_from_the_cache(tmp_path):
+    cache = TileCache(tmp_path)
+    performances = _get_performances()
+    tile = BestTile(
+        ParameterizationDefault(),
+        BestFlavor(performances, []),
+        resolution=21,
+        cache=cache,
+    )
+    expected = tile.mat_value
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    # Another Tile with the same content finds the values in the cache.
+    copy = FiniteSetOfTwoClassClassificationPerformances(performances.to_array().copy())
+    tile = BestTile(
+        ParameterizationDefault(), BestFlavor(copy, []), resolution=21, cache=cache
+    )
+    assert isinstance(tile.mat_value, np.memmap)
+    assert np.array_equal(tile.mat_value, expected)
+
+    # But not a Tile whose resolution or performances differ.
+    tile.resolution = 11
+    assert not isinstance(tile.mat_value, np.memmap)
+    copy.append(performances[0])
+    assert not isinstance(tile.mat_value, np.memmap)
+    assert len(list(tmp_path.glob("*.npy"))) == 3
+
+
+def test_zoomed_values_are_cached_for_their_grid(tmp_path):
+    cache = TileCache(tmp_path)
+    performances = _get_performances()
+    zoom = (0.25, 0.75, 0.0, 0.5)
+
+    tile = BestTile(
+        ParameterizationDefault(), BestFlavor(performances, []), resolution=21
+    )
+    tile.cache = cache
+    tile.zoom = zoom
+    zoomed = np.array(tile.mat_value)
+
+    param1, param2 = np.meshgrid(
+        np.linspace(0.25, 0.75, 21), np.linspace(0.0, 0.5, 21), indexing="xy"
+    )
+    assert np.array_equal(zoomed, tile(param1, param2))
+
+    tile = BestTile(
+        ParameterizationDefault(), BestFlavor(performances, []), resolution=11
+    )
+    tile.cache = cache
+    tile.zoom = zoom
+    tile.resolution = 21
+    assert isinstance(tile.mat_value, np.memmap)
+    assert np.array_equal(tile.mat_value, zoomed)
+
+
+def test_entity_tile_with_cache(tmp_path):
+    entities = [Entity(p) for p in _get_performances()]
+    cache = TileCache(tmp_path)
+    tile = EntityTile(
+        ParameterizationDefault(), EntityFlavor(2, entities), resolution=21
+    )
+    tile.cache = cache
+    expected = tile.mat_value
+
+    flavor = EntityFlavor(2, entities)
+    flavor._sorted_codomain = tile.flavor._getSortedCodomain()
+    tile = EntityTile(ParameterizationDefault(), flavor, resolution=21)
+    tile.cache = cache
+    assert isinstance(tile.mat_value, np.memmap)
+    assert np.array_equal(tile.mat_value, expected)
+
+    # The cached values are updated when entities are added.
+    new_entity = Entity(_get_performances(1, seed=1)[0])
+    flavor.addEntity(new_entity)
+    expected = EntityTile(
+        ParameterizationDefault(),
+        EntityFlavor(2, entities + [new_entity]),
+        resolution=21,
+    )
+    assert np.array_equal(_get_entities(tile), _get_entities(expected))
+
+
+def test_least_recently_used_values_are_evicted(tmp_path):
+    cache = TileCache(tmp_path, max_size=3 * (8 * 100 + 128))
+    for index in range(3):
+        cache.save(index, np.full(100, float(index)))
+        os.utime(cache.getPath(index), (index, index))
+    cache.load(0)  # 1 is now the least recently used
+
+    cache.save(3, np.full(100, 3.0))
+
+    assert cache.getSize() <= cache.max_size
+    assert cache.load(1) is None
+    for index in (0, 2, 3):
+        assert np.array_equal(cache.load(index), np.full(100, float(index)))
+
+
+def test_hash_of_keys():
+    key = (1, 2.0, "a", None, np.arange(3))
+    assert TileCache.hashKey(key) == TileCache.hashKey(key)
+    assert TileCache.hashKey((1,)) != TileCache.hashKey((1.0,))
+    assert TileCache.hashKey(np.arange(3)) != TileCache.hashKey(np.arange(3.0))
+
+
+def test_key_of_entity_flavor_does_not_depend_on_the_objects():
+    array = _get_performances().to_array()
+
+    def get_key():
+        # The entities have the same name, and are given in a set.
+        performances = FiniteSetOfTwoClassClassificationPerformances(array)
+        return TileCache.hashKey(
+            EntityFlavor(2, {Entity(p) for p in performances}).getCacheKey()
+        )
+
+    key = get_key()
+    for _ in range(10):
+        assert get_key() == key
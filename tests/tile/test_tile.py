@@ -0,0 +1,339 @@
+import numpy as np
+
+from sorbetto.core.entity import Entity
+from sorbetto.flavor.best_flavor import BestFlavor
+from sorbetto.flavor.entity_flavor import EntityFlavor
+from sorbetto.flavor.ranking_flavor import RankingFlavor
+from sorbetto.flavor.value_flavor import ValueFlavor
+from sorbetto.parameterization.parameterization_default import ParameterizationDefault
+from sorbetto.performance.finite_set_of_two_class_classification_performances import (
+    FiniteSetOfTwoClassClassificationPerformances,
+)
+from sorbetto.ranking.ranking_score import RankingScore
+from sorbetto.tile.best_tile import BestTile
+from sorbetto.tile.entity_tile import EntityTile
+from sorbetto.tile.ranking_tile import RankingTile
+from sorbetto.tile.value_tile import ValueTile
+
+
+def _get_entities():
+    array = np.array(
+        [
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.055, 0.045, 0.60),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+        ]
+    )
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+    return [Entity(p, name=f"entity {i}") for i, p in enumerate(performances)]
+
+
+def _get_tied_entities():
+    array = np.array(
+        [
+            (0.00, 0.00, 0.40, 0.60),  # undefined scores on the side ifn = 0
+            (0.50, 0.50, 0.00, 0.00),  # undefined scores on the side itn = 0
+            (0.00, 0.30, 0.00, 0.70),
+            (0.40, 0.045, 0.055, 0.50),
+            (0.30, 0.16, 0.14, 0.40),
+            (0.70, 0.05, 0.10, 0.15),
+        ]
+    )
+    array = np.concatenate([array, array])  # each entity has an equivalent one
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+    return [Entity(p, name=f"entity {i:02d}") for i, p in enumerate(performances)]
+
+
+def test_chunked_evaluation_entity_tile():
+    entities = _get_entities()
+    parameterization = ParameterizationDefault()
+
+    tile = EntityTile(parameterization, EntityFlavor(1, entities), resolution=51)
+    chunked_tile = EntityTile(
+        parameterization, EntityFlavor(1, entities), resolution=51, chunk_size=8
+    )
+
+    assert np.array_equal(tile.mat_value, chunked_tile.mat_value)
+
+
+def test_chunked_evaluation_best_tile():
+    entities = _get_entities()
+    performances = FiniteSetOfTwoClassClassificationPerformances(
+        [e.performance for e in entities]
+    )
+    parameterization = ParameterizationDefault()
+
+    tile = BestTile(parameterization, BestFlavor(performances, entities), resolution=51)
+    chunked_tile = BestTile(
+        parameterization,
+        BestFlavor(performances, entities),
+        resolution=51,
+        chunk_size=10,
+    )
+
+    assert chunked_tile.mat_value.shape == (51, 51)
+    assert np.allclose(tile.mat_value, chunked_tile.mat_value, equal_nan=True)
+
+
+def test_parallel_evaluation_entity_tile():
+    entities = _get_entities()
+    parameterization = ParameterizationDefault()
+
+    tile = EntityTile(parameterization, EntityFlavor(2, entities), resolution=51)
+    parallel_tile = EntityTile(
+        parameterization,
+        EntityFlavor(2, entities),
+        resolution=51,
+        chunk_size=5,
+        n_jobs=3,
+    )
+
+    assert np.array_equal(tile.mat_value, parallel_tile.mat_value)
+
+
+def test_ranking_tiles_for_all_entities():
+    entities = _get_entities()
+    parameterization = ParameterizationDefault()
+
+    tiles = RankingTile.getForAllEntities(
+        parameterization, entities, resolution=51, chunk_size=20
+    )
+
+    assert len(tiles) == len(entities)
+    for entity, tile in zip(entities, tiles):
+        expected = RankingTile(
+            parameterization, RankingFlavor(entity, entities), resolution=51
+        )
+        assert np.array_equal(tile.mat_value, expected.mat_value)
+
+
+def test_entity_tiles_for_all_ranks():
+    entities = _get_entities()
+    parameterization = ParameterizationDefault()
+
+    tiles = EntityTile.getForAllRanks(parameterization, entities, resolution=51)
+
+    assert len(tiles) == len(entities)
+    for rank, tile in enumerate(tiles, start=1):
+        expected = EntityTile(
+            parameterization, EntityFlavor(rank, entities), resolution=51
+        )
+        assert np.array_equal(tile.mat_value, expected.mat_value)
+
+
+def test_tiles_for_all_ranks_and_entities_with_ties():
+    entities = _get_tied_entities()
+    parameterization = ParameterizationDefault()
+
+    entity_tiles = EntityTile.getForAllRanks(parameterization, entities, resolution=21)
+    for rank, tile in enumerate(entity_tiles, start=1):
+        expected = EntityTile(
+            parameterization, EntityFlavor(rank, entities), resolution=21
+        )
+        assert np.array_equal(tile.mat_value, expected.mat_value)
+
+    for tie_policy in ("min", "max", "average"):
+        ranking_tiles = RankingTile.getForAllEntities(
+            parameterization, entities, resolution=21, tie_policy=tie_policy
+        )
+        for entity, tile in zip(entities, ranking_tiles):
+            flavor = RankingFlavor(entity, entities, tie_policy=tie_policy)
+            expected = RankingTile(parameterization, flavor, resolution=21)
+            assert np.array_equal(tile.mat_value, expected.mat_value)
+
+
+def test_argmin_argmax_value_tile():
+    entities = _get_entities()
+    parameterization = ParameterizationDefault()
+    tile = ValueTile(parameterization, ValueFlavor(entities[0].performance))
+
+    x, y, value = tile.argmin(num_starts=3)
+    assert value <= tile.min + 1e-12
+    assert np.isclose(tile([x], [y])[0], value)
+
+    x, y, value = tile.argmax(num_starts=3)
+    assert value >= tile.max - 1e-12
+    assert np.isclose(tile([x], [y])[0], value)
+
+
+def test_tile_is_updated_when_performances_are_added():
+    entities = _get_entities()
+    performances = FiniteSetOfTwoClassClassificationPerformances(
+        [e.performance for e in entities[:2]]
+    )
+    tile = BestTile(
+        ParameterizationDefault(), BestFlavor(performances, []), resolution=21
+    )
+    before = tile.mat_value.copy()
+
+    performances.extend([e.performance for e in entities[2:]])
+
+    expected = BestTile(
+        ParameterizationDefault(),
+        BestFlavor(
+            FiniteSetOfTwoClassClassificationPerformances(
+                [e.performance for e in entities]
+            ),
+            [],
+        ),
+        resolution=21,
+    )
+    assert not np.array_equal(tile.mat_value, before)
+    assert np.array_equal(tile.mat_value, expected.mat_value)
+
+
+def test_tiles_are_updated_when_entities_are_added():
+    rng = np.random.default_rng(0)
+    array = rng.dirichlet(np.ones(4), size=15)
+    performances = FiniteSetOfTwoClassClassificationPerformances(array)
+    entities = [Entity(p, name=f"entity {i}") for i, p in enumerate(performances)]
+    parameterization = ParameterizationDefault()
+
+    entity_tiles = [
+        EntityTile(parameterization, EntityFlavor(rank, entities[:10]), resolution=31)
+        for rank in (1, 3, 10)
+    ]
+    entity_tiles[1].chunk_size = 7  # the updates are evaluated band by band
+    entity_tiles[2].chunk_size = 7
+    entity_tiles[2].n_jobs = 2
+    ranking_tiles = [
+        RankingTile(
+            parameterization,
+            RankingFlavor(entities[4], entities[:10], tie_policy=tie_policy),
+            resolution=31,
+        )
+        for tie_policy in ("min", "max", "average")
+    ]
+    best_performances = FiniteSetOfTwoClassClassificationPerformances(array[:10])
+    best_tile = BestTile(
+        parameterization, BestFlavor(best_performances, []), resolution=31
+    )
+
+    for num in range(10, 15):
+        for tile in entity_tiles:
+            expected = EntityTile(
+                parameterization,
+                EntityFlavor(tile.rank, entities[:num]),
+                resolution=31,
+            )
+            assert np.array_equal(tile.mat_value, expected.mat_value)
+        for tile in ranking_tiles:
+            expected = RankingTile(
+                parameterization,
+                RankingFlavor(
+                    entities[4], entities[:num], tie_policy=tile.flavor.tie_policy
+                ),
+                resolution=31,
+            )
+            assert np.array_equal(tile.mat_value, expected.mat_value)
+        expected = BestTile(
+            parameterization,
+            BestFlavor(FiniteSetOfTwoClassClassificationPerformances(array[:num]), []),
+            resolution=31,
+        )
+        assert np.array_equal(best_tile.mat_value, expected.mat_value)
+
+        for tile in entity_tiles + ranking_tiles:
+            tile.flavor.addEntity(entities[num])
+        best_performances.append(performances[num])
+
+
+def test_flavor_is_prepared_before_parallel_evaluation():
+    class RecordingEntityFlavor(EntityFlavor):
+        prepared = False
+        prepared_at_calls: list[bool] = list()
+
+        def prepare(self) -> None:
+            super().prepare()
+            self.prepared = True
+
+        def __call__(self, importance):
+            self.prepared_at_calls.append(self.prepared)
+            return super().__call__(importance)
+
+    entities = _get_entities()
+    parameterization = ParameterizationDefault()
+    flavor = RecordingEntityFlavor(2, entities)
+    tile = EntityTile(parameterization, flavor, resolution=51)
+    tile.n_jobs = 3
+    tile.chunk_size = 5
+
+    expected = EntityTile(parameterization, EntityFlavor(2, entities), resolution=51)
+    assert np.array_equal(tile.mat_value, expected.mat_value)
+    assert len(flavor.prepared_at_calls) == 11
+    assert all(flavor.prepared_at_calls)
+
+
+def test_extrema_follow_the_added_entities():
+    rng = np.random.default_rng(0)
+    performances = FiniteSetOfTwoClassClassificationPerformances(
+        rng.dirichlet(np.ones(4), size=8)
+    )
+    entities = [Entity(p, name=f"entity {i}") for i, p in enumerate(performances)]
+    parameterization = ParameterizationDefault()
+    ranking_tile = RankingTile(
+        parameterization, RankingFlavor(entities[0], entities[:4]), resolution=21
+    )
+    best_performances = FiniteSetOfTwoClassClassificationPerformances(
+        performances.to_array()[:4]
+    )
+    best_tile = BestTile(
+        parameterization, BestFlavor(best_performances, []), resolution=21
+    )
+    assert ranking_tile.max <= 4
+    best_min = best_tile.min
+
+    for entity in entities[4:]:
+        ranking_tile.flavor.addEntity(entity)
+        best_performances.append(entity.performance)
+
+    assert ranking_tile.max == np.max(ranking_tile.mat_value)
+    assert ranking_tile.min == np.min(ranking_tile.mat_value)
+    assert best_tile.min == np.min(best_tile.mat_value)
+    assert best_tile.min >= best_min
+
+
+def test_colormaps_follow_the_added_entities():
+    entities = [
+        Entity(e.performance, name=e.name, color=color)
+        for e, color in zip(_get_entities(), ["red", "green", "blue", "black"])
+    ]
+    parameterization = ParameterizationDefault()
+    entity_tile = EntityTile(
+        parameterization, EntityFlavor(1, set(entities[:3])), resolution=21
+    )
+    ranking_tile = RankingTile(
+        parameterization, RankingFlavor(entities[0], entities[:3]), resolution=21
+    )
+    assert entity_tile.colormap.N == 3
+    assert ranking_tile.colormap.N == 3
+
+    entity_tile.flavor.addEntity(entities[3])
+    ranking_tile.flavor.addEntity(entities[3])
+
+    assert entity_tile.colormap.N == 4
+    assert list(entity_tile.colormap.colors) == ["red", "green", "blue", "black"]
+    assert ranking_tile.colormap.N == 4
+
+
+def test_importances_of_a_separable_grid_are_given_as_rows_and_columns():
+    performance = _get_entities()[0].performance
+    flavor = ValueFlavor(performance)
+    tile = ValueTile(ParameterizationDefault(), flavor, resolution=21, chunk_size=4)
+    importance = tile.parameterization.getCanonicalImportanceVectorized(
+        tile._mat_x, tile._mat_y
+    )
+    expected = RankingScore._compute(importance=importance, performance=performance)
+
+    received = []
+
+    def function(importance):
+        received.append(importance)
+        return flavor(importance)
+
+    values = tile._evaluate(function, tile._mat_x, tile._mat_y)
+
+    assert np.array_equal(values, expected)
+    assert all(isinstance(importance, tuple) for importance in received)
+    assert all(np.size(array) <= 21 for array in received[0])